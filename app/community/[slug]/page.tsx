@@ -1,16 +1,15 @@
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getCurrentUser } from "@/lib/supabase/server";
 import { notFound } from "next/navigation";
 import { PostCard } from "@/components/community/post-card";
+import { fetchPostVotes, POST_CARD_COLUMNS } from "@/lib/community";
 import { Button } from "@/components/ui/button";
 import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
 import { Avatar, AvatarFallback } from "@/components/ui/avatar";
 import { Separator } from "@/components/ui/separator";
 import { Users, MessageSquare, Plus } from "lucide-react";
 
-export default async function CommunityDetailPage({ params }: { params: { slug: string } }) {
-    const supabase = await createClient();
-    const { slug } = await params;
-    const { data: { user } } = await supabase.auth.getUser();
+export default async function CommunityDetailPage({ params }: { params: Promise<{ slug: string }> }) {
+    const [supabase, { slug }, user] = await Promise.all([createClient(), params, getCurrentUser()]);
 
     // Fetch community details
     const { data: community } = await supabase
@@ -26,10 +25,13 @@ export default async function CommunityDetailPage({ params }: { params: { slug:
     // Fetch posts for this community
     const { data: posts } = await supabase
         .from("posts")
-        .select("*, profiles(*), communities(*)")
+        .select(POST_CARD_COLUMNS)
         .eq("community_id", community.id)
         .order("created_at", { ascending: false });
 
+    // The viewer's votes on every post in the feed, in one query
+    const viewerVotes = await fetchPostVotes(supabase, user?.id, (posts ?? []).map((post) => post.id));
+
     return (
         <div className="container py-12">
             {/* Community Header */}
@@ -56,7 +58,7 @@ export default async function CommunityDetailPage({ params }: { params: { slug:
                 <div className="lg:col-span-3 space-y-6">
                     {posts && posts.length > 0 ? (
                         posts.map((post) => (
-                            <PostCard key={post.id} post={post} currentUserId={user?.id} />
+                            <PostCard key={post.id} post={post} currentUserId={user?.id} viewerVote={viewerVotes[post.id]} />
                         ))
                     ) : (
                         <div className="text-center py-20 bg-stone-50 rounded-2xl border border-dashed border-stone-200">
@@ -1,29 +1,35 @@
-import { createClient } from "@/lib/supabase/server";
-import { PostCard } from "@/components/community/post-card";
+import { createClient, getCurrentUser } from "@/lib/supabase/server";
+import { PostFeed } from "@/components/community/post-feed";
+import { fetchPostPage, fetchPostVotes, parsePostFeed } from "@/lib/community";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Separator } from "@/components/ui/separator";
 import { Plus, TrendingUp, Users } from "lucide-react";
 import Link from "next/link";
 import { Avatar, AvatarFallback } from "@/components/ui/avatar";
+import { cn } from "@/lib/utils";
 
-export default async function CommunityPage() {
-    const supabase = await createClient();
-    const { data: { user } } = await supabase.auth.getUser();
+export default async function CommunityPage({
+    searchParams,
+}: {
+    searchParams: Promise<Record<string, string | string[] | undefined>>;
+}) {
+    const [supabase, user, { sort }] = await Promise.all([createClient(), getCurrentUser(), searchParams]);
+    const feed = parsePostFeed(sort);
 
     // Fetch communities
     const { data: communities } = await supabase
         .from("communities")
-        .select("*")
+        .select("id, name, slug")
         .order("member_count", { ascending: false })
         .limit(5);
 
-    // Fetch trending posts
-    const { data: posts } = await supabase
-        .from("posts")
-        .select("*, profiles(*), communities(*)")
-        .order("upvotes", { ascending: false })
-        .limit(10);
+    // First page of the selected feed; PostFeed fetches the rest as the user scrolls
+    const { posts, nextCursor } = await fetchPostPage(supabase, feed);
+
+    // The viewer's votes on every post in the feed, in one query
+    const viewerVotes = await fetchPostVotes(supabase, user?.id, posts.map((post) => post.id));
+    const tab = (active: boolean) => cn("rounded-full", !active && "text-muted-foreground");
 
     return (
         <div className="container py-12">
@@ -33,26 +39,25 @@ export default async function CommunityPage() {
                     <div className="flex items-center justify-between">
                         <h1 className="text-3xl font-serif font-medium">Community Feed</h1>
                         <div className="flex gap-2">
-                            <Button variant="outline" className="rounded-full">
-                                <TrendingUp className="mr-2 h-4 w-4" /> Trending
+                            <Button variant={feed === "trending" ? "outline" : "ghost"} className={tab(feed === "trending")} asChild>
+                                <Link href="/community">
+                                    <TrendingUp className="mr-2 h-4 w-4" /> Trending
+                                </Link>
                             </Button>
-                            <Button variant="ghost" className="rounded-full text-muted-foreground">
-                                Newest
+                            <Button variant={feed === "newest" ? "outline" : "ghost"} className={tab(feed === "newest")} asChild>
+                                <Link href="/community?sort=newest">Newest</Link>
                             </Button>
                         </div>
                     </div>
 
-                    <div className="space-y-4">
-                        {posts && posts.length > 0 ? (
-                            posts.map((post) => (
-                                <PostCard key={post.id} post={post} currentUserId={user?.id} />
-                            ))
-                        ) : (
-                            <div className="text-center py-20 bg-stone-50 rounded-2xl border border-dashed border-stone-200">
-                                <p className="text-muted-foreground">No posts yet. Be the first to share something!</p>
-                            </div>
-                        )}
-                    </div>
+                    <PostFeed
+                        key={feed}
+                        feed={feed}
+                        initialPosts={posts}
+                        initialCursor={nextCursor}
+                        initialVotes={viewerVotes}
+                        currentUserId={user?.id}
+                    />
                 </div>
 
                 {/* Sidebar */}
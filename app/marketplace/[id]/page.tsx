@@ -1,4 +1,5 @@
 import { createClient } from "@/lib/supabase/server";
+import { GIG_DETAIL_COLUMNS } from "@/lib/marketplace";
 import { notFound } from "next/navigation";
 import { Button } from "@/components/ui/button";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
@@ -14,7 +15,7 @@ export default async function GigDetailPage({ params }: { params: { id: string }
 
     const { data: gig } = await supabase
         .from("gigs")
-        .select("*, profiles(*)")
+        .select(GIG_DETAIL_COLUMNS)
         .eq("id", id)
         .single();
 
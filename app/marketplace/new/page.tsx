@@ -1,21 +1,16 @@
 import { GigForm } from "@/components/marketplace/gig-form";
-import { createClient } from "@/lib/supabase/server";
+import { getCurrentProfile, getCurrentUser } from "@/lib/supabase/server";
 import { redirect } from "next/navigation";
 
 export default async function NewGigPage() {
-    const supabase = await createClient();
-    const { data: { user } } = await supabase.auth.getUser();
+    const user = await getCurrentUser();
 
     if (!user) {
         redirect("/login");
     }
 
     // Check if user is a freelancer
-    const { data: profile } = await supabase
-        .from("profiles")
-        .select("role")
-        .eq("id", user.id)
-        .single();
+    const profile = await getCurrentProfile();
 
     if (profile?.role !== "freelancer") {
         redirect("/marketplace");
@@ -1,30 +1,83 @@
-import { createClient } from "@/lib/supabase/server";
-import { GigCard } from "@/components/marketplace/gig-card";
+import { Suspense } from "react";
+import { createClient, getCurrentProfile } from "@/lib/supabase/server";
+import { GigGrid } from "@/components/marketplace/gig-grid";
+import { GigFilters } from "@/components/marketplace/gig-filters";
+import {
+    fetchCategoryFacets,
+    fetchGigPage,
+    gigFilterParams,
+    parseGigFilters,
+    type GigFilters as Filters,
+} from "@/lib/marketplace";
 import { Button } from "@/components/ui/button";
-import { Plus, Search, SlidersHorizontal } from "lucide-react";
+import { Skeleton } from "@/components/ui/skeleton";
+import { cn } from "@/lib/utils";
+import { Plus } from "lucide-react";
 import Link from "next/link";
-import { Input } from "@/components/ui/input";
 
-export default async function MarketplacePage() {
+// Category chips with counts for the current search and filters.
+async function CategoryFacets({ filters }: { filters: Filters }) {
     const supabase = await createClient();
+    const facets = await fetchCategoryFacets(supabase, filters);
+    const href = (category?: string) => {
+        const params = gigFilterParams({ ...filters, category }).toString();
+        return params ? `/marketplace?${params}` : "/marketplace";
+    };
+    const total = facets.reduce((sum, facet) => sum + facet.gig_count, 0);
+    const chip = "rounded-full border px-3 py-1 text-sm transition-colors";
 
-    // Fetch gigs with freelancer profiles
-    const { data: gigs } = await supabase
-        .from("gigs")
-        .select("*, profiles(*)")
-        .order("created_at", { ascending: false });
+    return (
+        <div className="flex flex-wrap gap-2">
+            <Link
+                href={href()}
+                className={cn(chip, !filters.category ? "bg-emerald-600 text-white border-emerald-600" : "hover:border-emerald-600")}
+            >
+                All ({total})
+            </Link>
+            {facets.map((facet) => (
+                <Link
+                    key={facet.category}
+                    href={href(facet.category)}
+                    className={cn(
+                        chip,
+                        filters.category === facet.category ? "bg-emerald-600 text-white border-emerald-600" : "hover:border-emerald-600"
+                    )}
+                >
+                    {facet.category} ({facet.gig_count})
+                </Link>
+            ))}
+        </div>
+    );
+}
+
+// First page of matching gigs; the grid fetches the rest as the user scrolls.
+async function GigResults({ filters }: { filters: Filters }) {
+    const supabase = await createClient();
+    const { gigs, nextCursor } = await fetchGigPage(supabase, null, filters);
+    return <GigGrid initialGigs={gigs} initialCursor={nextCursor} filters={filters} />;
+}
+
+function GigResultsSkeleton() {
+    return (
+        <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6">
+            {Array.from({ length: 8 }).map((_, i) => (
+                <Skeleton key={i} className="h-80 rounded-xl" />
+            ))}
+        </div>
+    );
+}
+
+export default async function MarketplacePage({
+    searchParams,
+}: {
+    searchParams: Promise<Record<string, string | string[] | undefined>>;
+}) {
+    const filters = parseGigFilters(await searchParams);
+    const filterKey = gigFilterParams(filters).toString();
 
     // Check if user is a freelancer to show "Post Gig" button
-    const { data: { user } } = await supabase.auth.getUser();
-    let isFreelancer = false;
-    if (user) {
-        const { data: profile } = await supabase
-            .from("profiles")
-            .select("role")
-            .eq("id", user.id)
-            .single();
-        isFreelancer = profile?.role === "freelancer";
-    }
+    const profile = await getCurrentProfile();
+    const isFreelancer = profile?.role === "freelancer";
 
     return (
         <div className="container py-12 space-y-8">
@@ -46,33 +99,15 @@ export default async function MarketplacePage() {
             </div>
 
             {/* Search & Filter Bar */}
-            <div className="flex gap-4 items-center bg-white p-2 rounded-2xl shadow-sm border border-gray-100">
-                <div className="relative flex-1">
-                    <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-gray-400" />
-                    <Input
-                        placeholder="Search services..."
-                        className="pl-10 border-none shadow-none focus-visible:ring-0 bg-transparent"
-                    />
-                </div>
-                <div className="h-8 w-px bg-gray-200" />
-                <Button variant="ghost" className="text-gray-500 hover:text-emerald-700">
-                    <SlidersHorizontal className="mr-2 h-4 w-4" /> Filters
-                </Button>
-            </div>
+            <GigFilters filters={filters} />
 
-            {/* Gigs Grid */}
-            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6">
-                {gigs && gigs.length > 0 ? (
-                    gigs.map((gig) => (
-                        <GigCard key={gig.id} gig={gig} />
-                    ))
-                ) : (
-                    <div className="col-span-full text-center py-20 text-muted-foreground">
-                        <p className="text-lg">No gigs found yet.</p>
-                        <p className="text-sm">Be the first to post a service!</p>
-                    </div>
-                )}
-            </div>
+            {/* Category Facets and Gigs Grid, streamed in once their queries finish */}
+            <Suspense key={`facets:${filterKey}`} fallback={<Skeleton className="h-8 w-2/3 rounded-full" />}>
+                <CategoryFacets filters={filters} />
+            </Suspense>
+            <Suspense key={`gigs:${filterKey}`} fallback={<GigResultsSkeleton />}>
+                <GigResults filters={filters} />
+            </Suspense>
         </div>
     );
 }
@@ -2,6 +2,7 @@
 
 import { useState, useEffect } from "react";
 import { createClient } from "@/lib/supabase";
+import { PROFILE_COLUMNS } from "@/lib/profiles";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle, CardFooter } from "@/components/ui/card";
 import { Input } from "@/components/ui/input";
@@ -32,7 +33,7 @@ export default function OnboardingPage() {
 
             const { data: profile } = await supabase
                 .from("profiles")
-                .select("*")
+                .select(PROFILE_COLUMNS)
                 .eq("id", user.id)
                 .single();
 
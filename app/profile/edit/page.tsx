@@ -1,22 +1,15 @@
-import { createClient } from "@/lib/supabase/server";
+import { getCurrentProfile, getCurrentUser } from "@/lib/supabase/server";
 import { ProfileForm } from "@/components/profile/profile-form";
 import { redirect } from "next/navigation";
 
 export default async function EditProfilePage() {
-    const supabase = await createClient();
-    const {
-        data: { user },
-    } = await supabase.auth.getUser();
+    const user = await getCurrentUser();
 
     if (!user) {
         redirect("/login");
     }
 
-    const { data: profile } = await supabase
-        .from("profiles")
-        .select("*")
-        .eq("id", user.id)
-        .single();
+    const profile = await getCurrentProfile();
 
     return (
         <div className="container max-w-2xl py-8">
@@ -1,4 +1,4 @@
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getCurrentProfile, getCurrentUser } from "@/lib/supabase/server";
 import { redirect } from "next/navigation";
 import { Button } from "@/components/ui/button";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
@@ -10,20 +10,18 @@ import { Globe, Calendar, Edit, Briefcase, FileText, MessageSquare } from "lucid
 import Link from "next/link";
 import { GigCard } from "@/components/marketplace/gig-card";
 import { PostCard } from "@/components/community/post-card";
+import { fetchPostVotes, POST_CARD_COLUMNS } from "@/lib/community";
+import { GIG_CARD_COLUMNS } from "@/lib/marketplace";
+import { TICKET_CARD_COLUMNS } from "@/lib/tickets";
 
 export default async function ProfilePage() {
-    const supabase = await createClient();
-    const { data: { user } } = await supabase.auth.getUser();
+    const [supabase, user] = await Promise.all([createClient(), getCurrentUser()]);
 
     if (!user) {
         redirect("/login");
     }
 
-    const { data: profile } = await supabase
-        .from("profiles")
-        .select("*")
-        .eq("id", user.id)
-        .single();
+    const profile = await getCurrentProfile();
 
     if (!profile) {
         redirect("/onboarding");
@@ -32,21 +30,24 @@ export default async function ProfilePage() {
     // Fetch User's Gigs
     const { data: gigs } = await supabase
         .from("gigs")
-        .select("*, profiles(*)")
+        .select(GIG_CARD_COLUMNS)
         .eq("freelancer_id", user.id);
 
     // Fetch User's Tickets
     const { data: tickets } = await supabase
         .from("tickets")
-        .select("*")
+        .select(TICKET_CARD_COLUMNS)
         .eq("created_by", user.id);
 
     // Fetch User's Posts
     const { data: posts } = await supabase
         .from("posts")
-        .select("*, profiles(*), communities(*)")
+        .select(POST_CARD_COLUMNS)
         .eq("author_id", user.id);
 
+    // The viewer's votes on every post in the feed, in one query
+    const viewerVotes = await fetchPostVotes(supabase, user.id, (posts ?? []).map((post) => post.id));
+
     return (
         <div className="container py-8 max-w-5xl">
             <Card className="overflow-hidden mb-8 border-none shadow-lg">
@@ -122,7 +123,7 @@ export default async function ProfilePage() {
                     {posts && posts.length > 0 ? (
                         <div className="grid gap-4">
                             {posts.map((post) => (
-                                <PostCard key={post.id} post={post} currentUserId={user.id} />
+                                <PostCard key={post.id} post={post} currentUserId={user.id} viewerVote={viewerVotes[post.id]} />
                             ))}
                         </div>
                     ) : (
@@ -177,7 +178,7 @@ export default async function ProfilePage() {
                     {posts && posts.length > 0 ? (
                         <div className="grid gap-4">
                             {posts.map((post) => (
-                                <PostCard key={post.id} post={post} currentUserId={user.id} />
+                                <PostCard key={post.id} post={post} currentUserId={user.id} viewerVote={viewerVotes[post.id]} />
                             ))}
                         </div>
                     ) : (
@@ -1,7 +1,9 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import { createClient } from "@/lib/supabase";
+import { subscribeToChanges, ticketChanges, type TicketChange } from "@/lib/realtime";
+import { fetchTicketPage, TICKET_PAGE_SIZE, type TicketCursor } from "@/lib/tickets";
 import { TicketCard } from "@/components/tickets/ticket-card";
 import { Input } from "@/components/ui/input";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
@@ -22,51 +24,55 @@ const CATEGORIES = [
 
 export default function TicketBoard() {
     const [tickets, setTickets] = useState<any[]>([]);
+    const [cursor, setCursor] = useState<TicketCursor | null>(null);
+    const [loading, setLoading] = useState(false);
     const [search, setSearch] = useState("");
     const [category, setCategory] = useState("All Categories");
     const supabase = createClient();
+    const filters = useMemo(
+        () => ({ category: category !== "All Categories" ? category : undefined, search: search || undefined }),
+        [category, search]
+    );
 
+    // How many tickets are on screen, read by the realtime listener below.
+    const shown = useRef(0);
     useEffect(() => {
-        const fetchTickets = async () => {
-            let query = supabase
-                .from("tickets")
-                .select("*")
-                .eq("status", "open")
-                .order("created_at", { ascending: false });
-
-            if (category !== "All Categories") {
-                query = query.eq("category", category);
-            }
+        shown.current = tickets.length;
+    }, [tickets]);
 
-            if (search) {
-                query = query.ilike("title", `%${search}%`);
+    useEffect(() => {
+        // Reload the first `count` tickets in one page, so a change does not drop
+        // the pages already loaded.
+        const fetchTickets = async (count: number) => {
+            try {
+                const page = await fetchTicketPage(supabase, filters, null, Math.max(count, TICKET_PAGE_SIZE));
+                setTickets(page.tickets);
+                setCursor(page.nextCursor);
+            } catch (error) {
+                console.error("Error fetching tickets:", error);
             }
-
-            const { data } = await query;
-            if (data) setTickets(data);
         };
 
-        fetchTickets();
+        fetchTickets(TICKET_PAGE_SIZE);
 
-        const channel = supabase
-            .channel("realtime-tickets")
-            .on(
-                "postgres_changes",
-                {
-                    event: "*",
-                    schema: "public",
-                    table: "tickets",
-                },
-                () => {
-                    fetchTickets();
-                }
-            )
-            .subscribe();
+        return subscribeToChanges(ticketChanges(), (payload) => {
+            if ((payload.new as TicketChange).source === "tickets") fetchTickets(shown.current);
+        });
+    }, [filters, supabase]);
 
-        return () => {
-            supabase.removeChannel(channel);
-        };
-    }, [category, search, supabase]);
+    const loadMore = async () => {
+        if (!cursor || loading) return;
+        setLoading(true);
+        try {
+            const page = await fetchTicketPage(supabase, filters, cursor);
+            setTickets((current) => [...current, ...page.tickets]);
+            setCursor(page.nextCursor);
+        } catch (error) {
+            console.error("Error fetching tickets:", error);
+        } finally {
+            setLoading(false);
+        }
+    };
 
     return (
         <div className="container mx-auto py-8 px-4">
@@ -108,6 +114,14 @@ export default function TicketBoard() {
                 ))}
             </div>
 
+            {cursor && (
+                <div className="text-center mt-8">
+                    <Button variant="outline" onClick={loadMore} disabled={loading}>
+                        {loading ? "Loading..." : "Load more tickets"}
+                    </Button>
+                </div>
+            )}
+
             {tickets.length === 0 && (
                 <div className="text-center py-12">
                     <p className="text-muted-foreground text-lg">No tickets found matching your criteria.</p>
@@ -2,6 +2,7 @@
 
 import { useEffect, useState } from "react";
 import { createClient } from "@/lib/supabase";
+import { subscribeToChanges, ticketChanges, type TicketChange } from "@/lib/realtime";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
@@ -48,25 +49,9 @@ export function BidList({ ticketId, isOwner }: BidListProps) {
 
         fetchBids();
 
-        const channel = supabase
-            .channel("realtime-bids")
-            .on(
-                "postgres_changes",
-                {
-                    event: "*",
-                    schema: "public",
-                    table: "bids",
-                    filter: `ticket_id=eq.${ticketId}`,
-                },
-                () => {
-                    fetchBids();
-                }
-            )
-            .subscribe();
-
-        return () => {
-            supabase.removeChannel(channel);
-        };
+        return subscribeToChanges(ticketChanges(ticketId), (payload) => {
+            if ((payload.new as TicketChange).source === "bids") fetchBids();
+        });
     }, [ticketId, supabase]);
 
     const handleAcceptBid = async (bidId: string) => {
@@ -12,11 +12,13 @@ import { createClient } from "@/lib/supabase";
 interface PostCardProps {
     post: any;
     currentUserId?: string;
+    // The viewer's existing vote, preloaded for the whole feed by the page.
+    viewerVote?: number;
 }
 
-export function PostCard({ post, currentUserId }: PostCardProps) {
+export function PostCard({ post, currentUserId, viewerVote = 0 }: PostCardProps) {
     const [votes, setVotes] = useState(post.upvotes || 0);
-    const [hasVoted, setHasVoted] = useState(false); // Simplified for now
+    const [hasVoted, setHasVoted] = useState(viewerVote > 0);
     const supabase = createClient();
 
     const handleVote = async () => {
@@ -27,31 +29,14 @@ export function PostCard({ post, currentUserId }: PostCardProps) {
         setVotes(newVotes);
         setHasVoted(!hasVoted);
 
-        // Actual DB update (simplified, ideally use an RPC or separate votes table logic)
-        // For this MVP, we'll just update the local state and assume the backend handles it via API or RPC
-        // But since we are client side, we should call an action or API.
-        // Let's just update the posts table directly for now if RLS allows, or use a separate votes table.
-        // The schema has a 'votes' table. We should insert/delete from there.
-
         try {
-            if (hasVoted) {
-                // Remove vote
-                await supabase
-                    .from("votes")
-                    .delete()
-                    .match({ user_id: currentUserId, post_id: post.id });
-
-                // Decrement post count
-                await supabase.rpc('decrement_upvotes', { row_id: post.id });
-            } else {
-                // Add vote
-                await supabase
-                    .from("votes")
-                    .insert({ user_id: currentUserId, post_id: post.id, value: 1 });
-
-                // Increment post count
-                await supabase.rpc('increment_upvotes', { row_id: post.id });
-            }
+            // Records the vote and adjusts posts.upvotes in one transaction; see cast_vote in supabase/schema.sql
+            const { data, error } = await supabase.rpc("cast_vote", {
+                vote_value: hasVoted ? 0 : 1,
+                target_post_id: post.id,
+            });
+            if (error) throw error;
+            setVotes(data);
         } catch (error) {
             console.error("Error voting:", error);
             // Revert
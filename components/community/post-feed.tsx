@@ -0,0 +1,85 @@
+"use client";
+
+import { useCallback, useEffect, useRef, useState } from "react";
+import { createClient } from "@/lib/supabase";
+import { fetchPostPage, fetchPostVotes, type PostCursor, type PostFeed as Feed } from "@/lib/community";
+import { PostCard } from "@/components/community/post-card";
+import { Skeleton } from "@/components/ui/skeleton";
+import { Button } from "@/components/ui/button";
+
+interface PostFeedProps {
+    feed: Feed;
+    initialPosts: any[];
+    initialCursor: PostCursor | null;
+    initialVotes: Record<string, number>;
+    currentUserId?: string;
+}
+
+export function PostFeed({ feed, initialPosts, initialCursor, initialVotes, currentUserId }: PostFeedProps) {
+    const [posts, setPosts] = useState(initialPosts);
+    const [votes, setVotes] = useState(initialVotes);
+    const [cursor, setCursor] = useState(initialCursor);
+    const [loading, setLoading] = useState(false);
+    const [failed, setFailed] = useState(false);
+    const sentinel = useRef<HTMLDivElement>(null);
+    const supabase = createClient();
+
+    const loadMore = useCallback(async () => {
+        if (!cursor || loading) return;
+        setLoading(true);
+        setFailed(false);
+        try {
+            const page = await fetchPostPage(supabase, feed, cursor);
+            const pageVotes = await fetchPostVotes(supabase, currentUserId, page.posts.map((post) => post.id));
+            setPosts((current) => [...current, ...page.posts]);
+            setVotes((current) => ({ ...current, ...pageVotes }));
+            setCursor(page.nextCursor);
+        } catch (error) {
+            console.error("Error fetching posts:", error);
+            setFailed(true);
+        } finally {
+            setLoading(false);
+        }
+    }, [cursor, loading, feed, currentUserId, supabase]);
+
+    // Fetch the next page as the sentinel below the feed scrolls into view.
+    useEffect(() => {
+        const node = sentinel.current;
+        if (!node || !cursor || failed) return;
+
+        const observer = new IntersectionObserver(
+            (entries) => {
+                if (entries[0].isIntersecting) loadMore();
+            },
+            { rootMargin: "600px" }
+        );
+        observer.observe(node);
+        return () => observer.disconnect();
+    }, [cursor, failed, loadMore]);
+
+    if (posts.length === 0) {
+        return (
+            <div className="text-center py-20 bg-stone-50 rounded-2xl border border-dashed border-stone-200">
+                <p className="text-muted-foreground">No posts yet. Be the first to share something!</p>
+            </div>
+        );
+    }
+
+    return (
+        <div className="space-y-4" data-testid="post-feed">
+            {posts.map((post) => (
+                <PostCard key={post.id} post={post} currentUserId={currentUserId} viewerVote={votes[post.id]} />
+            ))}
+            {loading && Array.from({ length: 3 }).map((_, i) => <Skeleton key={i} className="h-40 rounded-xl" />)}
+
+            {failed && (
+                <div className="text-center">
+                    <Button variant="outline" onClick={loadMore}>
+                        Couldn&apos;t load more posts. Retry
+                    </Button>
+                </div>
+            )}
+            {cursor && <div ref={sentinel} className="h-px" aria-hidden />}
+        </div>
+    );
+}
@@ -0,0 +1,146 @@
+"use client";
+
+import { useCallback, useEffect, useState, useTransition } from "react";
+import { useRouter } from "next/navigation";
+import { gigFilterParams, type GigFilters as Filters } from "@/lib/marketplace";
+import { Button } from "@/components/ui/button";
+import { Input } from "@/components/ui/input";
+import { Label } from "@/components/ui/label";
+import {
+    Select,
+    SelectContent,
+    SelectItem,
+    SelectTrigger,
+    SelectValue,
+} from "@/components/ui/select";
+import { Loader2, Search, SlidersHorizontal } from "lucide-react";
+
+const DELIVERY_OPTIONS = [1, 3, 7, 14, 30];
+
+export function GigFilters({ filters }: { filters: Filters }) {
+    const router = useRouter();
+    const [pending, startTransition] = useTransition();
+    const [query, setQuery] = useState(filters.q ?? "");
+    const [showFilters, setShowFilters] = useState(
+        filters.minPrice !== undefined || filters.maxPrice !== undefined || filters.maxDays !== undefined
+    );
+    const [minPrice, setMinPrice] = useState(filters.minPrice?.toString() ?? "");
+    const [maxPrice, setMaxPrice] = useState(filters.maxPrice?.toString() ?? "");
+    const [maxDays, setMaxDays] = useState(filters.maxDays?.toString() ?? "any");
+
+    // Filtering happens on the server: each change replaces the URL's search params.
+    const navigate = useCallback(
+        (next: Filters) => {
+            const params = gigFilterParams(next).toString();
+            startTransition(() => {
+                router.replace(params ? `/marketplace?${params}` : "/marketplace", { scroll: false });
+            });
+        },
+        [router]
+    );
+
+    useEffect(() => {
+        if (query.trim() === (filters.q ?? "")) return;
+        const debounce = setTimeout(() => navigate({ ...filters, q: query.trim() || undefined }), 300);
+        return () => clearTimeout(debounce);
+    }, [query, filters, navigate]);
+
+    const applyFilters = (e: React.FormEvent) => {
+        e.preventDefault();
+        navigate({
+            ...filters,
+            minPrice: minPrice ? Number(minPrice) : undefined,
+            maxPrice: maxPrice ? Number(maxPrice) : undefined,
+            maxDays: maxDays !== "any" ? Number(maxDays) : undefined,
+        });
+    };
+
+    const clearFilters = () => {
+        setMinPrice("");
+        setMaxPrice("");
+        setMaxDays("any");
+        navigate({ q: filters.q, category: filters.category });
+    };
+
+    return (
+        <div className="space-y-3">
+            <div className="flex gap-4 items-center bg-white p-2 rounded-2xl shadow-sm border border-gray-100">
+                <div className="relative flex-1">
+                    {pending ? (
+                        <Loader2 className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-gray-400 animate-spin" />
+                    ) : (
+                        <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-gray-400" />
+                    )}
+                    <Input
+                        value={query}
+                        onChange={(e) => setQuery(e.target.value)}
+                        placeholder="Search services..."
+                        aria-label="Search services"
+                        className="pl-10 border-none shadow-none focus-visible:ring-0 bg-transparent"
+                    />
+                </div>
+                <div className="h-8 w-px bg-gray-200" />
+                <Button
+                    variant="ghost"
+                    className="text-gray-500 hover:text-emerald-700"
+                    aria-expanded={showFilters}
+                    onClick={() => setShowFilters((show) => !show)}
+                >
+                    <SlidersHorizontal className="mr-2 h-4 w-4" /> Filters
+                </Button>
+            </div>
+
+            {showFilters && (
+                <form
+                    onSubmit={applyFilters}
+                    className="flex flex-wrap gap-4 items-end bg-white p-4 rounded-2xl shadow-sm border border-gray-100"
+                >
+                    <div className="space-y-2">
+                        <Label htmlFor="min_price">Min Price ($)</Label>
+                        <Input
+                            id="min_price"
+                            type="number"
+                            min="0"
+                            value={minPrice}
+                            onChange={(e) => setMinPrice(e.target.value)}
+                            className="w-32"
+                        />
+                    </div>
+                    <div className="space-y-2">
+                        <Label htmlFor="max_price">Max Price ($)</Label>
+                        <Input
+                            id="max_price"
+                            type="number"
+                            min="0"
+                            value={maxPrice}
+                            onChange={(e) => setMaxPrice(e.target.value)}
+                            className="w-32"
+                        />
+                    </div>
+                    <div className="space-y-2">
+                        <Label htmlFor="max_days">Delivery Time</Label>
+                        <Select value={maxDays} onValueChange={setMaxDays}>
+                            <SelectTrigger id="max_days" className="w-40">
+                                <SelectValue />
+                            </SelectTrigger>
+                            <SelectContent>
+                                <SelectItem value="any">Any time</SelectItem>
+                                {DELIVERY_OPTIONS.map((days) => (
+                                    <SelectItem key={days} value={String(days)}>
+                                        Up to {days} {days === 1 ? "day" : "days"}
+                                    </SelectItem>
+                                ))}
+                            </SelectContent>
+                        </Select>
+                    </div>
+                    <Button type="submit" className="bg-emerald-600 hover:bg-emerald-700 text-white">
+                        Apply
+                    </Button>
+                    <Button type="button" variant="ghost" onClick={clearFilters}>
+                        Clear
+                    </Button>
+                </form>
+            )}
+        </div>
+    );
+}
@@ -100,7 +100,7 @@ export function GigForm() {
                             value={formData.category}
                             onValueChange={(value) => setFormData({ ...formData, category: value })}
                         >
-                            <SelectTrigger>
+                            <SelectTrigger id="category">
                                 <SelectValue placeholder="Select a category" />
                             </SelectTrigger>
                             <SelectContent>
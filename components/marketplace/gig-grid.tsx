@@ -0,0 +1,87 @@
+"use client";
+
+import { useCallback, useEffect, useRef, useState } from "react";
+import { createClient } from "@/lib/supabase";
+import { fetchGigPage, type GigCursor, type GigFilters, type GigSummary } from "@/lib/marketplace";
+import { GigCard } from "@/components/marketplace/gig-card";
+import { Skeleton } from "@/components/ui/skeleton";
+import { Button } from "@/components/ui/button";
+
+interface GigGridProps {
+    initialGigs: GigSummary[];
+    initialCursor: GigCursor | null;
+    filters?: GigFilters;
+}
+
+export function GigGrid({ initialGigs, initialCursor, filters = {} }: GigGridProps) {
+    const [gigs, setGigs] = useState(initialGigs);
+    const [cursor, setCursor] = useState(initialCursor);
+    const [loading, setLoading] = useState(false);
+    const [failed, setFailed] = useState(false);
+    const sentinel = useRef<HTMLDivElement>(null);
+    const supabase = createClient();
+
+    const loadMore = useCallback(async () => {
+        if (!cursor || loading) return;
+        setLoading(true);
+        setFailed(false);
+        try {
+            const page = await fetchGigPage(supabase, cursor, filters);
+            setGigs((current) => [...current, ...page.gigs]);
+            setCursor(page.nextCursor);
+        } catch (error) {
+            console.error("Error fetching gigs:", error);
+            setFailed(true);
+        } finally {
+            setLoading(false);
+        }
+    }, [cursor, loading, filters, supabase]);
+
+    // Fetch the next page as the sentinel below the grid scrolls into view.
+    useEffect(() => {
+        const node = sentinel.current;
+        if (!node || !cursor || failed) return;
+
+        const observer = new IntersectionObserver(
+            (entries) => {
+                if (entries[0].isIntersecting) loadMore();
+            },
+            { rootMargin: "600px" }
+        );
+        observer.observe(node);
+        return () => observer.disconnect();
+    }, [cursor, failed, loadMore]);
+
+    if (gigs.length === 0) {
+        const filtered = Object.values(filters).some((value) => value !== undefined);
+        return (
+            <div className="text-center py-20 text-muted-foreground">
+                <p className="text-lg">{filtered ? "No gigs match your search." : "No gigs found yet."}</p>
+                <p className="text-sm">{filtered ? "Try different keywords or filters." : "Be the first to post a service!"}</p>
+            </div>
+        );
+    }
+
+    return (
+        <div className="space-y-6">
+            <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6" data-testid="gig-grid">
+                {gigs.map((gig) => (
+                    <GigCard key={gig.id} gig={gig} />
+                ))}
+                {loading &&
+                    Array.from({ length: 4 }).map((_, i) => (
+                        <Skeleton key={i} className="h-80 rounded-xl" />
+                    ))}
+            </div>
+
+            {failed && (
+                <div className="text-center">
+                    <Button variant="outline" onClick={loadMore}>
+                        Couldn&apos;t load more gigs. Retry
+                    </Button>
+                </div>
+            )}
+            {cursor && <div ref={sentinel} className="h-px" aria-hidden />}
+        </div>
+    );
+}
@@ -1,6 +1,8 @@
 "use client";
 
 import { createClient } from "@/lib/supabase";
+import { subscribeToChanges, ticketChanges, type TicketChange } from "@/lib/realtime";
+import { BID_COLUMNS } from "@/lib/tickets";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
@@ -37,42 +39,26 @@ export function BidList({ bids, isOwner, ticketId, currentUserId }: { bids: Bid[
     }, [bids]);
 
     useEffect(() => {
-        const channel = supabase
-            .channel('realtime-bids')
-            .on('postgres_changes', {
-                event: '*',
-                schema: 'public',
-                table: 'bids',
-                filter: `ticket_id=eq.${ticketId}`
-            }, async (payload) => {
-                if (payload.eventType === 'INSERT') {
-                    // Privacy Check: Only show new bid if Owner OR if it's my own bid
-                    if (!isOwner && payload.new.bidder_id !== currentUserId) {
-                        return;
-                    }
+        // Bid changes only reach the ticket owner and the bidder (see ticket_changes)
+        return subscribeToChanges(ticketChanges(ticketId), async (payload) => {
+            const change = payload.new as TicketChange;
+            if (change.source !== 'bids') return;
 
-                    const { data } = await supabase
-                        .from("bids")
-                        .select("*, profiles(*)")
-                        .eq("id", payload.new.id)
-                        .single();
-                    if (data) {
-                        setLocalBids(prev => [data, ...prev]);
-                        toast.info("New bid received!");
-                    }
-                } else if (payload.eventType === 'UPDATE') {
-                    // Privacy Check: Only update if Owner OR if it's my own bid
-                    if (!isOwner && payload.new.bidder_id !== currentUserId) {
-                        return;
-                    }
-                    setLocalBids(prev => prev.map(b => b.id === payload.new.id ? { ...b, ...payload.new } : b));
+            if (change.action === 'INSERT') {
+                const { data } = await supabase
+                    .from("bids")
+                    .select(BID_COLUMNS)
+                    .eq("id", change.row_id)
+                    .single();
+                // Privacy Check: Only show new bid if Owner OR if it's my own bid
+                if (data && (isOwner || data.bidder_id === currentUserId)) {
+                    setLocalBids(prev => [data, ...prev]);
+                    toast.info("New bid received!");
                 }
-            })
-            .subscribe();
-
-        return () => {
-            supabase.removeChannel(channel);
-        };
+            } else if (change.action === 'UPDATE') {
+                setLocalBids(prev => prev.map(b => b.id === change.row_id ? { ...b, ...change.changes } : b));
+            }
+        });
     }, [ticketId, isOwner, currentUserId]);
 
     const handleStatusUpdate = async (bidId: string, newStatus: 'accepted' | 'rejected') => {
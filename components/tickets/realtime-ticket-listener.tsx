@@ -1,33 +1,61 @@
 "use client";
 
-import { useEffect } from "react";
-import { useRouter } from "next/navigation";
-import { createClient } from "@/lib/supabase";
+import { createContext, useContext, useEffect, useState } from "react";
+import { subscribeToChanges, ticketChanges, type TicketChange } from "@/lib/realtime";
+import { format } from "date-fns";
 import { toast } from "sonner";
 
-export function RealtimeTicketListener({ ticketId }: { ticketId: string }) {
-    const router = useRouter();
-    const supabase = createClient();
+// The ticket columns the detail page renders and keeps live.
+export interface LiveTicket {
+    title: string;
+    category: string;
+    description: string;
+    budget: number;
+    deadline: string;
+    status: string;
+}
+
+const LIVE_FIELDS: (keyof LiveTicket)[] = ["title", "category", "description", "budget", "deadline", "status"];
+
+const TicketContext = createContext<LiveTicket | null>(null);
+
+export function RealtimeTicketListener({
+    ticketId,
+    ticket,
+    children,
+}: {
+    ticketId: string;
+    ticket: LiveTicket;
+    children: React.ReactNode;
+}) {
+    const [live, setLive] = useState(ticket);
 
     useEffect(() => {
-        const channel = supabase
-            .channel(`ticket-status-${ticketId}`)
-            .on('postgres_changes', {
-                event: 'UPDATE',
-                schema: 'public',
-                table: 'tickets',
-                filter: `id=eq.${ticketId}`
-            }, (payload) => {
-                // Refresh the page to show new status/details
-                router.refresh();
-                toast.info("Ticket updated!");
-            })
-            .subscribe();
-
-        return () => {
-            supabase.removeChannel(channel);
-        };
-    }, [ticketId, router]);
-
-    return null;
+        setLive(ticket);
+    }, [ticket]);
+
+    useEffect(() => {
+        return subscribeToChanges(ticketChanges(ticketId), (payload) => {
+            const change = payload.new as TicketChange;
+            if (change.source !== "tickets" || change.action !== "UPDATE") return;
+            // Patch the changed columns in place instead of re-rendering the page on the server
+            const row = change.changes as Partial<LiveTicket>;
+            const changes = Object.fromEntries(
+                LIVE_FIELDS.filter((field) => row[field] !== undefined).map((field) => [field, row[field]])
+            );
+            if (Object.keys(changes).length === 0) return;
+            setLive((prev) => ({ ...prev, ...changes }));
+            toast.info("Ticket updated!");
+        });
+    }, [ticketId]);
+
+    return <TicketContext.Provider value={live}>{children}</TicketContext.Provider>;
+}
+
+// One live ticket column, rendered inside RealtimeTicketListener.
+export function TicketField({ field }: { field: keyof LiveTicket }) {
+    const ticket = useContext(TicketContext);
+    if (!ticket) return null;
+    if (field === "deadline") return <>{format(new Date(ticket.deadline), "MMM d, yyyy")}</>;
+    return <>{ticket[field]}</>;
 }
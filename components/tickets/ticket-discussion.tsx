@@ -1,79 +1,168 @@
 "use client";
 
-import { useState, useEffect } from "react";
+import { useCallback, useState, useEffect, useRef } from "react";
 import { createClient } from "@/lib/supabase";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
 import { Button } from "@/components/ui/button";
 import { Textarea } from "@/components/ui/textarea";
 import { formatDistanceToNow } from "date-fns";
-import { Send } from "lucide-react";
+import { Loader2, Send, X } from "lucide-react";
 import { toast } from "sonner";
+import { subscribeToChanges } from "@/lib/realtime";
+import { authorProfile, rememberAuthors } from "@/lib/profile-cache";
+import type { AuthorProfile } from "@/lib/profiles";
+
+const PAGE_SIZE = 20;
+const REPLY_PAGE_SIZE = 10;
+const REPLY_PREVIEW = 3;
+const ROOT = "root";
 
 interface Comment {
     id: string;
+    parent_id: string | null;
     content: string;
     created_at: string;
     author_id: string;
-    profiles: {
-        full_name: string;
-        avatar_url: string;
-        username: string;
-    };
+    author: AuthorProfile | null;
+    reply_count: number;
+}
+
+interface Thread {
+    byId: Record<string, Comment>;
+    // Loaded child ids per parent id (ROOT for top-level comments), oldest first.
+    children: Record<string, string[]>;
+}
+
+function mergeRows(thread: Thread, rows: Comment[]): Thread {
+    const byId = { ...thread.byId };
+    const children = { ...thread.children };
+    for (const row of rows) {
+        const key = row.parent_id ?? ROOT;
+        const siblings = children[key] ?? [];
+        if (!byId[row.id]) {
+            children[key] = [...siblings, row.id];
+        }
+        byId[row.id] = row;
+    }
+    return { byId, children };
 }
 
 export function TicketDiscussion({ ticketId }: { ticketId: string }) {
-    const [comments, setComments] = useState<Comment[]>([]);
+    const [thread, setThread] = useState<Thread>({ byId: {}, children: {} });
+    const [hasMoreRoots, setHasMoreRoots] = useState(false);
+    // Mirrors hasMoreRoots for the realtime handler, which outlives renders.
+    const moreRoots = useRef(false);
+    const [loadingKey, setLoadingKey] = useState<string | null>(null);
     const [newComment, setNewComment] = useState("");
+    const [replyTo, setReplyTo] = useState<Comment | null>(null);
     const [loading, setLoading] = useState(false);
+    const scroller = useRef<HTMLDivElement>(null);
+    const sentinel = useRef<HTMLDivElement>(null);
     const supabase = createClient();
 
+    const latest = useRef(thread);
     useEffect(() => {
-        fetchComments();
-
-        const channel = supabase
-            .channel('ticket_comments')
-            .on('postgres_changes', {
-                event: 'INSERT',
-                schema: 'public',
-                table: 'ticket_comments',
-                filter: `ticket_id=eq.${ticketId}`
-            }, (payload) => {
-                // Real-time update: fetch the new comment with profile data
-                fetchNewComment(payload.new.id);
-            })
-            .subscribe();
-
-        return () => {
-            supabase.removeChannel(channel);
-        };
-    }, [ticketId]);
+        latest.current = thread;
+    }, [thread]);
 
-    const fetchComments = async () => {
-        const { data, error } = await supabase
-            .from("ticket_comments")
-            .select("*, profiles(*)")
-            .eq("ticket_id", ticketId)
-            .order("created_at", { ascending: true });
+    // One page of top-level comments (parentId null) or of replies to parentId, each
+    // with its first few replies; see ticket_comment_page in supabase/schema.sql. The
+    // cursor comes from the latest thread, read through a ref so that loadPage keeps
+    // one identity and the subscription below is not torn down on every change.
+    const loadPage = useCallback(async (parentId: string | null, current: Thread = latest.current) => {
+        const key = parentId ?? ROOT;
+        const loaded = current.children[key] ?? [];
+        const last = loaded.length > 0 ? current.byId[loaded[loaded.length - 1]] : null;
+        const pageSize = parentId ? REPLY_PAGE_SIZE : PAGE_SIZE;
 
-        if (error) console.error("Error fetching comments:", error);
-        else setComments(data || []);
-    };
+        setLoadingKey(key);
+        const { data, error } = await supabase.rpc("ticket_comment_page", {
+            target_ticket_id: ticketId,
+            parent: parentId,
+            after_created_at: last?.created_at ?? null,
+            after_id: last?.id ?? null,
+            page_size: pageSize,
+            reply_limit: REPLY_PREVIEW,
+            max_depth: parentId ? 1 : 2,
+        });
+        setLoadingKey(null);
 
-    const fetchNewComment = async (commentId: string) => {
-        const { data, error } = await supabase
-            .from("ticket_comments")
-            .select("*, profiles(*)")
-            .eq("id", commentId)
-            .single();
-
-        if (data) {
-            setComments(prev => {
-                // Avoid duplicates
-                if (prev.some(c => c.id === data.id)) return prev;
-                return [...prev, data];
-            });
+        if (error) {
+            console.error("Error fetching comments:", error);
+            return;
         }
-    };
+        const rows = (data ?? []) as Comment[];
+        rememberAuthors(rows);
+        setThread((prev) => mergeRows(prev, rows));
+        if (!parentId) {
+            moreRoots.current = rows.filter((row) => row.parent_id === null).length === pageSize;
+            setHasMoreRoots(moreRoots.current);
+        }
+    }, [ticketId, supabase]);
+
+    const insertComment = useCallback(async (row: Omit<Comment, "author" | "reply_count">) => {
+        const author = await authorProfile(supabase, row.author_id);
+        const comment: Comment = {
+            id: row.id,
+            parent_id: row.parent_id,
+            content: row.content,
+            created_at: row.created_at,
+            author_id: row.author_id,
+            author,
+            reply_count: 0,
+        };
+        setThread((prev) => {
+            // Avoid duplicates
+            if (prev.byId[comment.id]) return prev;
+            const parent = comment.parent_id ? prev.byId[comment.parent_id] : null;
+            if (comment.parent_id && !parent) return prev;
+            // Newer top-level comments arrive with the last page; appending one
+            // early would move the page cursor past the ones not yet loaded.
+            if (!comment.parent_id && moreRoots.current) return prev;
+
+            let next = prev;
+            if (parent) {
+                // Only append when the parent's replies are fully loaded; otherwise
+                // the new reply arrives with the next expand.
+                const loaded = prev.children[parent.id]?.length ?? 0;
+                next = {
+                    ...prev,
+                    byId: { ...prev.byId, [parent.id]: { ...parent, reply_count: parent.reply_count + 1 } },
+                };
+                if (loaded < parent.reply_count) return next;
+            }
+            return mergeRows(next, [comment]);
+        });
+    }, [supabase]);
+
+    useEffect(() => {
+        setThread({ byId: {}, children: {} });
+        loadPage(null, { byId: {}, children: {} });
+
+        return subscribeToChanges({
+            table: 'ticket_comments',
+            event: 'INSERT',
+            filter: `ticket_id=eq.${ticketId}`
+        }, (payload) => {
+            // The payload is the whole new row; only its author may need a lookup
+            insertComment(payload.new as Omit<Comment, "author" | "reply_count">);
+        });
+    }, [ticketId, loadPage, insertComment]);
+
+    // Load the next page of top-level comments as the end of the list scrolls into view.
+    useEffect(() => {
+        const node = sentinel.current;
+        if (!node || !hasMoreRoots || loadingKey) return;
+
+        const observer = new IntersectionObserver(
+            (entries) => {
+                if (entries[0].isIntersecting) loadPage(null);
+            },
+            { root: scroller.current, rootMargin: "400px" }
+        );
+        observer.observe(node);
+        return () => observer.disconnect();
+    }, [hasMoreRoots, loadingKey, thread, loadPage]);
 
     const handleSubmit = async (e: React.FormEvent) => {
         e.preventDefault();
@@ -93,7 +182,8 @@ export function TicketDiscussion({ ticketId }: { ticketId: string }) {
             .insert({
                 content: newComment,
                 ticket_id: ticketId,
-                author_id: user.id
+                author_id: user.id,
+                parent_id: replyTo?.id ?? null,
             });
 
         if (error) {
@@ -101,14 +191,70 @@ export function TicketDiscussion({ ticketId }: { ticketId: string }) {
             console.error(error);
         } else {
             setNewComment("");
+            setReplyTo(null);
         }
         setLoading(false);
     };
 
+    const renderComment = (comment: Comment) => {
+        const replies = thread.children[comment.id] ?? [];
+        const remaining = comment.reply_count - replies.length;
+
+        return (
+            <div key={comment.id} className="space-y-4">
+                <div className="flex gap-4 group animate-in fade-in slide-in-from-bottom-2 duration-300">
+                    <Avatar className="h-10 w-10 border-2 border-white shadow-sm shrink-0">
+                        <AvatarImage src={comment.author?.avatar_url} />
+                        <AvatarFallback className="bg-emerald-100 text-emerald-700 font-medium">
+                            {comment.author?.full_name?.charAt(0)}
+                        </AvatarFallback>
+                    </Avatar>
+                    <div className="flex-1 space-y-1.5">
+                        <div className="flex items-center gap-2">
+                            <span className="font-semibold text-sm text-gray-900">{comment.author?.full_name}</span>
+                            <span className="text-[10px] text-muted-foreground uppercase tracking-wider font-medium">
+                                {formatDistanceToNow(new Date(comment.created_at), { addSuffix: true })}
+                            </span>
+                        </div>
+                        <div className="bg-stone-50 p-4 rounded-2xl rounded-tl-none text-sm text-gray-700 shadow-sm border border-stone-100 leading-relaxed max-w-[90%]">
+                            {comment.content}
+                        </div>
+                        <button
+                            type="button"
+                            onClick={() => setReplyTo(comment)}
+                            className="text-xs font-medium text-muted-foreground hover:text-emerald-700"
+                        >
+                            Reply
+                        </button>
+                    </div>
+                </div>
+
+                {(replies.length > 0 || remaining > 0) && (
+                    <div className="ml-7 pl-6 border-l border-stone-200 space-y-4">
+                        {replies.map((id) => renderComment(thread.byId[id]))}
+                        {remaining > 0 && (
+                            <button
+                                type="button"
+                                onClick={() => loadPage(comment.id)}
+                                disabled={loadingKey === comment.id}
+                                className="text-xs font-medium text-emerald-700 hover:underline flex items-center gap-1"
+                            >
+                                {loadingKey === comment.id && <Loader2 className="h-3 w-3 animate-spin" />}
+                                View {remaining} more {remaining === 1 ? "reply" : "replies"}
+                            </button>
+                        )}
+                    </div>
+                )}
+            </div>
+        );
+    };
+
+    const roots = thread.children[ROOT] ?? [];
+
     return (
         <div className="space-y-6">
-            <div className="space-y-6 max-h-[600px] overflow-y-auto pr-4 scrollbar-thin scrollbar-thumb-stone-200 scrollbar-track-transparent">
-                {comments.length === 0 ? (
+            <div ref={scroller} data-testid="discussion" className="space-y-6 max-h-[600px] overflow-y-auto pr-4 scrollbar-thin scrollbar-thumb-stone-200 scrollbar-track-transparent">
+                {roots.length === 0 && loadingKey !== ROOT ? (
                     <div className="flex flex-col items-center justify-center py-12 text-muted-foreground bg-stone-50/50 rounded-2xl border border-dashed border-stone-200">
                         <div className="p-3 bg-white rounded-full shadow-sm mb-3">
                             <Send className="h-6 w-6 text-emerald-600" />
@@ -117,44 +263,46 @@ export function TicketDiscussion({ ticketId }: { ticketId: string }) {
                         <p className="text-sm">Be the first to ask a question!</p>
                     </div>
                 ) : (
-                    comments.map((comment) => (
-                        <div key={comment.id} className="flex gap-4 group animate-in fade-in slide-in-from-bottom-2 duration-300">
-                            <Avatar className="h-10 w-10 border-2 border-white shadow-sm shrink-0">
-                                <AvatarImage src={comment.profiles?.avatar_url} />
-                                <AvatarFallback className="bg-emerald-100 text-emerald-700 font-medium">
-                                    {comment.profiles?.full_name?.charAt(0)}
-                                </AvatarFallback>
-                            </Avatar>
-                            <div className="flex-1 space-y-1.5">
-                                <div className="flex items-center gap-2">
-                                    <span className="font-semibold text-sm text-gray-900">{comment.profiles?.full_name}</span>
-                                    <span className="text-[10px] text-muted-foreground uppercase tracking-wider font-medium">
-                                        {formatDistanceToNow(new Date(comment.created_at), { addSuffix: true })}
-                                    </span>
-                                </div>
-                                <div className="bg-stone-50 p-4 rounded-2xl rounded-tl-none text-sm text-gray-700 shadow-sm border border-stone-100 leading-relaxed max-w-[90%]">
-                                    {comment.content}
-                                </div>
-                            </div>
+                    roots.map((id) => (
+                        // Off-screen threads skip layout and paint, so a long discussion costs
+                        // about as much to render as the part of it that is visible.
+                        <div key={id} data-testid="comment-thread" className="[content-visibility:auto] [contain-intrinsic-size:auto_160px]">
+                            {renderComment(thread.byId[id])}
                         </div>
                     ))
                 )}
+                {loadingKey === ROOT && (
+                    <div className="flex justify-center py-4 text-muted-foreground">
+                        <Loader2 className="h-4 w-4 animate-spin" />
+                    </div>
+                )}
+                {hasMoreRoots && <div ref={sentinel} className="h-px" aria-hidden />}
             </div>
 
-            <form onSubmit={handleSubmit} className="flex gap-4 items-start pt-4 border-t border-border">
-                <Textarea
-                    value={newComment}
-                    onChange={(e) => setNewComment(e.target.value)}
-                    placeholder="Ask a question or discuss details..."
-                    className="min-h-[80px] bg-white"
-                />
-                <Button
-                    type="submit"
-                    disabled={loading || !newComment.trim()}
-                    className="bg-emerald-600 hover:bg-emerald-700 text-white rounded-full h-10 w-10 p-0 flex items-center justify-center shrink-0"
-                >
-                    <Send className="h-4 w-4" />
-                </Button>
+            <form onSubmit={handleSubmit} className="space-y-2 pt-4 border-t border-border">
+                {replyTo && (
+                    <div className="flex items-center gap-2 text-xs text-muted-foreground">
+                        Replying to <span className="font-medium text-gray-900">{replyTo.author?.full_name}</span>
+                        <button type="button" onClick={() => setReplyTo(null)} aria-label="Cancel reply">
+                            <X className="h-3 w-3" />
+                        </button>
+                    </div>
+                )}
+                <div className="flex gap-4 items-start">
+                    <Textarea
+                        value={newComment}
+                        onChange={(e) => setNewComment(e.target.value)}
+                        placeholder={replyTo ? "Write a reply..." : "Ask a question or discuss details..."}
+                        className="min-h-[80px] bg-white"
+                    />
+                    <Button
+                        type="submit"
+                        disabled={loading || !newComment.trim()}
+                        className="bg-emerald-600 hover:bg-emerald-700 text-white rounded-full h-10 w-10 p-0 flex items-center justify-center shrink-0"
+                    >
+                        <Send className="h-4 w-4" />
+                    </Button>
+                </div>
             </form>
         </div>
     );
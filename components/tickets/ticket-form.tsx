@@ -78,7 +78,7 @@ export function TicketForm() {
                     <div className="space-y-2">
                         <Label htmlFor="category">Category</Label>
                         <Select name="category" required>
-                            <SelectTrigger>
+                            <SelectTrigger id="category">
                                 <SelectValue placeholder="Select a category" />
                             </SelectTrigger>
                             <SelectContent>
@@ -5,6 +5,7 @@ import { useRouter } from "next/navigation";
 import { Command } from "cmdk";
 import { Search, FileText, Briefcase, User, Loader2 } from "lucide-react";
 import { createClient } from "@/lib/supabase";
+import { cachedResults, EMPTY_RESULTS, normalizeQuery, prefixPreview, searchAll, type SearchResults } from "@/lib/search";
 import { Dialog, DialogContent } from "@/components/ui/dialog";
 
 export function CommandMenu() {
@@ -12,11 +13,7 @@ export function CommandMenu() {
     const [open, setOpen] = React.useState(false);
     const [query, setQuery] = React.useState("");
     const [loading, setLoading] = React.useState(false);
-    const [results, setResults] = React.useState<{
-        tickets: any[];
-        gigs: any[];
-        users: any[];
-    }>({ tickets: [], gigs: [], users: [] });
+    const [results, setResults] = React.useState<SearchResults>(EMPTY_RESULTS);
     const supabase = createClient();
 
     React.useEffect(() => {
@@ -38,35 +35,41 @@ export function CommandMenu() {
     }, []);
 
     React.useEffect(() => {
-        if (!query) {
-            setResults({ tickets: [], gigs: [], users: [] });
+        const normalized = normalizeQuery(query);
+        if (!normalized) {
+            setResults(EMPTY_RESULTS);
+            setLoading(false);
             return;
         }
 
+        const cached = cachedResults(normalized);
+        if (cached) {
+            setResults(cached);
+            setLoading(false);
+            return;
+        }
+        const preview = prefixPreview(normalized);
+        if (preview) setResults(preview);
+
+        let cancelled = false;
         const search = async () => {
             setLoading(true);
             try {
-                const [tickets, gigs, users] = await Promise.all([
-                    supabase.from("tickets").select("id, title").ilike("title", `%${query}%`).limit(3),
-                    supabase.from("gigs").select("id, title").ilike("title", `%${query}%`).limit(3),
-                    supabase.from("profiles").select("username, full_name").ilike("full_name", `%${query}%`).limit(3),
-                ]);
-
-                setResults({
-                    tickets: tickets.data || [],
-                    gigs: gigs.data || [],
-                    users: users.data || [],
-                });
+                const found = await searchAll(supabase, normalized);
+                if (!cancelled) setResults(found);
             } catch (error) {
                 console.error("Search error:", error);
             } finally {
-                setLoading(false);
+                if (!cancelled) setLoading(false);
             }
         };
 
-        const debounce = setTimeout(search, 300);
-        return () => clearTimeout(debounce);
-    }, [query, supabase]);
+        const debounce = setTimeout(search, 150);
+        return () => {
+            cancelled = true;
+            clearTimeout(debounce);
+        };
+    }, [query]);
 
     const runCommand = React.useCallback((command: () => unknown) => {
         setOpen(false);
@@ -29,7 +29,7 @@ export async function login(formData: FormData) {
         return { error: "Invalid input" };
     }
 
-    const { error } = await supabase.auth.signInWithPassword({
+    const { data: { user }, error } = await supabase.auth.signInWithPassword({
         email: parsed.data.email,
         password: parsed.data.password,
     });
@@ -38,8 +38,7 @@ export async function login(formData: FormData) {
         return { error: error.message };
     }
 
-    // Check if user has a profile/role
-    const { data: { user } } = await supabase.auth.getUser();
+    // Check if user has a profile/role; sign-in already returned the user
     if (user) {
         const { data: profile } = await supabase
             .from("profiles")
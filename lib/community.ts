@@ -0,0 +1,91 @@
+import type { SupabaseClient } from "@supabase/supabase-js";
+import { AUTHOR } from "@/lib/profiles";
+
+// Only the columns PostCard renders.
+export const POST_CARD_COLUMNS = `id, created_at, title, content, upvotes, comment_count, ${AUTHOR}, communities(name, slug)`;
+
+// The viewer's vote on each of postIds (1 or -1; absent when not voted), in one
+// query for the whole feed instead of one per PostCard.
+export async function fetchPostVotes(
+    supabase: SupabaseClient,
+    userId: string | undefined,
+    postIds: string[]
+): Promise<Record<string, number>> {
+    if (!userId || postIds.length === 0) return {};
+
+    const { data, error } = await supabase
+        .from("votes")
+        .select("post_id, value")
+        .eq("user_id", userId)
+        .in("post_id", postIds);
+
+    if (error) {
+        console.error("Error fetching votes:", error);
+        return {};
+    }
+    return Object.fromEntries((data ?? []).map((vote) => [vote.post_id, vote.value]));
+}
+
+export const POST_PAGE_SIZE = 10;
+
+export type PostFeed = "trending" | "newest";
+
+// The column each feed sorts by, newest or highest first and then by id; see
+// "Community feeds" in supabase/schema.sql for the indexes and the score.
+const FEED_ORDER = {
+    trending: "trending_score",
+    newest: "created_at",
+} as const;
+
+// The community home page's feed from its ?sort= param; trending by default.
+export function parsePostFeed(value: string | string[] | undefined): PostFeed {
+    return value === "newest" ? "newest" : "trending";
+}
+
+export interface PostCursor {
+    // The last post's trending_score or created_at, depending on the feed.
+    value: number | string;
+    id: string;
+}
+
+export interface PostPage {
+    posts: any[];
+    nextCursor: PostCursor | null;
+}
+
+// One keyset page of a feed. As in fetchGigPage, the cursor's value is the bound the
+// index scan starts from, so the cost of a page does not grow with how far down the
+// feed it is.
+export async function fetchPostPage(
+    supabase: SupabaseClient,
+    feed: PostFeed,
+    cursor: PostCursor | null = null,
+    pageSize: number = POST_PAGE_SIZE
+): Promise<PostPage> {
+    const column = FEED_ORDER[feed];
+    let query = supabase
+        .from("posts")
+        .select(`${POST_CARD_COLUMNS}, trending_score`)
+        .order(column, { ascending: false })
+        .order("id", { ascending: false })
+        .limit(pageSize + 1);
+
+    if (cursor) {
+        // The lte bounds the scan; the or breaks ties. Quoted because timestamps and
+        // scores contain PostgREST's reserved "." and ":".
+        query = query
+            .lte(column, cursor.value)
+            .or(`${column}.lt."${cursor.value}",and(${column}.eq."${cursor.value}",id.lt.${cursor.id})`);
+    }
+
+    const { data, error } = await query;
+    if (error) throw error;
+
+    const rows = (data ?? []) as any[];
+    const posts = rows.slice(0, pageSize);
+    const last = posts[posts.length - 1];
+    return {
+        posts,
+        nextCursor: rows.length > pageSize && last ? { value: last[column], id: last.id } : null,
+    };
+}
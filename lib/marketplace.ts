@@ -0,0 +1,158 @@
+import type { SupabaseClient } from "@supabase/supabase-js";
+import { AUTHOR } from "@/lib/profiles";
+
+export const GIG_PAGE_SIZE = 24;
+
+// Only the columns GigCard renders; the full gig and profile rows stay on the detail page.
+export const GIG_CARD_COLUMNS =
+    "id, created_at, title, category, price, delivery_time, images, rating, review_count, profiles(full_name, avatar_url)";
+
+// The gig detail page: the whole gig but its search vector, and its author.
+export const GIG_DETAIL_COLUMNS =
+    `id, created_at, title, description, price, delivery_time, category, freelancer_id, images, rating, review_count, ${AUTHOR}`;
+
+export interface GigSummary {
+    id: string;
+    created_at: string;
+    title: string;
+    category: string;
+    price: number;
+    delivery_time: number;
+    images: string[] | null;
+    rating: number | null;
+    review_count: number | null;
+    profiles: { full_name: string | null; avatar_url: string | null } | null;
+}
+
+export interface GigCursor {
+    created_at: string;
+    id: string;
+}
+
+export interface GigFilters {
+    q?: string;
+    category?: string;
+    minPrice?: number;
+    maxPrice?: number;
+    maxDays?: number;
+}
+
+export interface CategoryFacet {
+    category: string;
+    gig_count: number;
+}
+
+type SearchParams = Record<string, string | string[] | undefined>;
+
+function numberParam(value: string | string[] | undefined) {
+    const n = typeof value === "string" && value !== "" ? Number(value) : NaN;
+    return Number.isFinite(n) && n >= 0 ? n : undefined;
+}
+
+// Marketplace filters from the page's search params (?q=&category=&min=&max=&days=).
+export function parseGigFilters(params: SearchParams): GigFilters {
+    const text = (key: string) => {
+        const value = params[key];
+        return typeof value === "string" && value.trim() ? value.trim() : undefined;
+    };
+    return {
+        q: text("q"),
+        category: text("category"),
+        minPrice: numberParam(params.min),
+        maxPrice: numberParam(params.max),
+        maxDays: numberParam(params.days),
+    };
+}
+
+export function gigFilterParams(filters: GigFilters) {
+    const params = new URLSearchParams();
+    if (filters.q) params.set("q", filters.q);
+    if (filters.category) params.set("category", filters.category);
+    if (filters.minPrice !== undefined) params.set("min", String(filters.minPrice));
+    if (filters.maxPrice !== undefined) params.set("max", String(filters.maxPrice));
+    if (filters.maxDays !== undefined) params.set("days", String(filters.maxDays));
+    return params;
+}
+
+// Anything but letters, digits and spaces. (A regex literal with the u flag needs an
+// ES2018 target.)
+const NOT_WORD = new RegExp("[^\\p{L}\\p{N}\\s]", "gu");
+
+// The tsquery prefix_tsquery in supabase/schema.sql builds, matching every word as
+// a prefix: "react dev" -> 'react':* & 'dev':*. Empty when the text has no words.
+function prefixTsquery(text: string) {
+    return text
+        .toLowerCase()
+        .replace(NOT_WORD, " ")
+        .split(/\s+/)
+        .filter(Boolean)
+        .map((term) => `'${term}':*`)
+        .join(" & ");
+}
+
+// Arguments for gig_category_facets in supabase/schema.sql.
+function filterArgs(filters: GigFilters) {
+    return {
+        query: filters.q ?? null,
+        min_price: filters.minPrice ?? null,
+        max_price: filters.maxPrice ?? null,
+        max_delivery_days: filters.maxDays ?? null,
+    };
+}
+
+export async function fetchCategoryFacets(supabase: SupabaseClient, filters: GigFilters = {}) {
+    const { data, error } = await supabase.rpc("gig_category_facets", filterArgs(filters));
+    if (error) throw error;
+    return (data ?? []) as CategoryFacet[];
+}
+
+export interface GigPage {
+    gigs: GigSummary[];
+    nextCursor: GigCursor | null;
+}
+
+// Keyset pagination on (created_at, id), newest first, served by gigs_created_at_id_idx
+// (or gigs_category_created_at_id_idx within a category). The scan starts at the
+// cursor rather than at the top, so unlike offset pagination the cost of a page
+// does not grow with how deep it is. Only the filters that are set are sent, so
+// each reaches Postgres as a plain condition its indexes can serve.
+export async function fetchGigPage(
+    supabase: SupabaseClient,
+    cursor: GigCursor | null = null,
+    filters: GigFilters = {},
+    pageSize: number = GIG_PAGE_SIZE
+): Promise<GigPage> {
+    let query = supabase
+        .from("gigs")
+        .select(GIG_CARD_COLUMNS)
+        .order("created_at", { ascending: false })
+        .order("id", { ascending: false })
+        .limit(pageSize + 1);
+
+    const terms = filters.q ? prefixTsquery(filters.q) : "";
+    if (terms) query = query.textSearch("search", terms, { config: "simple" });
+    if (filters.category) query = query.eq("category", filters.category);
+    if (filters.minPrice !== undefined) query = query.gte("price", filters.minPrice);
+    if (filters.maxPrice !== undefined) query = query.lte("price", filters.maxPrice);
+    if (filters.maxDays !== undefined) query = query.lte("delivery_time", filters.maxDays);
+
+    if (cursor) {
+        // The lte is the bound the index scan starts from; the or only breaks ties on
+        // created_at. Values are quoted because timestamps contain PostgREST's reserved
+        // "." and ":".
+        query = query
+            .lte("created_at", cursor.created_at)
+            .or(`created_at.lt."${cursor.created_at}",and(created_at.eq."${cursor.created_at}",id.lt.${cursor.id})`);
+    }
+
+    const { data, error } = await query;
+    if (error) throw error;
+
+    const rows = (data ?? []) as unknown as GigSummary[];
+    const gigs = rows.slice(0, pageSize);
+    const last = gigs[gigs.length - 1];
+    return {
+        gigs,
+        nextCursor: rows.length > pageSize && last ? { created_at: last.created_at, id: last.id } : null,
+    };
+}
@@ -0,0 +1,35 @@
+import type { SupabaseClient } from "@supabase/supabase-js";
+import { AUTHOR_COLUMNS, type AuthorProfile } from "@/lib/profiles";
+
+// Author data by profile id, shared by every realtime subscriber in the tab. Most
+// realtime rows are written by someone whose comments are already on screen, so
+// their author is known without another query.
+const cache = new Map<string, Promise<AuthorProfile | null>>();
+
+// Record authors that arrived embedded in rows loaded some other way.
+export function rememberAuthors(rows: { author_id: string; author: AuthorProfile | null }[]) {
+    for (const row of rows) {
+        if (row.author && !cache.has(row.author_id)) {
+            cache.set(row.author_id, Promise.resolve(row.author));
+        }
+    }
+}
+
+// The author for a profile id, fetched at most once per id. Concurrent callers share
+// the in-flight request; a failed fetch is forgotten so the next event can retry.
+export function authorProfile(supabase: SupabaseClient, id: string): Promise<AuthorProfile | null> {
+    let profile = cache.get(id);
+    if (!profile) {
+        profile = Promise.resolve(
+            supabase.from("profiles").select(AUTHOR_COLUMNS).eq("id", id).maybeSingle()
+        ).then(({ data, error }) => {
+            if (error) {
+                cache.delete(id);
+                return null;
+            }
+            return data as AuthorProfile | null;
+        });
+        cache.set(id, profile);
+    }
+    return profile;
+}
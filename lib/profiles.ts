@@ -0,0 +1,14 @@
+// The profile fields a card or comment shows next to its author. Embed them as
+// AUTHOR rather than profiles(*), which also ships bio, website, skills and
+// the search vector for every row.
+export interface AuthorProfile {
+    full_name: string;
+    avatar_url: string;
+    username: string;
+}
+
+export const AUTHOR_COLUMNS = "full_name, avatar_url, username";
+export const AUTHOR = `profiles(${AUTHOR_COLUMNS})`;
+
+// The signed-in user's own profile: every column but the search vector.
+export const PROFILE_COLUMNS = "id, updated_at, username, full_name, avatar_url, website, bio, role, skills";
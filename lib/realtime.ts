@@ -0,0 +1,186 @@
+import type { RealtimeChannel, RealtimePostgresChangesPayload } from "@supabase/supabase-js";
+import { createClient } from "@/lib/supabase";
+
+export type ChangeEvent = "INSERT" | "UPDATE" | "DELETE" | "*";
+
+export interface ChangeFilter {
+    table: string;
+    event?: ChangeEvent;
+    // A postgres_changes filter such as `ticket_id=eq.${id}`.
+    filter?: string;
+}
+
+export type ChangePayload = RealtimePostgresChangesPayload<{ [key: string]: any }>;
+type Listener = (payload: ChangePayload) => void;
+
+// A row of ticket_changes (supabase/schema.sql): one insert, update or delete of a
+// ticket or bid, with only the columns an update changed.
+export interface TicketChange {
+    id: number;
+    ticket_id: string;
+    source: "tickets" | "bids";
+    row_id: string;
+    action: "INSERT" | "UPDATE" | "DELETE";
+    changes: { [key: string]: any };
+}
+
+// Changes to one ticket and its bids, or to every ticket the viewer may see.
+export function ticketChanges(ticketId?: string): ChangeFilter {
+    return { table: "ticket_changes", event: "INSERT", filter: ticketId ? `ticket_id=eq.${ticketId}` : undefined };
+}
+
+export interface RealtimeMetrics {
+    channels: number;
+    // Channels the server has confirmed; the others are joining or rejoining.
+    joined: number;
+    subscribers: number;
+    eventsPerSecond: number;
+    rejoins: number;
+}
+
+const BACKOFF_BASE_MS = 1000;
+const BACKOFF_MAX_MS = 30_000;
+// A channel outlives its last subscriber briefly, so a remount (or a navigation
+// between two pages that watch the same rows) keeps it instead of rejoining.
+const RELEASE_DELAY_MS = 1000;
+const RATE_WINDOW_S = 10;
+
+interface Subscription {
+    change: Required<Omit<ChangeFilter, "filter">> & { filter?: string };
+    channel: RealtimeChannel | null;
+    joined: boolean;
+    listeners: Set<Listener>;
+    attempts: number;
+    retry: ReturnType<typeof setTimeout> | null;
+    release: ReturnType<typeof setTimeout> | null;
+}
+
+// One channel per (event, table, filter), however many components listen to it. Every
+// channel rides the browser client's single socket, since createBrowserClient returns
+// the same client on every call.
+const subscriptions = new Map<string, Subscription>();
+
+// Events received per second over the last RATE_WINDOW_S seconds, as a ring.
+const eventBuckets = new Array<number>(RATE_WINDOW_S).fill(0);
+let bucketSecond = 0;
+let rejoins = 0;
+
+function advanceBuckets(second: number) {
+    if (second <= bucketSecond) return;
+    const stale = Math.min(second - bucketSecond, RATE_WINDOW_S);
+    for (let i = 1; i <= stale; i++) {
+        eventBuckets[(bucketSecond + i) % RATE_WINDOW_S] = 0;
+    }
+    bucketSecond = second;
+}
+
+function countEvent() {
+    const second = Math.floor(Date.now() / 1000);
+    advanceBuckets(second);
+    eventBuckets[second % RATE_WINDOW_S]++;
+}
+
+function topicOf({ table, event = "*", filter }: ChangeFilter) {
+    return `${event}:${table}:${filter ?? "*"}`;
+}
+
+function join(topic: string, sub: Subscription) {
+    const { table, event, filter } = sub.change;
+    sub.channel = createClient()
+        .channel(`changes:${topic}`)
+        .on("postgres_changes", { event, schema: "public", table, ...(filter ? { filter } : {}) } as any, (payload: ChangePayload) => {
+            countEvent();
+            for (const listener of sub.listeners) listener(payload);
+        })
+        .subscribe((status) => {
+            sub.joined = status === "SUBSCRIBED";
+            if (status === "SUBSCRIBED") {
+                sub.attempts = 0;
+            } else if (status === "CHANNEL_ERROR" || status === "TIMED_OUT") {
+                scheduleRejoin(topic, sub);
+            }
+        });
+}
+
+// Rejoin a failed channel after an exponential, jittered delay so that every open tab
+// does not hammer the realtime server at the same moment after an outage.
+function scheduleRejoin(topic: string, sub: Subscription) {
+    if (sub.retry || subscriptions.get(topic) !== sub) return;
+    if (sub.channel) {
+        createClient().removeChannel(sub.channel);
+        sub.channel = null;
+    }
+    const delay = Math.min(BACKOFF_MAX_MS, BACKOFF_BASE_MS * 2 ** sub.attempts) * (0.5 + Math.random() / 2);
+    sub.attempts++;
+    rejoins++;
+    sub.retry = setTimeout(() => {
+        sub.retry = null;
+        if (subscriptions.get(topic) === sub) join(topic, sub);
+    }, delay);
+}
+
+function close(topic: string, sub: Subscription) {
+    subscriptions.delete(topic);
+    if (sub.retry) clearTimeout(sub.retry);
+    if (sub.channel) createClient().removeChannel(sub.channel);
+}
+
+// Listen for row changes; returns the function that stops listening. Components
+// watching the same rows share one channel.
+export function subscribeToChanges(change: ChangeFilter, listener: Listener): () => void {
+    const topic = topicOf(change);
+    let sub = subscriptions.get(topic);
+    if (!sub) {
+        sub = {
+            change: { table: change.table, event: change.event ?? "*", filter: change.filter },
+            channel: null,
+            joined: false,
+            listeners: new Set(),
+            attempts: 0,
+            retry: null,
+            release: null,
+        };
+        subscriptions.set(topic, sub);
+        join(topic, sub);
+    }
+    if (sub.release) {
+        clearTimeout(sub.release);
+        sub.release = null;
+    }
+
+    // Wrapped so the same function can be registered twice and removed once.
+    const entry: Listener = (payload) => listener(payload);
+    const current = sub;
+    current.listeners.add(entry);
+
+    return () => {
+        current.listeners.delete(entry);
+        if (current.listeners.size > 0 || current.release) return;
+        current.release = setTimeout(() => {
+            current.release = null;
+            if (current.listeners.size === 0) close(topic, current);
+        }, RELEASE_DELAY_MS);
+    };
+}
+
+export function realtimeMetrics(): RealtimeMetrics {
+    advanceBuckets(Math.floor(Date.now() / 1000));
+    let subscribers = 0;
+    let joined = 0;
+    for (const sub of subscriptions.values()) {
+        subscribers += sub.listeners.size;
+        if (sub.joined) joined++;
+    }
+    return {
+        channels: subscriptions.size,
+        joined,
+        subscribers,
+        eventsPerSecond: eventBuckets.reduce((sum, n) => sum + n, 0) / RATE_WINDOW_S,
+        rejoins,
+    };
+}
+
+// Readable from the browser console and the E2E harness.
+if (typeof window !== "undefined") {
+    (window as any).__realtimeMetrics = realtimeMetrics;
+}
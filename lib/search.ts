@@ -0,0 +1,58 @@
+import type { SupabaseClient } from "@supabase/supabase-js";
+
+export interface SearchResults {
+    tickets: { id: string; title: string }[];
+    gigs: { id: string; title: string }[];
+    users: { username: string; full_name: string }[];
+}
+
+export const EMPTY_RESULTS: SearchResults = { tickets: [], gigs: [], users: [] };
+
+const MAX_RESULTS = 3;
+const CACHE_SIZE = 50;
+
+// Results by normalized query, most recently used last. Shared across opens of the menu.
+const cache = new Map<string, SearchResults>();
+
+export function normalizeQuery(query: string) {
+    return query.trim().toLowerCase().replace(/\s+/g, " ");
+}
+
+export function cachedResults(query: string): SearchResults | undefined {
+    const results = cache.get(query);
+    if (results) {
+        cache.delete(query);
+        cache.set(query, results);
+    }
+    return results;
+}
+
+// While a longer query is in flight, show the results of the longest cached
+// prefix that still contain every typed word, so the list narrows as you type.
+export function prefixPreview(query: string): SearchResults | undefined {
+    for (let end = query.length - 1; end > 0; end--) {
+        const results = cache.get(query.slice(0, end));
+        if (!results) continue;
+        const words = query.split(" ");
+        const matches = (text: string | null) => words.every((word) => text?.toLowerCase().includes(word));
+        return {
+            tickets: results.tickets.filter((t) => matches(t.title)),
+            gigs: results.gigs.filter((g) => matches(g.title)),
+            users: results.users.filter((u) => matches(u.full_name) || matches(u.username)),
+        };
+    }
+    return undefined;
+}
+
+// One ranked full-text query for all three groups; see search_all in supabase/schema.sql.
+export async function searchAll(supabase: SupabaseClient, query: string): Promise<SearchResults> {
+    const { data, error } = await supabase.rpc("search_all", { query, max_results: MAX_RESULTS });
+    if (error) throw error;
+
+    const results = (data as SearchResults | null) ?? EMPTY_RESULTS;
+    cache.set(query, results);
+    if (cache.size > CACHE_SIZE) {
+        cache.delete(cache.keys().next().value!);
+    }
+    return results;
+}
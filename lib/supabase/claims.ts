@@ -0,0 +1,37 @@
+import type { JwtPayload, SupabaseClient } from "@supabase/supabase-js";
+
+// How long a verified access token is trusted without checking it again.
+const VERIFY_TTL_MS = 30_000;
+const CACHE_SIZE = 1000;
+
+// Verified claims by access token, oldest first. Shared by every request the
+// server process handles.
+const verified = new Map<string, { claims: JwtPayload; until: number }>();
+
+// The signed-in user's verified JWT claims, or null. getSession reads the session
+// from the cookies and only calls the auth server to refresh a token that is about
+// to expire. getClaims then verifies the token's signature locally against the
+// project's signing keys, which auth-js fetches once and caches. (Projects still on
+// a symmetric JWT secret fall back to a getUser round trip, which the cache below
+// keeps to one per token every VERIFY_TTL_MS.)
+export async function verifiedClaims(supabase: SupabaseClient): Promise<JwtPayload | null> {
+    const {
+        data: { session },
+    } = await supabase.auth.getSession();
+    if (!session) return null;
+
+    const token = session.access_token;
+    const now = Date.now();
+    const hit = verified.get(token);
+    if (hit && hit.until > now) return hit.claims;
+    verified.delete(token);
+
+    const { data, error } = await supabase.auth.getClaims(token);
+    if (error || !data) return null;
+
+    verified.set(token, { claims: data.claims, until: Math.min(now + VERIFY_TTL_MS, data.claims.exp * 1000) });
+    if (verified.size > CACHE_SIZE) {
+        verified.delete(verified.keys().next().value!);
+    }
+    return data.claims;
+}
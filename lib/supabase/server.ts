@@ -1,13 +1,37 @@
 import { createServerClient, type CookieOptions } from "@supabase/ssr";
 import { cookies } from "next/headers";
+import { after } from "next/server";
+import { cache } from "react";
+import { PROFILE_COLUMNS } from "@/lib/profiles";
 
-export async function createClient() {
+// Set LOG_DB_ROUND_TRIPS=1 to log, after each response, how many requests the
+// server made to Supabase (PostgREST, auth and storage) while rendering it.
+const LOG_ROUND_TRIPS = !!process.env.LOG_DB_ROUND_TRIPS;
+
+function countingFetch(calls: string[]): typeof fetch {
+    return (input, init) => {
+        const url = new URL(input instanceof Request ? input.url : input.toString());
+        calls.push(`${init?.method ?? "GET"} ${url.pathname}`);
+        return fetch(input, init);
+    };
+}
+
+// One client per request: server components rendering the same request share it.
+export const createClient = cache(async () => {
     const cookieStore = await cookies();
+    const calls: string[] = [];
+
+    if (LOG_ROUND_TRIPS) {
+        after(() => {
+            console.info(`[db] ${calls.length} round trips: ${calls.join(", ")}`);
+        });
+    }
 
     return createServerClient(
         process.env.NEXT_PUBLIC_SUPABASE_URL!,
         process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
         {
+            global: LOG_ROUND_TRIPS ? { fetch: countingFetch(calls) } : undefined,
             cookies: {
                 get(name: string) {
                     return cookieStore.get(name)?.value;
@@ -33,4 +57,24 @@ export async function createClient() {
             },
         }
     );
-}
+});
+
+// The signed-in user, checked with the auth server once per request however many
+// server components ask.
+export const getCurrentUser = cache(async () => {
+    const supabase = await createClient();
+    const {
+        data: { user },
+    } = await supabase.auth.getUser();
+    return user;
+});
+
+// The signed-in user's profile row, fetched once per request; null when signed out
+// or before onboarding has created it.
+export const getCurrentProfile = cache(async () => {
+    const user = await getCurrentUser();
+    if (!user) return null;
+    const supabase = await createClient();
+    const { data: profile } = await supabase.from("profiles").select(PROFILE_COLUMNS).eq("id", user.id).maybeSingle();
+    return profile;
+});
@@ -0,0 +1,123 @@
+import type { SupabaseClient } from "@supabase/supabase-js";
+import { AUTHOR, AUTHOR_COLUMNS } from "@/lib/profiles";
+
+// Only the columns TicketCard and the profile page's ticket list render.
+export const TICKET_CARD_COLUMNS = "id, created_at, title, description, budget, deadline, category, status";
+
+// The ticket detail page: the whole ticket but its search vector, and its author.
+export const TICKET_DETAIL_COLUMNS = `${TICKET_CARD_COLUMNS}, created_by, ${AUTHOR}`;
+
+// A bid as BidList renders it, with the bidder's role for the badge.
+export const BID_COLUMNS =
+    `id, created_at, ticket_id, bidder_id, amount, delivery_days, message, status, portfolio_links, profiles(${AUTHOR_COLUMNS}, role)`;
+
+export interface TicketView {
+    ticket: any;
+    viewer: {
+        id: string | null;
+        role: string | null;
+        is_owner: boolean;
+    };
+    bid_count: number;
+    // Every bid for the owner; only the viewer's own bid for anyone else.
+    bids: any[];
+}
+
+// PostgREST's error code when the schema cache has no such function.
+const MISSING_FUNCTION = "PGRST202";
+
+// The ticket detail page's data in one round trip through get_ticket_view
+// (supabase/schema.sql). Databases without the function yet fall back to
+// fetchTicketViewParallel.
+export async function fetchTicketView(supabase: SupabaseClient, ticketId: string): Promise<TicketView | null> {
+    const { data, error } = await supabase.rpc("get_ticket_view", { target_ticket_id: ticketId });
+    if (error?.code === MISSING_FUNCTION) {
+        return fetchTicketViewParallel(supabase, ticketId);
+    }
+    if (error) throw error;
+    return data as TicketView | null;
+}
+
+// The same view from plain queries in two concurrent rounds: the ticket, its bid
+// count and the viewer first, then the viewer's role and the bids they may see.
+export async function fetchTicketViewParallel(supabase: SupabaseClient, ticketId: string): Promise<TicketView | null> {
+    const [{ data: ticket }, { count }, { data: { user } }] = await Promise.all([
+        supabase.from("tickets").select(TICKET_DETAIL_COLUMNS).eq("id", ticketId).single(),
+        supabase.from("bids").select("id", { count: "exact", head: true }).eq("ticket_id", ticketId),
+        supabase.auth.getUser(),
+    ]);
+    if (!ticket) return null;
+
+    const isOwner = !!user && user.id === ticket.created_by;
+    const bidsQuery = supabase
+        .from("bids")
+        .select(BID_COLUMNS)
+        .eq("ticket_id", ticketId)
+        .order("created_at", { ascending: false });
+
+    const [profile, { data: bids }] = await Promise.all([
+        user ? supabase.from("profiles").select("role").eq("id", user.id).single() : Promise.resolve({ data: null }),
+        isOwner ? bidsQuery : user ? bidsQuery.eq("bidder_id", user.id) : Promise.resolve({ data: [] }),
+    ]);
+
+    return {
+        ticket,
+        viewer: { id: user?.id ?? null, role: profile.data?.role ?? null, is_owner: isOwner },
+        bid_count: count ?? 0,
+        bids: bids ?? [],
+    };
+}
+
+export const TICKET_PAGE_SIZE = 24;
+
+export interface TicketCursor {
+    created_at: string;
+    id: string;
+}
+
+export interface TicketBoardFilters {
+    category?: string;
+    search?: string;
+}
+
+export interface TicketPage {
+    tickets: any[];
+    nextCursor: TicketCursor | null;
+}
+
+// One keyset page of the ticket board's open tickets, newest first, served by
+// tickets_status_created_at_idx. The cursor's created_at is the bound the index
+// scan starts from, as in fetchGigPage.
+export async function fetchTicketPage(
+    supabase: SupabaseClient,
+    filters: TicketBoardFilters = {},
+    cursor: TicketCursor | null = null,
+    pageSize: number = TICKET_PAGE_SIZE
+): Promise<TicketPage> {
+    let query = supabase
+        .from("tickets")
+        .select(TICKET_CARD_COLUMNS)
+        .eq("status", "open")
+        .order("created_at", { ascending: false })
+        .order("id", { ascending: false })
+        .limit(pageSize + 1);
+
+    if (filters.category) query = query.eq("category", filters.category);
+    if (filters.search) query = query.ilike("title", `%${filters.search}%`);
+    if (cursor) {
+        query = query
+            .lte("created_at", cursor.created_at)
+            .or(`created_at.lt."${cursor.created_at}",and(created_at.eq."${cursor.created_at}",id.lt.${cursor.id})`);
+    }
+
+    const { data, error } = await query;
+    if (error) throw error;
+
+    const rows = data ?? [];
+    const tickets = rows.slice(0, pageSize);
+    const last = tickets[tickets.length - 1];
+    return {
+        tickets,
+        nextCursor: rows.length > pageSize && last ? { created_at: last.created_at, id: last.id } : null,
+    };
+}
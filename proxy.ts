@@ -1,13 +1,53 @@
 import { createServerClient, type CookieOptions } from "@supabase/ssr";
 import { NextResponse, type NextRequest } from "next/server";
+import { verifiedClaims } from "@/lib/supabase/claims";
+
+// Routes that need a signed-in user.
+const PROTECTED_ROUTES = ["/workspace", "/profile", "/messages"];
+// Routes a signed-in user is sent away from.
+const AUTH_ROUTES = ["/login", "/signup"];
+// Routes that render the same for everyone; the proxy does no auth work for them.
+const PUBLIC_ROUTES = ["/about", "/contact", "/legal"];
+
+function matches(pathname: string, routes: string[]) {
+    return routes.some((route) => pathname.startsWith(route));
+}
+
+// The session cookie @supabase/ssr writes (sb-<project>-auth-token, possibly chunked).
+function hasSessionCookie(request: NextRequest) {
+    return request.cookies.getAll().some(({ name }) => name.startsWith("sb-") && name.includes("-auth-token"));
+}
+
+// Report the proxy's own time to the browser, for the latency benchmark (TC031).
+function timed(response: NextResponse, started: number) {
+    response.headers.set("Server-Timing", `proxy;dur=${(performance.now() - started).toFixed(1)}`);
+    return response;
+}
 
 export async function proxy(request: NextRequest) {
+    const started = performance.now();
+    const { pathname } = request.nextUrl;
     let response = NextResponse.next({
         request: {
             headers: request.headers,
         },
     });
 
+    const isProtected = matches(pathname, PROTECTED_ROUTES);
+    const isAuthRoute = matches(pathname, AUTH_ROUTES);
+
+    if (matches(pathname, PUBLIC_ROUTES)) {
+        return timed(response, started);
+    }
+
+    // No session to verify or refresh: only the redirect decision is left.
+    if (!hasSessionCookie(request)) {
+        if (isProtected) {
+            return timed(NextResponse.redirect(new URL("/login", request.url)), started);
+        }
+        return timed(response, started);
+    }
+
     try {
         const supabase = createServerClient(
             process.env.NEXT_PUBLIC_SUPABASE_URL!,
@@ -55,36 +95,31 @@ export async function proxy(request: NextRequest) {
             }
         );
 
-        const {
-            data: { user },
-        } = await supabase.auth.getUser();
+        if (!isProtected && !isAuthRoute) {
+            // Nothing to decide here; just refresh a token that is about to expire,
+            // since server components cannot write the new cookies themselves.
+            await supabase.auth.getSession();
+            return timed(response, started);
+        }
+
+        // Verified locally; no auth server round trip unless the token needs refreshing
+        const claims = await verifiedClaims(supabase);
 
         // Protected routes
-        if (
-            request.nextUrl.pathname.startsWith("/workspace") ||
-            request.nextUrl.pathname.startsWith("/profile") ||
-            request.nextUrl.pathname.startsWith("/messages")
-        ) {
-            if (!user) {
-                return NextResponse.redirect(new URL("/login", request.url));
-            }
+        if (isProtected && !claims) {
+            return timed(NextResponse.redirect(new URL("/login", request.url)), started);
         }
 
         // Auth routes (redirect to workspace if already logged in)
-        if (
-            request.nextUrl.pathname.startsWith("/login") ||
-            request.nextUrl.pathname.startsWith("/signup")
-        ) {
-            if (user) {
-                return NextResponse.redirect(new URL("/workspace", request.url));
-            }
+        if (isAuthRoute && claims) {
+            return timed(NextResponse.redirect(new URL("/workspace", request.url)), started);
         }
     } catch (e) {
         // If there is an error, just continue. The client can handle auth errors.
         console.error("Middleware error:", e);
     }
 
-    return response;
+    return timed(response, started);
 }
 
 export const config = {
@@ -1,16 +1,38 @@
 -- Enable Realtime for Ticket System Tables
--- Run this in your Supabase SQL Editor
+-- Run this in your Supabase SQL Editor (after schema.sql); safe to re-run.
 
 begin;
 
--- 1. Add tables to the supabase_realtime publication
-alter publication supabase_realtime add table ticket_comments;
-alter publication supabase_realtime add table bids;
-alter publication supabase_realtime add table tickets;
+-- 1. Publish ticket comments and the ticket_changes notifications. tickets
+-- and bids are not published: their changes reach subscribers through
+-- ticket_changes, which carries only the columns an update changed.
+do $$
+declare
+  t text;
+begin
+  foreach t in array array['ticket_comments', 'ticket_changes'] loop
+    if not exists (
+      select 1 from pg_publication_tables
+      where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = t
+    ) then
+      execute format('alter publication supabase_realtime add table public.%I', t);
+    end if;
+  end loop;
 
--- 2. Verify replication identity (usually 'default' is fine, but 'full' ensures all columns are sent)
-alter table ticket_comments replica identity full;
-alter table bids replica identity full;
-alter table tickets replica identity full;
+  foreach t in array array['tickets', 'bids'] loop
+    if exists (
+      select 1 from pg_publication_tables
+      where pubname = 'supabase_realtime' and schemaname = 'public' and tablename = t
+    ) then
+      execute format('alter publication supabase_realtime drop table public.%I', t);
+    end if;
+  end loop;
+end $$;
+
+-- 2. Default replica identity (the primary key). Subscribers only use new
+-- rows, so 'full' just wrote every old row to WAL on each update and delete.
+alter table ticket_comments replica identity default;
+alter table bids replica identity default;
+alter table tickets replica identity default;
 
 commit;
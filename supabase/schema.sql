@@ -132,6 +132,9 @@ create policy "Freelancers can update own gigs" on gigs
 create policy "Freelancers can delete own gigs" on gigs
   for delete using (auth.uid() = freelancer_id);
 
+-- Keyset pagination for the marketplace grid: order by (created_at, id) desc.
+create index gigs_created_at_id_idx on gigs (created_at desc, id desc);
+
 -- Communities Table
 create table communities (
   id uuid default gen_random_uuid() primary key,
@@ -257,3 +260,487 @@ create policy "Authors can delete own ticket comments" on ticket_comments
 -- Enhance Bids Table
 alter table bids add column if not exists attachments text[] default array[]::text[];
 alter table bids add column if not exists portfolio_links text[] default array[]::text[];
+
+-- Search (command menu)
+-- Prefix full-text matching on generated tsvector columns, with trigram word
+-- similarity as a fallback for typos and mid-word matches. The 'simple'
+-- configuration keeps words unstemmed so "develop:*" still matches "developer".
+create extension if not exists pg_trgm with schema extensions;
+
+alter table tickets add column if not exists search tsvector
+  generated always as (to_tsvector('simple', title)) stored;
+alter table gigs add column if not exists search tsvector
+  generated always as (to_tsvector('simple', title)) stored;
+alter table profiles add column if not exists search tsvector
+  generated always as (to_tsvector('simple', coalesce(full_name, '') || ' ' || coalesce(username, ''))) stored;
+
+create index if not exists tickets_search_idx on tickets using gin (search);
+create index if not exists gigs_search_idx on gigs using gin (search);
+create index if not exists profiles_search_idx on profiles using gin (search);
+create index if not exists tickets_title_trgm_idx on tickets using gin (title extensions.gin_trgm_ops);
+create index if not exists gigs_title_trgm_idx on gigs using gin (title extensions.gin_trgm_ops);
+create index if not exists profiles_full_name_trgm_idx on profiles using gin (full_name extensions.gin_trgm_ops);
+
+-- Free text to a tsquery matching every word as a prefix: "react dev" -> 'react':* & 'dev':*.
+-- Null when the text has no words.
+create or replace function public.prefix_tsquery(query text)
+returns tsquery
+language sql immutable
+as $$
+  select to_tsquery('simple', string_agg(quote_literal(term) || ':*', ' & '))
+  from unnest(regexp_split_to_array(
+    lower(trim(regexp_replace(coalesce(query, ''), '[^[:alnum:][:space:]]', ' ', 'g'))), '\s+'
+  )) as term
+  where term <> '';
+$$;
+
+-- Ranked matches for all three command menu groups in one round trip:
+-- {"tickets": [{id, title}], "gigs": [{id, title}], "users": [{username, full_name}]}
+create or replace function public.search_all(query text, max_results integer default 3)
+returns jsonb
+language sql stable
+set search_path = public, extensions
+as $$
+  with terms as (
+    select public.prefix_tsquery(query) as ts
+  ),
+  ticket_hits as (
+    select t.id, t.title,
+           coalesce(ts_rank(t.search, terms.ts), 0) + word_similarity(query, t.title) as rank
+    from tickets t, terms
+    where t.search @@ terms.ts or query <% t.title
+    order by rank desc
+    limit max_results
+  ),
+  gig_hits as (
+    select g.id, g.title,
+           coalesce(ts_rank(g.search, terms.ts), 0) + word_similarity(query, g.title) as rank
+    from gigs g, terms
+    where g.search @@ terms.ts or query <% g.title
+    order by rank desc
+    limit max_results
+  ),
+  user_hits as (
+    select p.username, p.full_name,
+           coalesce(ts_rank(p.search, terms.ts), 0) + word_similarity(query, coalesce(p.full_name, '')) as rank
+    from profiles p, terms
+    where p.search @@ terms.ts or query <% p.full_name
+    order by rank desc
+    limit max_results
+  )
+  select jsonb_build_object(
+    'tickets', coalesce((select jsonb_agg(jsonb_build_object('id', id, 'title', title) order by rank desc) from ticket_hits), '[]'::jsonb),
+    'gigs', coalesce((select jsonb_agg(jsonb_build_object('id', id, 'title', title) order by rank desc) from gig_hits), '[]'::jsonb),
+    'users', coalesce((select jsonb_agg(jsonb_build_object('username', username, 'full_name', full_name) order by rank desc) from user_hits), '[]'::jsonb)
+  );
+$$;
+
+-- Marketplace filters
+create index if not exists gigs_category_created_at_id_idx on gigs (category, created_at desc, id desc);
+create index if not exists gigs_price_idx on gigs (price);
+create index if not exists gigs_delivery_time_idx on gigs (delivery_time);
+
+-- Per-category counts for the current search and filters, in one aggregate.
+-- The category filter itself is left out so every category shows its count.
+-- Only the filters that are set become conditions, and the tsquery is
+-- computed once: a catch-all "arg is null or column op arg" could not use
+-- the indexes above. The grid itself sends its filters as plain PostgREST
+-- filters (lib/marketplace.ts).
+create or replace function public.gig_category_facets(
+  query text default null,
+  min_price numeric default null,
+  max_price numeric default null,
+  max_delivery_days integer default null
+)
+returns table (category text, gig_count bigint)
+language plpgsql stable
+as $$
+declare
+  terms tsquery := public.prefix_tsquery(gig_category_facets.query);
+  conditions text[] := array['true'];
+begin
+  if terms is not null then
+    conditions := array_append(conditions, 'g.search @@ $1');
+  end if;
+  if min_price is not null then
+    conditions := array_append(conditions, 'g.price >= $2');
+  end if;
+  if max_price is not null then
+    conditions := array_append(conditions, 'g.price <= $3');
+  end if;
+  if max_delivery_days is not null then
+    conditions := array_append(conditions, 'g.delivery_time <= $4');
+  end if;
+
+  -- Planned on each call with the actual values, like a query sent directly.
+  return query execute
+    'select g.category, count(*) from public.gigs g where ' || array_to_string(conditions, ' and ')
+    || ' group by g.category order by 2 desc, 1'
+    using terms, min_price, max_price, max_delivery_days;
+end;
+$$;
+
+-- Voting
+-- unique(user_id, post_id, comment_id) never fires because one of the two
+-- targets is always null, so one vote per user and target is enforced here.
+create unique index if not exists votes_user_post_idx on votes (user_id, post_id) where post_id is not null;
+create unique index if not exists votes_user_comment_idx on votes (user_id, comment_id) where comment_id is not null;
+
+-- Set the caller's vote on a post or comment to vote_value (1, -1, or 0 to
+-- remove it) and adjust the target's denormalized upvotes by the difference,
+-- in one transaction. Returns the new count.
+create or replace function public.cast_vote(
+  vote_value integer,
+  target_post_id uuid default null,
+  target_comment_id uuid default null
+)
+returns integer
+language plpgsql
+security definer set search_path = public
+as $$
+declare
+  voter uuid := auth.uid();
+  previous integer;
+  total integer;
+begin
+  if voter is null then
+    raise exception 'Not authenticated' using errcode = '28000';
+  end if;
+  if (target_post_id is null) = (target_comment_id is null) then
+    raise exception 'Vote on exactly one post or comment' using errcode = '22023';
+  end if;
+  if vote_value not in (-1, 0, 1) then
+    raise exception 'Vote value must be -1, 0 or 1' using errcode = '22023';
+  end if;
+
+  -- Serialize concurrent votes by the same user on the same target so the
+  -- previous value read below cannot go stale before the write.
+  perform pg_advisory_xact_lock(hashtextextended(voter::text || coalesce(target_post_id, target_comment_id)::text, 0));
+
+  select value into previous from votes
+  where user_id = voter
+    and post_id is not distinct from target_post_id
+    and comment_id is not distinct from target_comment_id;
+  previous := coalesce(previous, 0);
+
+  if vote_value = 0 then
+    delete from votes
+    where user_id = voter
+      and post_id is not distinct from target_post_id
+      and comment_id is not distinct from target_comment_id;
+  elsif previous = 0 then
+    insert into votes (user_id, post_id, comment_id, value)
+    values (voter, target_post_id, target_comment_id, vote_value);
+  else
+    update votes set value = vote_value
+    where user_id = voter
+      and post_id is not distinct from target_post_id
+      and comment_id is not distinct from target_comment_id;
+  end if;
+
+  if target_post_id is not null then
+    update posts set upvotes = coalesce(upvotes, 0) + (vote_value - previous)
+    where id = target_post_id
+    returning upvotes into total;
+  else
+    update comments set upvotes = coalesce(upvotes, 0) + (vote_value - previous)
+    where id = target_comment_id
+    returning upvotes into total;
+  end if;
+
+  if total is null then
+    raise exception 'Vote target not found' using errcode = 'P0002';
+  end if;
+  return total;
+end;
+$$;
+
+revoke execute on function public.cast_vote(integer, uuid, uuid) from public, anon;
+grant execute on function public.cast_vote(integer, uuid, uuid) to authenticated;
+
+-- Threaded comments
+-- Top-level comments page by (created_at, id) within their ticket; replies
+-- page by (created_at, id) under their parent and are counted by it.
+create index if not exists ticket_comments_top_level_idx on ticket_comments (ticket_id, created_at, id) where parent_id is null;
+create index if not exists ticket_comments_replies_idx on ticket_comments (parent_id, created_at, id) where parent_id is not null;
+
+-- One page of a ticket's discussion. With parent null the page is top-level
+-- comments; otherwise it is replies to parent. Every comment on the page
+-- comes with its first reply_limit replies, recursively up to max_depth
+-- levels below the page, and its total reply_count so the client knows what
+-- is left to expand. Pass the last row of the previous page as after_*.
+create or replace function public.ticket_comment_page(
+  target_ticket_id uuid,
+  parent uuid default null,
+  after_created_at timestamptz default null,
+  after_id uuid default null,
+  page_size integer default 20,
+  reply_limit integer default 3,
+  max_depth integer default 2
+)
+returns table (
+  id uuid,
+  parent_id uuid,
+  content text,
+  created_at timestamptz,
+  author_id uuid,
+  author jsonb,
+  depth integer,
+  reply_count bigint
+)
+language sql stable
+as $$
+  with recursive page as (
+    (
+      select c.id, c.parent_id, c.content, c.created_at, c.author_id
+      from ticket_comments c
+      where parent is null
+        and c.ticket_id = target_ticket_id
+        and c.parent_id is null
+        and (after_id is null or (c.created_at, c.id) > (after_created_at, after_id))
+      order by c.created_at, c.id
+      limit page_size
+    )
+    union all
+    (
+      select c.id, c.parent_id, c.content, c.created_at, c.author_id
+      from ticket_comments c
+      where parent is not null
+        and c.parent_id = parent
+        and (after_id is null or (c.created_at, c.id) > (after_created_at, after_id))
+      order by c.created_at, c.id
+      limit page_size
+    )
+  ),
+  thread as (
+    select page.*, 0 as depth from page
+    union all
+    select r.id, r.parent_id, r.content, r.created_at, r.author_id, t.depth + 1
+    from thread t
+    cross join lateral (
+      select c.id, c.parent_id, c.content, c.created_at, c.author_id
+      from ticket_comments c
+      where c.parent_id = t.id
+      order by c.created_at, c.id
+      limit reply_limit
+    ) r
+    where t.depth < max_depth
+  )
+  select t.id, t.parent_id, t.content, t.created_at, t.author_id,
+         jsonb_build_object('full_name', p.full_name, 'avatar_url', p.avatar_url, 'username', p.username),
+         t.depth,
+         (select count(*) from ticket_comments c where c.parent_id = t.id)
+  from thread t
+  left join profiles p on p.id = t.author_id
+  order by t.depth, t.created_at, t.id;
+$$;
+
+-- Ticket detail page
+-- Everything app/tickets/[id]/page.tsx renders, in one round trip:
+-- {"ticket": {... , "profiles": {...}}, "viewer": {"id", "role", "is_owner"},
+--  "bid_count": n, "bids": [...]}. The owner gets every bid, anyone else only
+-- their own, so the page never receives bids it would not show. Null when
+-- the ticket does not exist.
+create or replace function public.get_ticket_view(target_ticket_id uuid)
+returns jsonb
+language sql stable
+as $$
+  select jsonb_build_object(
+    'ticket', (to_jsonb(t) - 'search') || jsonb_build_object(
+      'profiles', (
+        select jsonb_build_object('full_name', p.full_name, 'avatar_url', p.avatar_url, 'username', p.username)
+        from profiles p where p.id = t.created_by
+      )
+    ),
+    'viewer', jsonb_build_object(
+      'id', auth.uid(),
+      'role', (select p.role from profiles p where p.id = auth.uid()),
+      'is_owner', coalesce(t.created_by = auth.uid(), false)
+    ),
+    'bid_count', (select count(*) from bids b where b.ticket_id = t.id),
+    'bids', coalesce((
+      select jsonb_agg(
+        to_jsonb(b) || jsonb_build_object(
+          'profiles', jsonb_build_object(
+            'full_name', bp.full_name, 'avatar_url', bp.avatar_url, 'username', bp.username, 'role', bp.role
+          )
+        )
+        order by b.created_at desc
+      )
+      from bids b
+      left join profiles bp on bp.id = b.bidder_id
+      where b.ticket_id = t.id
+        and (t.created_by = auth.uid() or b.bidder_id = auth.uid())
+    ), '[]'::jsonb)
+  )
+  from tickets t
+  where t.id = target_ticket_id;
+$$;
+
+-- Realtime change notifications
+-- Realtime subscribers of tickets and bids listen here instead of to the
+-- tables themselves (see enable_realtime.sql). Each row carries only the
+-- columns an update changed, so an edit to a bid's status does not replay
+-- its message text to every open ticket page, and the tables keep the
+-- default replica identity instead of logging every old row to WAL.
+create table if not exists ticket_changes (
+  id bigint generated always as identity primary key,
+  created_at timestamp with time zone default timezone('utc'::text, now()) not null,
+  ticket_id uuid not null,
+  source text not null check (source in ('tickets', 'bids')),
+  row_id uuid not null,
+  action text not null check (action in ('INSERT', 'UPDATE', 'DELETE')),
+  -- Who may receive the change; null for everyone. Bid changes go only to the
+  -- ticket owner and the bidder, as the offers tab shows them.
+  audience uuid[],
+  changes jsonb not null default '{}'::jsonb
+);
+
+create index if not exists ticket_changes_created_at_idx on ticket_changes (created_at);
+
+alter table ticket_changes enable row level security;
+
+create policy "Ticket changes are visible to their audience" on ticket_changes
+  for select using (audience is null or auth.uid() = any (audience));
+
+create or replace function public.publish_ticket_change()
+returns trigger
+language plpgsql
+security definer set search_path = public
+as $$
+declare
+  new_row jsonb := to_jsonb(new);
+  old_row jsonb := to_jsonb(old);
+  affected jsonb := coalesce(new_row, old_row);
+  target_ticket_id uuid;
+  changed jsonb := '{}'::jsonb;
+  recipients uuid[];
+begin
+  if tg_table_name = 'tickets' then
+    target_ticket_id := (affected->>'id')::uuid;
+  else
+    target_ticket_id := (affected->>'ticket_id')::uuid;
+    select array[(affected->>'bidder_id')::uuid, t.created_by] into recipients
+    from tickets t where t.id = target_ticket_id;
+    -- The ticket is already gone when its bids are deleted by the cascade.
+    if recipients is null then
+      return null;
+    end if;
+  end if;
+
+  if tg_op = 'UPDATE' then
+    select coalesce(jsonb_object_agg(n.key, n.value), '{}'::jsonb) into changed
+    from jsonb_each(new_row) n
+    where n.value is distinct from old_row->n.key
+      and n.key <> 'search';
+    if changed = '{}'::jsonb then
+      return null;
+    end if;
+  end if;
+
+  insert into ticket_changes (ticket_id, source, row_id, action, audience, changes)
+  values (target_ticket_id, tg_table_name, (affected->>'id')::uuid, tg_op, recipients, changed);
+
+  -- Realtime reads a notification within seconds; clear out old ones now and then.
+  if random() < 0.01 then
+    delete from ticket_changes where created_at < now() - interval '10 minutes';
+  end if;
+  return null;
+end;
+$$;
+
+drop trigger if exists publish_ticket_change on tickets;
+create trigger publish_ticket_change
+  after insert or update or delete on tickets
+  for each row execute function public.publish_ticket_change();
+
+drop trigger if exists publish_ticket_change on bids;
+create trigger publish_ticket_change
+  after insert or update or delete on bids
+  for each row execute function public.publish_ticket_change();
+
+-- Foreign key and sort indexes
+-- Postgres indexes primary keys and unique columns only. These cover the
+-- filters and orderings the pages use, and the referencing side of every
+-- foreign key, which an "on delete cascade" from the parent scans.
+-- harness/explain.py checks the page queries against them.
+create index if not exists tickets_created_by_idx on tickets (created_by);
+create index if not exists tickets_status_created_at_idx on tickets (status, created_at desc);
+create index if not exists bids_ticket_id_created_at_idx on bids (ticket_id, created_at desc);
+create index if not exists bids_bidder_id_idx on bids (bidder_id);
+create index if not exists gigs_freelancer_id_idx on gigs (freelancer_id);
+create index if not exists communities_member_count_idx on communities (member_count desc);
+create index if not exists posts_community_id_created_at_idx on posts (community_id, created_at desc);
+create index if not exists posts_author_id_idx on posts (author_id);
+create index if not exists comments_post_id_idx on comments (post_id);
+create index if not exists comments_author_id_idx on comments (author_id);
+create index if not exists ticket_comments_ticket_id_idx on ticket_comments (ticket_id);
+create index if not exists ticket_comments_author_id_idx on ticket_comments (author_id);
+-- (user_id, post_id) and (user_id, comment_id) are covered by the unique
+-- indexes in "Voting"; these serve deletes of a post or comment.
+create index if not exists votes_post_id_idx on votes (post_id) where post_id is not null;
+create index if not exists votes_comment_id_idx on votes (comment_id) where comment_id is not null;
+
+-- Community feeds
+-- The community home page offers two feeds, each read with keyset
+-- pagination on an index: Newest by (created_at, id) and Trending by
+-- (trending_score, id). trending_score decays with age without ever being
+-- recomputed: it is log10 of a post's engagement plus its creation time in
+-- units of 12.5 hours, so a post needs ten times the engagement to outrank
+-- one posted 12.5 hours later. Ordering by it is stable over time, and a
+-- post's score only changes when its votes or comments do.
+create or replace function public.post_trending_score(upvotes integer, comment_count integer, created_at timestamptz)
+returns double precision
+language sql
+immutable
+as $$
+  select sign(e) * log(greatest(abs(e), 1)::double precision) + extract(epoch from created_at)::double precision / 45000
+  from (select coalesce(upvotes, 0) + coalesce(comment_count, 0) as e) engagement
+$$;
+
+alter table posts add column if not exists trending_score double precision;
+
+create or replace function public.set_post_trending_score()
+returns trigger
+language plpgsql
+as $$
+begin
+  new.trending_score := public.post_trending_score(new.upvotes, new.comment_count, new.created_at);
+  return new;
+end;
+$$;
+
+drop trigger if exists set_post_trending_score on posts;
+create trigger set_post_trending_score
+  before insert or update of upvotes, comment_count, created_at on posts
+  for each row execute procedure public.set_post_trending_score();
+
+-- posts.comment_count was never maintained. Keep it in step with the comments
+-- table; cast_vote already keeps upvotes in step with votes. Security definer
+-- because commenters may not update other people's posts.
+create or replace function public.count_post_comments()
+returns trigger
+language plpgsql
+security definer set search_path = public
+as $$
+begin
+  if tg_op = 'INSERT' then
+    update posts set comment_count = coalesce(comment_count, 0) + 1 where id = new.post_id;
+  else
+    update posts set comment_count = greatest(coalesce(comment_count, 0) - 1, 0) where id = old.post_id;
+  end if;
+  return null;
+end;
+$$;
+
+drop trigger if exists count_post_comments on comments;
+create trigger count_post_comments
+  after insert or delete on comments
+  for each row execute procedure public.count_post_comments();
+
+-- Backfill both counts; the trigger above scores every row on the way.
+update posts set comment_count = (select count(*) from comments where comments.post_id = posts.id);
+alter table posts alter column trending_score set not null;
+
+create index if not exists posts_trending_score_id_idx on posts (trending_score desc, id desc);
+create index if not exists posts_created_at_id_idx on posts (created_at desc, id desc);
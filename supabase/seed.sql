@@ -0,0 +1,40 @@
+-- Fixtures for the local Supabase stack (see config.toml).
+-- Applied after schema.sql and enable_realtime.sql on every `supabase db reset`.
+
+-- E2E login user from testsprite_tests/tmp/config.json, already confirmed so
+-- tests never depend on a real inbox.
+insert into auth.users (
+  instance_id, id, aud, role, email, encrypted_password, email_confirmed_at,
+  raw_app_meta_data, raw_user_meta_data, created_at, updated_at,
+  confirmation_token, recovery_token, email_change, email_change_token_new
+) values (
+  '00000000-0000-0000-0000-000000000000',
+  '11111111-1111-1111-1111-111111111111',
+  'authenticated', 'authenticated',
+  'aditya.rathore10101@gmail.com',
+  extensions.crypt('Gcoder15', extensions.gen_salt('bf')),
+  now(),
+  '{"provider": "email", "providers": ["email"]}',
+  '{"full_name": "Aditya Rathore"}',
+  now(), now(), '', '', '', ''
+);
+
+insert into auth.identities (
+  id, user_id, provider_id, identity_data, provider, last_sign_in_at, created_at, updated_at
+) values (
+  gen_random_uuid(),
+  '11111111-1111-1111-1111-111111111111',
+  '11111111-1111-1111-1111-111111111111',
+  '{"sub": "11111111-1111-1111-1111-111111111111", "email": "aditya.rathore10101@gmail.com", "email_verified": true}',
+  'email', now(), now(), now()
+);
+
+-- The on_auth_user_created trigger has created the profile; finish onboarding.
+update profiles
+set username = 'aditya', role = 'freelancer', updated_at = now()
+where id = '11111111-1111-1111-1111-111111111111';
+
+insert into communities (name, slug, description, icon) values
+  ('Web Development', 'web-dev', 'Frameworks, tooling and shipping for the web.', '🌐'),
+  ('Design', 'design', 'UI, UX and visual design feedback.', '🎨'),
+  ('Freelancing', 'freelancing', 'Clients, pricing and running a practice.', '💼');
@@ -3,30 +3,10 @@ import time
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import open_context, steps
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+    async with open_context() as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
@@ -51,34 +31,34 @@ async def run_test():
         frame = context.pages[-1]
         # Click on the 'Sign Up' link to go to the signup page
         elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Fill in Full Name, Email, and Password fields with valid data
         frame = context.pages[-1]
         # Enter Full Name
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Aditya Rathore')
+        await steps.fill(elem, 'Aditya Rathore')
         
 
         frame = context.pages[-1]
         # Enter Email
         unique_email = f'aditya.rathore.test.{int(time.time())}@gmail.com'
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill(unique_email)
+        await steps.fill(elem, unique_email)
         
 
         frame = context.pages[-1]
         # Enter Password
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
+        await steps.fill(elem, 'Gcoder15')
         
 
         # -> Click the 'Sign Up' button to submit the signup form
         frame = context.pages[-1]
         # Click the 'Sign Up' button to submit the signup form
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -89,15 +69,7 @@ async def run_test():
         except AssertionError:
              # Fallback assertion if URL match is tricky or logic differs
              await expect(frame.locator('text=Verify your email')).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
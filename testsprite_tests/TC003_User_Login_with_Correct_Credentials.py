@@ -2,30 +2,10 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import open_context, steps
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+    async with open_context() as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
@@ -50,46 +30,46 @@ async def run_test():
         frame = context.pages[-1]
         # Click the Login link to navigate to the login page
         elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Enter registered email and correct password in the login form
         frame = context.pages[-1]
         # Enter registered email in email input field
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101@gmail.com')
+        await steps.fill(elem, 'aditya.rathore10101@gmail.com')
         
 
         frame = context.pages[-1]
         # Enter correct password in password input field
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
+        await steps.fill(elem, 'Gcoder15')
         
 
         # -> Click the login button to submit the form
         frame = context.pages[-1]
         # Click the Sign in button to submit login form
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Verify credentials or try alternative approach to confirm login functionality
         frame = context.pages[-1]
         # Re-enter registered email to retry login
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101@gmail.com')
+        await steps.fill(elem, 'aditya.rathore10101@gmail.com')
         
 
         frame = context.pages[-1]
         # Re-enter correct password to retry login
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
+        await steps.fill(elem, 'Gcoder15')
         
 
         frame = context.pages[-1]
         # Click Sign in button to retry login
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -98,15 +78,7 @@ async def run_test():
             await expect(frame.locator('text=Login Successful! Welcome to your dashboard').first).to_be_visible(timeout=3000)
         except AssertionError:
             raise AssertionError('Test case failed: User with valid credentials could not log in successfully and was not redirected to the workspace dashboard as expected.')
-        await asyncio.sleep(5)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,31 +1,14 @@
 import asyncio
+import time
+import urllib.parse
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import local_supabase, open_context, steps
+from harness.config import BASE_URL
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+    async with open_context() as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
@@ -50,67 +33,61 @@ async def run_test():
         frame = context.pages[-1]
         # Click on Sign Up link to start registration
         elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Fill Full Name, Email, and Password fields and submit signup form
         frame = context.pages[-1]
         # Input Full Name
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Aditya Rathore')
+        await steps.fill(elem, 'Aditya Rathore')
         
 
         frame = context.pages[-1]
         # Input Email
+        unique_email = f'aditya.rathore.test.{int(time.time())}@gmail.com'
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101@gmail.com')
+        await steps.fill(elem, unique_email)
         
 
         frame = context.pages[-1]
         # Input Password
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
+        await steps.fill(elem, 'Gcoder15')
         
 
         frame = context.pages[-1]
         # Click Sign Up button to submit the form
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
-        # -> Access the verification email received to get the verification code or link
-        await page.goto('https://mail.google.com/mail/u/0/#inbox', timeout=10000)
-        await asyncio.sleep(3)
+        # -> Read the verification code from the local stack's mail catcher
+        otp = await asyncio.to_thread(local_supabase.latest_otp, unique_email)
+        await page.goto(f"{BASE_URL}/verify?email={urllib.parse.quote(unique_email)}", timeout=10000)
+        await steps.settle(page)
         
 
-        # -> Input email address and proceed to next step for password entry
+        # -> Enter the verification code and submit it
         frame = context.pages[-1]
-        # Input email address for Gmail login
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div[2]/c-wiz/main/div[2]/div/div/div/form/span/section/div/div/div/div/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101@gmail.com')
+        # Input verification code
+        elem = frame.locator('#token').nth(0)
+        await steps.fill(elem, otp)
         
 
         frame = context.pages[-1]
-        # Click Next button to proceed to password entry
-        elem = frame.locator('xpath=html/body/div[2]/div/div/div[2]/c-wiz/main/div[3]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # Click Verify button to confirm the account
+        elem = frame.locator('button:has-text("Verify")').nth(0)
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         try:
-            await expect(frame.locator('text=Account verification successful!').first).to_be_visible(timeout=30000)
+            await expect(page).to_have_url(f"{BASE_URL}/onboarding", timeout=30000)
         except AssertionError:
             raise AssertionError("Test case failed: Verification email link did not work and user account could not be verified as per the test plan.")
-        await asyncio.sleep(5)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,30 +2,11 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import open_context, steps
+from harness.config import BASE_URL
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+    async with open_context(authenticated=True) as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
@@ -46,116 +27,9 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click on the Log In button to start login process
-        frame = context.pages[-1]
-        # Click on the Log In button
-        elem = frame.locator('xpath=html/body/div[2]/main/div/section[3]/div/div/div[2]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email and password, then click Sign in button
-        frame = context.pages[-1]
-        # Input email address
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Check if there is a way to reset password or sign up, or verify credentials
-        frame = context.pages[-1]
-        # Click on Sign up link to check if user can create a new account or find more options
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Fill in the sign up form with new user details and submit to create an account
-        frame = context.pages[-1]
-        # Input full name for sign up
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Aditya Rathore')
-        
-
-        frame = context.pages[-1]
-        # Input email for sign up
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101+test@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password for sign up
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
-        
-
-        frame = context.pages[-1]
-        # Click Sign Up button to submit the form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input the verification code and click Verify button to complete email verification
-        frame = context.pages[-1]
-        # Input verification code
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123456')
-        
-
-        frame = context.pages[-1]
-        # Click Verify button to submit verification code
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click Retry button to request a new verification code
-        frame = context.pages[-1]
-        # Click Retry button to request a new verification code
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Check if there is an option to resend the verification code or instructions to get a new code
-        await page.mouse.wheel(0, 200)
-        
-
-        # -> Navigate back to login page to attempt login with original credentials or check for password recovery options
-        frame = context.pages[-1]
-        # Click Login link to navigate back to login page
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input original email and password and click Sign in to attempt login
-        frame = context.pages[-1]
-        # Input original email for login
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input original password for login
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to attempt login
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Check if there is a password recovery or email confirmation resend option on the login page
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
+        # -> Open the profile editor with the cached session
+        await page.goto(f"{BASE_URL}/profile/edit", timeout=10000)
+        await steps.settle(page)
         
 
         # --> Assertions to verify final state
@@ -164,15 +38,7 @@ async def run_test():
             await expect(frame.locator('text=Profile update successful!').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The profile updates were not saved and displayed correctly as required by the test plan.")
-        await asyncio.sleep(5)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
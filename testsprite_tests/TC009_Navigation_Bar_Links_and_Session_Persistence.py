@@ -2,30 +2,10 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import open_context, steps
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+    async with open_context(authenticated=True) as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
@@ -46,47 +26,13 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click on Login to start login process
-        frame = context.pages[-1]
-        # Click on Login link to open login form
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email and password, then click Sign in button
-        frame = context.pages[-1]
-        # Input email in login form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password in login form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # --> Assertions to verify final state
         frame = context.pages[-1]
         try:
             await expect(frame.locator('text=Navigation Successful - User Session Active').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: Global navigation links did not route correctly or user session was not maintained during navigation as per the test plan.')
-        await asyncio.sleep(5)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -1,31 +1,18 @@
 import asyncio
+import time
+
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import open_context, seed, steps
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+    # The marketplace needs listings to browse; seed them directly instead of
+    # posting gigs through the form. A fresh seed each run, since seeded ids are
+    # derived from it and must not collide with an earlier run's.
+    await asyncio.to_thread(lambda: seed.Seeder(seed=time.time_ns()).gigs(12))
+
+    async with open_context(authenticated=True) as context:
         # Open a new page
         page = await context.new_page()
         
@@ -47,7 +34,7 @@ async def run_test():
         else:
              await page.goto("http://localhost:3000/marketplace")
              
-        await page.wait_for_timeout(2000)
+        await steps.settle(page)
 
         # Click Buy on first item
         await page.click("button:has-text('Buy Now') >> nth=0")
@@ -57,14 +44,7 @@ async def run_test():
             await expect(page.locator('text=Purchase Completed Successfully!').first).to_be_visible(timeout=5000)
         except AssertionError:
             raise AssertionError('Test case failed: Purchase success message not found.')
-        await asyncio.sleep(2)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,30 +2,11 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import open_context, steps
+from harness.config import BASE_URL
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+    async with open_context(authenticated=True) as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
@@ -46,104 +27,17 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click on Login link to go to login page
-        frame = context.pages[-1]
-        # Click on Login link to navigate to login page
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email and password, then click Sign in button to login
-        frame = context.pages[-1]
-        # Input email in login form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('aditya.rathore10101@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password in login form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Gcoder15')
-        
-
-        frame = context.pages[-1]
-        # Click Sign in button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on Sign Up link to navigate to Signup page
-        frame = context.pages[-1]
-        # Click on Sign Up link to navigate to Signup page
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input sample data into Full Name, Email, and Password fields to verify inputs accept text
-        frame = context.pages[-1]
-        # Input Full Name in signup form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test User')
-        
-
-        frame = context.pages[-1]
-        # Input Email in signup form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('testuser@example.com')
-        
-
-        frame = context.pages[-1]
-        # Input Password in signup form
-        elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('TestPass123')
-        
-
-        # -> Click on LatentX or other navigation link to go to Dashboard or main page
-        frame = context.pages[-1]
-        # Click on LatentX link to navigate to main or dashboard page
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on Marketplace link to navigate to Marketplace page
-        frame = context.pages[-1]
-        # Click on Marketplace link to navigate to Marketplace page
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on Tickets link to navigate to Tickets page
-        frame = context.pages[-1]
-        # Click on Tickets link to navigate to Tickets page
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on Community link to navigate to Community page
-        frame = context.pages[-1]
-        # Click on Community link to navigate to Community page
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on Login link to attempt to access Profile page or find Profile link
-        frame = context.pages[-1]
-        # Click on Login link to attempt to access Profile page or find Profile link
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on Messages link to navigate to Messages page
-        frame = context.pages[-1]
-        # Click on GitHub link to check if it leads to Messages or find Messages link
-        elem = frame.locator('xpath=html/body/div[2]/footer/div/p/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Click on Community link to check for Messages or navigate to Messages page
-        elem = frame.locator('xpath=html/body/div[2]/header/div/div/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # -> Visit each signed-in page in turn
+        await page.goto(f"{BASE_URL}/marketplace", timeout=10000)
+        await steps.settle(page)
+        await page.goto(f"{BASE_URL}/tickets", timeout=10000)
+        await steps.settle(page)
+        await page.goto(f"{BASE_URL}/community", timeout=10000)
+        await steps.settle(page)
+        await page.goto(f"{BASE_URL}/profile", timeout=10000)
+        await steps.settle(page)
+        await page.goto(f"{BASE_URL}/messages", timeout=10000)
+        await steps.settle(page)
         
 
         # --> Assertions to verify final state
@@ -152,15 +46,7 @@ async def run_test():
             await expect(frame.locator('text=UI Components Rendered Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed because the reusable UI components did not render correctly across pages with consistent styling as expected.")
-        await asyncio.sleep(5)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,30 +2,10 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import open_context, steps
+
 async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
-    try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
+    async with open_context() as context:
         # Open a new page in the browser context
         page = await context.new_page()
         
@@ -50,79 +30,79 @@ async def run_test():
         frame = context.pages[-1]
         # Click on Sign Up link to open signup form
         elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Input invalid data in the signup form fields and attempt to submit to check validation errors.
         frame = context.pages[-1]
         # Clear Full Name field to test empty input validation
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        await steps.fill(elem, '')
         
 
         frame = context.pages[-1]
         # Input invalid email format to test email validation
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email')
+        await steps.fill(elem, 'invalid-email')
         
 
         frame = context.pages[-1]
         # Input too short password to test password validation
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('123')
+        await steps.fill(elem, '123')
         
 
         frame = context.pages[-1]
         # Click Sign Up button to submit the form with invalid inputs
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Navigate to Login form to test login form validation errors.
         frame = context.pages[-1]
         # Click on Login link to open login form
         elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Input invalid email and empty password in login form and attempt to submit to check validation errors.
         frame = context.pages[-1]
         # Input invalid email format in login form
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email')
+        await steps.fill(elem, 'invalid-email')
         
 
         frame = context.pages[-1]
         # Clear password field to test empty password validation
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
+        await steps.fill(elem, '')
         
 
         frame = context.pages[-1]
         # Click Sign in button to submit login form with invalid inputs
         elem = frame.locator('xpath=html/body/div[2]/main/div/div/form/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Navigate to profile edit page to test profile edit form validation errors.
         frame = context.pages[-1]
         # Click on LatentX logo to navigate to homepage for accessing profile edit page
         elem = frame.locator('xpath=html/body/div[2]/header/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Navigate to profile edit page to test profile edit form validation errors.
         frame = context.pages[-1]
         # Click on Login link to access profile edit after login
         elem = frame.locator('xpath=html/body/div[2]/header/div/div[2]/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # -> Navigate to profile edit page to test profile edit form validation errors.
         frame = context.pages[-1]
         # Click on LatentX logo to navigate to homepage for accessing profile edit page
         elem = frame.locator('xpath=html/body/div[2]/header/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await steps.click(elem)
         
 
         # --> Assertions to verify final state
@@ -131,15 +111,7 @@ async def run_test():
             await expect(frame.locator('text=Validation Successful').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test plan execution failed: Validation errors did not display as expected and invalid submissions were not prevented.')
-        await asyncio.sleep(5)
     
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,30 @@
+import asyncio
+
+from harness import open_context, perf, steps
+from harness.config import BASE_URL
+
+async def run_test():
+    async with open_context() as context:
+        # Open a new page in the browser context
+        page = await context.new_page()
+
+        # Record Navigation Timing, LCP, heap and request counts for every navigation
+        recorder = await perf.attach(page)
+
+        # -> Load each public route with a full document navigation
+        for route in ["/", "/marketplace", "/community", "/tickets"]:
+            await page.goto(f"{BASE_URL}{route}", timeout=10000)
+            await steps.settle(page)
+
+        # -> Switch routes client-side through the navbar
+        frame = context.pages[-1]
+        # Click the Marketplace link in the header
+        elem = frame.locator('header a[href="/marketplace"]').nth(0)
+        await steps.click(elem)
+
+        # --> Assertions to verify final state
+        await perf.assert_within_budget(recorder)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
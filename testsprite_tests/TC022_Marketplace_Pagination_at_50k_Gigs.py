@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+from playwright.async_api import expect
+
+from harness import open_context, perf, seed, steps
+from harness.config import BASE_URL
+
+CATALOG_SIZE = 50_000
+PAGE_SIZE = 24  # GIG_PAGE_SIZE in lib/marketplace.ts
+PAGES_TO_SCROLL = 3
+PAGE_FETCH_BUDGET_MS = 500
+
+
+def top_up_gigs():
+    seeder = seed.Seeder(seed=22)
+    missing = CATALOG_SIZE - seeder.count("gigs")
+    if missing > 0:
+        seeder.gigs(missing)
+
+
+async def run_test():
+    # Benchmark against a large catalog; rows persist, so later runs only top it up.
+    await asyncio.to_thread(top_up_gigs)
+
+    async with open_context() as context:
+        page = await context.new_page()
+        recorder = await perf.attach(page)
+
+        # -> Load the marketplace; only the first page is rendered on the server
+        await page.goto(f"{BASE_URL}/marketplace", timeout=10000)
+        await steps.settle(page)
+        cards = page.locator('[data-testid="gig-grid"] > a')
+        await expect(cards).to_have_count(PAGE_SIZE)
+
+        # -> Scroll to the bottom and time each keyset page the grid appends
+        fetch_ms = []
+        for n in range(2, PAGES_TO_SCROLL + 2):
+            started = time.perf_counter()
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+            await expect(cards).to_have_count(PAGE_SIZE * n, timeout=10000)
+            fetch_ms.append((time.perf_counter() - started) * 1000)
+        print("next-page fetch ms:", ", ".join(f"{ms:.0f}" for ms in fetch_ms))
+
+        # --> Assertions to verify final state
+        samples = await perf.assert_within_budget(recorder)
+        print("marketplace ttfb ms:", samples[0].metrics["ttfb_ms"])
+        assert max(fetch_ms) < PAGE_FETCH_BUDGET_MS, f"slowest page took {max(fetch_ms):.0f} ms"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
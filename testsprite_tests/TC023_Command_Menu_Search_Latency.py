@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+from playwright.async_api import expect
+
+from harness import local_supabase, open_context, seed, steps
+from harness.config import BASE_URL
+from harness.load import StepStats
+
+GIGS = 50_000
+TICKETS = 20_000
+# Every prefix a user types on the way to each query, as the command menu sends them.
+QUERIES = ["design landing page", "api dashboard", "migrate", "optimize mobile app", "brand logo"]
+P95_BUDGET_MS = 150
+
+
+def top_up():
+    seeder = seed.Seeder(seed=23)
+    for table, target, insert in [("gigs", GIGS, seeder.gigs), ("tickets", TICKETS, seeder.tickets)]:
+        missing = target - seeder.count(table)
+        if missing > 0:
+            insert(missing)
+
+
+async def run_test():
+    # Search latency only means something against a large catalog.
+    await asyncio.to_thread(top_up)
+    settings = await asyncio.to_thread(local_supabase.status)
+
+    async with open_context() as context:
+        # -> Call the search RPC directly for every typed prefix
+        stats = StepStats()
+        headers = {"apikey": settings["ANON_KEY"], "Authorization": f"Bearer {settings['ANON_KEY']}"}
+        for query in QUERIES:
+            for end in range(2, len(query) + 1):
+                started = time.perf_counter()
+                response = await context.request.post(
+                    f"{settings['API_URL']}/rest/v1/rpc/search_all",
+                    headers=headers,
+                    data={"query": query[:end]},
+                )
+                assert response.ok, f"search_all failed: {response.status} {await response.text()}"
+                stats.latencies.append(time.perf_counter() - started)
+        p50, p95 = stats.percentile(50) * 1000, stats.percentile(95) * 1000
+        print(f"search_all over {stats.count} prefixes: p50 {p50:.1f} ms, p95 {p95:.1f} ms")
+
+        # -> Search from the command menu in the UI
+        page = await context.new_page()
+        await page.goto(f"{BASE_URL}/marketplace", timeout=10000)
+        await steps.settle(page)
+        await page.keyboard.press("Control+k")
+        await steps.fill(page.get_by_placeholder("Type a command or search..."), "design landing")
+
+        # --> Assertions to verify final state
+        await expect(page.locator("[cmdk-group-heading]", has_text="Gigs")).to_be_visible(timeout=5000)
+        assert p95 < P95_BUDGET_MS, f"search_all p95 {p95:.1f} ms exceeds {P95_BUDGET_MS} ms"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,51 @@
+import asyncio
+import re
+import time
+
+from playwright.async_api import expect
+
+from harness import open_context, seed, steps
+from harness.config import BASE_URL
+
+
+async def run_test():
+    # A fresh seed each run: seeded ids must not collide with an earlier run's.
+    await asyncio.to_thread(lambda: seed.Seeder(seed=time.time_ns()).gigs(200))
+
+    async with open_context() as context:
+        page = await context.new_page()
+        await page.goto(f"{BASE_URL}/marketplace", timeout=10000)
+        await steps.settle(page)
+
+        # -> Search for a keyword; the URL carries the query and the grid re-renders on the server
+        await steps.fill(page.get_by_label("Search services"), "logo")
+        await expect(page).to_have_url(re.compile(r"[?&]q=logo"), timeout=5000)
+        await steps.settle(page)
+
+        # -> Narrow to one category through its facet chip
+        chip = page.get_by_role("link", name=re.compile(r"^Design & Creative \(\d+\)$"))
+        await steps.click(chip)
+        await expect(page).to_have_url(re.compile(r"category=Design"), timeout=5000)
+
+        # -> Cap the price and delivery time from the filters panel
+        await steps.click(page.get_by_role("button", name="Filters"))
+        await steps.fill(page.get_by_label("Max Price ($)"), "1000")
+        await steps.click(page.get_by_label("Delivery Time"))
+        await steps.click(page.get_by_role("option", name="Up to 14 days"))
+        await steps.click(page.get_by_role("button", name="Apply"))
+        await expect(page).to_have_url(re.compile(r"max=1000.*days=14|days=14.*max=1000"), timeout=5000)
+        await steps.settle(page)
+
+        # --> Assertions to verify final state
+        cards = page.locator('[data-testid="gig-grid"] > a')
+        count = await cards.count()
+        for i in range(count):
+            card = cards.nth(i)
+            await expect(card).to_contain_text("Design & Creative")
+            await expect(card).to_contain_text(re.compile(r"logo", re.IGNORECASE))
+        if count == 0:
+            await expect(page.get_by_text("No gigs match your search.")).to_be_visible()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
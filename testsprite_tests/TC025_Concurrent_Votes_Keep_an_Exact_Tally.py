@@ -0,0 +1,71 @@
+import asyncio
+import random
+import time
+
+from harness import local_supabase, open_context, seed
+
+VOTERS = 50
+VOTES = 1000
+
+
+def create_fixtures():
+    # A fresh seed each run: seeded emails must not collide with earlier runs.
+    seeder = seed.Seeder(seed=time.time_ns())
+    voters = seeder.users(VOTERS)
+    community = seeder.communities(1)[0]
+    post = seed.post_rows(1, [community["id"]], [seed.LOGIN_USER_ID], seeder.rng)[0]
+    post["upvotes"] = 0
+    seeder.insert("posts", [post])
+    return seeder, voters, post["id"]
+
+
+async def sign_in(api, api_url, anon_key, email):
+    response = await api.post(
+        f"{api_url}/auth/v1/token?grant_type=password",
+        headers={"apikey": anon_key},
+        data={"email": email, "password": seed.SEED_PASSWORD},
+    )
+    assert response.ok, f"sign-in failed for {email}: {response.status}"
+    return (await response.json())["access_token"]
+
+
+async def run_test():
+    seeder, voters, post_id = await asyncio.to_thread(create_fixtures)
+    settings = await asyncio.to_thread(local_supabase.status)
+    api_url, anon_key = settings["API_URL"], settings["ANON_KEY"]
+
+    async with open_context() as context:
+        api = context.request
+        tokens = await asyncio.gather(*(sign_in(api, api_url, anon_key, seeder.emails[v]) for v in voters))
+
+        # -> Fire every vote at once: each voter repeatedly upvotes, downvotes or clears
+        rng = random.Random(25)
+
+        async def vote(token, value):
+            response = await api.post(
+                f"{api_url}/rest/v1/rpc/cast_vote",
+                headers={"apikey": anon_key, "Authorization": f"Bearer {token}"},
+                data={"vote_value": value, "target_post_id": post_id},
+            )
+            assert response.ok, f"cast_vote failed: {response.status} {await response.text()}"
+            return await response.json()
+
+        started = time.perf_counter()
+        counts = await asyncio.gather(*(
+            vote(rng.choice(tokens), rng.choice([1, 1, -1, 0]))
+            for _ in range(VOTES)
+        ))
+        print(f"{VOTES} concurrent votes in {time.perf_counter() - started:.2f}s")
+
+    # --> Assertions to verify final state
+    rows = await asyncio.to_thread(seeder.select, "votes", f"select=user_id,value&post_id=eq.{post_id}")
+    post = (await asyncio.to_thread(seeder.select, "posts", f"select=upvotes&id=eq.{post_id}"))[0]
+    assert all(isinstance(c, int) for c in counts)
+    assert len({r["user_id"] for r in rows}) == len(rows), "a voter has more than one vote row"
+    assert post["upvotes"] == sum(r["value"] for r in rows), (
+        f"posts.upvotes is {post['upvotes']} but votes sum to {sum(r['value'] for r in rows)}"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
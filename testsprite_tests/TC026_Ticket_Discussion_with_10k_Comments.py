@@ -0,0 +1,56 @@
+import asyncio
+import time
+
+from playwright.async_api import expect
+
+from harness import open_context, seed, steps
+from harness.config import BASE_URL
+
+COMMENTS = 10_000
+PAGE_SIZE = 20  # PAGE_SIZE in components/tickets/ticket-discussion.tsx
+FIRST_PAGE_BUDGET_MS = 1500
+
+
+def create_discussion():
+    seeder = seed.Seeder(seed=time.time_ns())
+    ticket = seeder.tickets(1)[0]
+    seeder.ticket_comments(COMMENTS, ticket["id"])
+    return ticket["id"]
+
+
+async def run_test():
+    ticket_id = await asyncio.to_thread(create_discussion)
+
+    async with open_context() as context:
+        page = await context.new_page()
+        await page.goto(f"{BASE_URL}/tickets/{ticket_id}", timeout=10000)
+        await steps.settle(page)
+
+        # -> Open the discussion; only the first page of top-level comments and their previews load
+        started = time.perf_counter()
+        await steps.click(page.get_by_role("tab", name="Discussion"))
+        threads = page.get_by_test_id("comment-thread")
+        await expect(threads).to_have_count(PAGE_SIZE, timeout=10000)
+        first_page_ms = (time.perf_counter() - started) * 1000
+        print(f"first page of a {COMMENTS}-comment discussion rendered in {first_page_ms:.0f} ms")
+
+        # -> Expand the replies of the first comment that has more than its preview; the
+        # generated replies pick earlier comments at random, so the oldest threads on the
+        # first page always have more than REPLY_PREVIEW of them
+        more = page.get_by_role("button", name="more repl").first
+        await expect(more).to_be_visible(timeout=5000)
+        replies = page.get_by_role("button", name="Reply", exact=True)
+        rendered = await replies.count()
+        await steps.click(more)
+        await expect(replies).not_to_have_count(rendered, timeout=5000)
+
+        # -> Scroll the discussion to the bottom to load the next page
+        await page.get_by_test_id("discussion").evaluate("(el) => el.scrollTo(0, el.scrollHeight)")
+        await expect(threads).to_have_count(PAGE_SIZE * 2, timeout=10000)
+
+        # --> Assertions to verify final state
+        assert first_page_ms < FIRST_PAGE_BUDGET_MS, f"first page took {first_page_ms:.0f} ms"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
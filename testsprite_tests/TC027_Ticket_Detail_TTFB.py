@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+from harness import open_context, perf, seed
+from harness.config import BASE_URL
+from harness.load import StepStats
+
+LOADS = 15
+BIDDERS = 10
+
+
+def create_ticket():
+    # A ticket owned by the login user with bids from several freelancers, so
+    # the owner's view carries every bid.
+    seeder = seed.Seeder(seed=time.time_ns())
+    bidders = seeder.users(BIDDERS)
+    ticket = seeder.tickets(1)[0]
+    seeder.bids(BIDDERS, [ticket["id"]], bidders)
+    return ticket["id"]
+
+
+async def run_test():
+    ticket_id = await asyncio.to_thread(create_ticket)
+    path = f"/tickets/{ticket_id}"
+    budget = perf.budget_for(path, perf.load_budgets())["ttfb_ms"]
+
+    async with open_context(authenticated=True) as context:
+        page = await context.new_page()
+
+        # -> Warm the route once, then time repeated full document loads
+        await page.goto(f"{BASE_URL}{path}", timeout=10000)
+        stats = StepStats()
+        for _ in range(LOADS):
+            await page.goto(f"{BASE_URL}{path}", timeout=10000)
+            ttfb = await page.evaluate("performance.getEntriesByType('navigation')[0].responseStart")
+            stats.latencies.append(ttfb / 1000)
+
+        p50, p95 = stats.percentile(50) * 1000, stats.percentile(95) * 1000
+        print(f"{path} TTFB over {LOADS} loads: p50 {p50:.0f} ms, p95 {p95:.0f} ms (budget {budget} ms)")
+
+        # --> Assertions to verify final state
+        assert p95 <= budget, f"ticket detail p95 TTFB {p95:.0f} ms exceeds {budget} ms"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
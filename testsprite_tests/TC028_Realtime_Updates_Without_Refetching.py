@@ -0,0 +1,57 @@
+import asyncio
+import time
+
+from playwright.async_api import expect
+
+from harness import open_context, seed, steps
+from harness.config import BASE_URL
+
+COMMENTS = 5
+
+
+def create_ticket():
+    seeder = seed.Seeder(seed=time.time_ns())
+    ticket = seeder.tickets(1)[0]
+    seeder.ticket_comments(COMMENTS, ticket["id"])
+    return seeder, ticket["id"]
+
+
+async def run_test():
+    seeder, ticket_id = await asyncio.to_thread(create_ticket)
+
+    async with open_context() as context:
+        page = await context.new_page()
+        await page.goto(f"{BASE_URL}/tickets/{ticket_id}", timeout=10000)
+        await steps.click(page.get_by_role("tab", name="Discussion"))
+        await expect(page.get_by_test_id("comment-thread").first).to_be_visible(timeout=10000)
+        await steps.settle(page)
+        # Both realtime channels (the ticket and its discussion) must be joined before writing
+        await page.wait_for_function("() => window.__realtimeMetrics().joined >= 2", timeout=10000)
+
+        # Count every request the page makes from here on
+        requests = []
+        page.on("request", lambda request: requests.append(request))
+
+        # -> Another session posts a comment; it renders from the realtime payload alone
+        content = f"realtime comment {time.time_ns()}"
+        await asyncio.to_thread(seeder.insert, "ticket_comments", [{
+            "ticket_id": ticket_id,
+            "author_id": seed.LOGIN_USER_ID,
+            "content": content,
+        }])
+        await expect(page.get_by_text(content)).to_be_visible(timeout=5000)
+
+        # -> The owner changes the ticket; the status badge updates in place
+        await asyncio.to_thread(seeder.update, "tickets", f"id=eq.{ticket_id}", {"status": "in_progress"})
+        await steps.click(page.get_by_role("tab", name="Details"))
+        await expect(page.get_by_text("in_progress")).to_be_visible(timeout=5000)
+
+        # --> Assertions to verify final state
+        rows = [r.url for r in requests if "/rest/v1/ticket_comments" in r.url or "/rest/v1/profiles" in r.url]
+        refreshes = [r.url for r in requests if r.headers.get("rsc") == "1"]
+        assert not rows, f"realtime events refetched rows: {rows}"
+        assert not refreshes, f"realtime events re-rendered the page on the server: {refreshes}"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,68 @@
+import asyncio
+import json
+import time
+
+from playwright.async_api import expect
+
+from harness import open_context, seed, steps
+from harness.config import BASE_URL
+
+TAB_SWITCHES = 5
+COMMENTS = 20
+
+
+def create_ticket():
+    seeder = seed.Seeder(seed=time.time_ns())
+    ticket = seeder.tickets(1)[0]
+    return seeder, ticket["id"]
+
+
+async def run_test():
+    seeder, ticket_id = await asyncio.to_thread(create_ticket)
+
+    async with open_context() as context:
+        page = await context.new_page()
+
+        # Record every realtime socket and every channel join sent over it
+        sockets = []
+        joins = []
+
+        def on_frame(payload):
+            message = json.loads(payload) if isinstance(payload, str) else {}
+            if isinstance(message, dict) and message.get("event") == "phx_join":
+                joins.append(message["topic"])
+
+        def on_websocket(ws):
+            if "/realtime/" in ws.url:
+                sockets.append(ws.url)
+                ws.on("framesent", on_frame)
+
+        page.on("websocket", on_websocket)
+
+        await page.goto(f"{BASE_URL}/tickets/{ticket_id}", timeout=10000)
+        await steps.settle(page)
+
+        # -> Remount the discussion repeatedly by switching tabs
+        for _ in range(TAB_SWITCHES):
+            await steps.click(page.get_by_role("tab", name="Discussion"))
+            await expect(page.get_by_test_id("discussion")).to_be_visible(timeout=5000)
+            await steps.click(page.get_by_role("tab", name="Details"))
+        await steps.click(page.get_by_role("tab", name="Discussion"))
+        await page.wait_for_function("() => window.__realtimeMetrics().joined === 2", timeout=10000)
+
+        # -> Post comments from another session and let them stream in
+        await asyncio.to_thread(seeder.ticket_comments, COMMENTS, ticket_id)
+        await page.wait_for_function("() => window.__realtimeMetrics().eventsPerSecond > 0", timeout=10000)
+        metrics = await page.evaluate("() => window.__realtimeMetrics()")
+        print(f"realtime metrics: {metrics}, channel joins: {joins}")
+
+        # --> Assertions to verify final state
+        assert len(sockets) == 1, f"expected one realtime socket, got {len(sockets)}"
+        # The ticket and its discussion: two channels however often the tab remounts
+        assert metrics["channels"] == 2, metrics
+        assert len(set(joins)) == 2, joins
+        assert metrics["eventsPerSecond"] > 0, metrics
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
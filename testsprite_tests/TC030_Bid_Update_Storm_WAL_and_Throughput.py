@@ -0,0 +1,111 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from harness import local_supabase, open_context, seed, steps
+from harness.config import BASE_URL
+
+BIDDERS = 10
+UPDATES = 500  # A multiple of BIDDERS
+MESSAGE_WORDS = 400
+# A bid status change should cost the realtime socket about one small notification,
+# not the whole bid with its message.
+MAX_EVENT_BYTES = 1024
+
+# The identity this replaces. The baseline storm still fires the ticket_changes
+# trigger, so the difference is the old row images alone.
+FULL_IDENTITY = "alter table bids replica identity full"
+DEFAULT_IDENTITY = "alter table bids replica identity default"
+
+
+def create_bids():
+    seeder = seed.Seeder(seed=time.time_ns())
+    ticket = seeder.tickets(1)[0]
+    rows = seed.bid_rows(BIDDERS, [ticket["id"]], seeder.users(BIDDERS), seeder.rng)
+    for row in rows:
+        row["message"] = seed._words(seeder.rng, MESSAGE_WORDS)
+        row["status"] = "pending"
+    seeder.insert("bids", rows)
+    return seeder, ticket["id"], [row["id"] for row in rows]
+
+
+def flip(seeder, bid_id, times):
+    """Toggle a pending bid between rejected and pending ``times`` times, in order."""
+    for n in range(times):
+        seeder.update("bids", f"id=eq.{bid_id}", {"status": "rejected" if n % 2 == 0 else "pending"})
+
+
+def storm(seeder, bid_ids, settings):
+    """Apply UPDATES status changes, one writer thread per bid; return (WAL bytes, seconds).
+
+    Every update changes the status, so each one publishes a ticket_changes row.
+    An even number per bid leaves every bid pending for the next storm.
+    """
+    before = local_supabase.sql("select pg_current_wal_lsn()", settings)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(len(bid_ids)) as pool:
+        list(pool.map(lambda bid_id: flip(seeder, bid_id, UPDATES // len(bid_ids)), bid_ids))
+    elapsed = time.perf_counter() - started
+    after = local_supabase.sql("select pg_current_wal_lsn()", settings)
+    wal = int(float(local_supabase.sql(f"select pg_wal_lsn_diff('{after}', '{before}')", settings)))
+    return wal, elapsed
+
+
+async def wait_for_events(page, events, count, timeout=15):
+    deadline = time.monotonic() + timeout
+    while len(events) < count and time.monotonic() < deadline:
+        await page.wait_for_timeout(250)
+
+
+async def run_test():
+    settings = await asyncio.to_thread(local_supabase.status)
+    seeder, ticket_id, bid_ids = await asyncio.to_thread(create_bids)
+
+    async with open_context(authenticated=True) as context:
+        page = await context.new_page()
+
+        # Size of every postgres_changes message the owner's page receives
+        events = []
+
+        def on_frame(payload):
+            if isinstance(payload, str) and '"postgres_changes"' in payload:
+                events.append(len(payload.encode()))
+
+        page.on("websocket", lambda ws: ws.on("framereceived", on_frame))
+
+        # -> The ticket owner watches the offers tab
+        await page.goto(f"{BASE_URL}/tickets/{ticket_id}", timeout=10000)
+        await steps.click(page.get_by_role("tab", name="Offers"))
+        await steps.settle(page)
+        await page.wait_for_function(
+            "() => { const m = window.__realtimeMetrics(); return m.channels > 0 && m.joined === m.channels; }",
+            timeout=10000,
+        )
+
+        # -> Baseline: the same storm with the old replica identity
+        await asyncio.to_thread(local_supabase.sql, FULL_IDENTITY, settings)
+        try:
+            full_wal, _ = await asyncio.to_thread(storm, seeder, bid_ids, settings)
+        finally:
+            await asyncio.to_thread(local_supabase.sql, DEFAULT_IDENTITY, settings)
+        await wait_for_events(page, events, UPDATES)
+        events.clear()
+
+        # -> Storm of bid status changes with the default identity and ticket_changes
+        wal, elapsed = await asyncio.to_thread(storm, seeder, bid_ids, settings)
+        await wait_for_events(page, events, UPDATES)
+
+        print(
+            f"{UPDATES} bid updates in {elapsed:.1f} s ({UPDATES / elapsed:.0f}/s); "
+            f"WAL {wal / UPDATES:.0f} B/update (replica identity full: {full_wal / UPDATES:.0f} B/update); "
+            f"{len(events)} realtime events, {sum(events) / max(len(events), 1):.0f} B/event"
+        )
+
+        # --> Assertions to verify final state
+        assert len(events) == UPDATES, f"received {len(events)} of {UPDATES} realtime events"
+        assert max(events) <= MAX_EVENT_BYTES, f"largest realtime event was {max(events)} bytes"
+        assert wal < full_wal, f"WAL {wal} bytes is not below the replica identity full baseline {full_wal}"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
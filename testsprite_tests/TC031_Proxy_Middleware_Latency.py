@@ -0,0 +1,38 @@
+import asyncio
+import re
+
+from harness import open_context
+from harness.config import BASE_URL
+from harness.load import StepStats
+
+REQUESTS = 30
+# Public, plain and protected routes, as a signed-in user. None of them should
+# wait on the auth server once the session is verified.
+PATHS = ["/about", "/tickets", "/workspace"]
+PROXY_BUDGET_MS = 20
+PROXY_TIMING = re.compile(r"proxy;dur=([\d.]+)")
+
+
+async def run_test():
+    async with open_context(authenticated=True) as context:
+        results = {}
+        for path in PATHS:
+            # -> Warm the route (and the verification cache), then time repeated requests
+            await context.request.get(f"{BASE_URL}{path}", max_redirects=0)
+            stats = StepStats()
+            for _ in range(REQUESTS):
+                response = await context.request.get(f"{BASE_URL}{path}", max_redirects=0)
+                match = PROXY_TIMING.search(response.headers.get("server-timing", ""))
+                assert match, f"{path} response has no proxy Server-Timing entry"
+                stats.latencies.append(float(match.group(1)) / 1000)
+            p50, p95 = stats.percentile(50) * 1000, stats.percentile(95) * 1000
+            results[path] = p95
+            print(f"proxy time for {path} over {REQUESTS} requests: p50 {p50:.1f} ms, p95 {p95:.1f} ms")
+
+        # --> Assertions to verify final state
+        for path, p95 in results.items():
+            assert p95 <= PROXY_BUDGET_MS, f"proxy p95 for {path} is {p95:.1f} ms (budget {PROXY_BUDGET_MS} ms)"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,17 @@
+import asyncio
+
+from harness import explain
+
+
+async def run_test():
+    # -> Seed large tables and ask PostgREST for the plan of every page query
+    violations = await asyncio.to_thread(explain.run)
+
+    # --> Assertions to verify final state
+    for page, path, query, scanned in violations:
+        print(f"{page}: {', '.join(scanned)} for /rest/v1/{path}?{query}")
+    assert not violations, f"{len(violations)} page queries read tables without an index bound"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
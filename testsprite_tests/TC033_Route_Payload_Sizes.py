@@ -0,0 +1,94 @@
+import asyncio
+import json
+import re
+import time
+
+from harness import open_context, perf, seed, steps
+from harness.config import BASE_URL
+
+# Profile fields no card or list renders; they only belong on the viewer's own profile.
+PROFILE_ONLY = ("bio", "website", "skills")
+# Matches those keys, or a tsvector "search" column, in plain JSON and in the
+# escaped JSON of the server components' payload inlined in the HTML.
+LEAKED_FIELD = re.compile(r'\\?"(%s)\\?":|\\?"search\\?":\\?"\'' % "|".join(PROFILE_ONLY))
+
+
+def create_content():
+    seeder = seed.Seeder(seed=time.time_ns())
+    gig = seeder.gigs(1)[0]
+    ticket = seeder.tickets(1)[0]
+    community = seeder.communities(1)[0]
+    seeder.posts(10, [community["id"]])
+    return [
+        "/marketplace",
+        f"/marketplace/{gig['id']}",
+        "/community",
+        f"/community/{community['slug']}",
+        "/tickets",
+        f"/tickets/{ticket['id']}",
+    ]
+
+
+def leaked_keys(value):
+    """PROFILE_ONLY keys and search vectors anywhere in a decoded JSON value."""
+    if isinstance(value, list):
+        return {key for item in value for key in leaked_keys(item)}
+    if not isinstance(value, dict):
+        return set()
+    found = {key for key in value if key in PROFILE_ONLY or key == "search"}
+    for item in value.values():
+        found |= leaked_keys(item)
+    return found
+
+
+async def run_test():
+    routes = await asyncio.to_thread(create_content)
+    budgets = perf.load_budgets()
+
+    async with open_context() as context:
+        page = await context.new_page()
+        recorder = await perf.attach(page)
+
+        # Bytes and leaked fields of every PostgREST response the browser receives
+        api = {"bytes": 0, "leaks": set()}
+
+        async def on_response(response):
+            # Profile lookups count too: the browser only fetches authors' card
+            # fields, never the viewer's own profile, on these routes
+            if "/rest/v1/" not in response.url:
+                return
+            try:
+                body = await response.body()
+            except Exception:
+                return  # Redirects and aborted requests have no body
+            api["bytes"] += len(body)
+            try:
+                api["leaks"] |= leaked_keys(json.loads(body))
+            except ValueError:
+                pass
+
+        page.on("response", on_response)
+
+        failures = []
+        for route in routes:
+            # -> Load the route and let its client-side fetches finish
+            api["bytes"], api["leaks"] = 0, set()
+            response = await page.goto(f"{BASE_URL}{route}", timeout=10000)
+            html = await response.text()
+            await steps.settle(page)
+
+            leaks = {match.group(1) or "search" for match in LEAKED_FIELD.finditer(html)} | api["leaks"]
+            limit = perf.budget_for(route, budgets).get("api_bytes")
+            print(f"{route}: document {len(html.encode()):,} B, API {api['bytes']:,} B")
+            if leaks:
+                failures.append(f"{route} ships unrendered fields: {', '.join(sorted(leaks))}")
+            if limit is not None and api["bytes"] > limit:
+                failures.append(f"{route}: API responses {api['bytes']:,} B > {limit:,} B")
+
+        # --> Assertions to verify final state
+        assert not failures, "\n".join(failures)
+        await perf.assert_within_budget(recorder, budgets)
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,78 @@
+import asyncio
+import math
+import time
+from datetime import datetime, timedelta, timezone
+
+from playwright.async_api import expect
+
+from harness import open_context, seed, steps
+from harness.config import BASE_URL
+
+PAGE_SIZE = 10  # POST_PAGE_SIZE in lib/community.ts
+FILLER_POSTS = 25
+# post_trending_score in supabase/schema.sql: ten times the engagement is worth 12.5 hours.
+DECAY_SECONDS = 45000
+
+
+def trending_score(upvotes, comment_count, created_at):
+    engagement = upvotes + comment_count
+    magnitude = math.log10(max(abs(engagement), 1))
+    return math.copysign(magnitude, engagement) + datetime.fromisoformat(created_at).timestamp() / DECAY_SECONDS
+
+
+def create_posts():
+    seeder = seed.Seeder(seed=time.time_ns())
+    community = seeder.communities(1)[0]
+    seeder.posts(FILLER_POSTS, [community["id"]])
+
+    now = datetime.now(timezone.utc)
+    hot, stale, fresh = seed.post_rows(3, [community["id"]], [seed.LOGIN_USER_ID], seeder.rng)
+    # The most engagement today, ten times more three months ago, and none just now.
+    hot.update(title=f"Hot {hot['id']}", upvotes=1_000_000, created_at=now.isoformat())
+    stale.update(title=f"Stale {stale['id']}", upvotes=10_000_000, created_at=(now - timedelta(days=90)).isoformat())
+    fresh.update(title=f"Fresh {fresh['id']}", upvotes=0, created_at=(now + timedelta(seconds=1)).isoformat())
+    seeder.insert("posts", [hot, stale, fresh])
+    return seeder, hot, stale, fresh
+
+
+def comment_on(seeder, post):
+    seeder.insert("comments", [{"content": "First!", "post_id": post["id"], "author_id": seed.LOGIN_USER_ID}])
+    return seeder.select("posts", f"select=comment_count,trending_score&id=eq.{post['id']}")[0]
+
+
+async def run_test():
+    seeder, hot, stale, fresh = await asyncio.to_thread(create_posts)
+
+    # -> A new comment updates the post's comment count and score
+    scored = await asyncio.to_thread(comment_on, seeder, fresh)
+    assert scored["comment_count"] == 1, f"comment_count is {scored['comment_count']}"
+    expected = trending_score(0, 1, fresh["created_at"])
+    assert math.isclose(scored["trending_score"], expected, abs_tol=1e-6), f"{scored['trending_score']} != {expected}"
+
+    async with open_context() as context:
+        page = await context.new_page()
+        titles = page.locator('[data-testid="post-feed"] h3')
+
+        # -> Trending ranks today's hot post above a three-month-old post with more votes
+        await page.goto(f"{BASE_URL}/community", timeout=10000)
+        await steps.settle(page)
+        await expect(titles.first).to_have_text(hot["title"])
+        await expect(titles).to_have_count(PAGE_SIZE)
+        assert stale["title"] not in await titles.all_inner_texts(), "a three-month-old post is trending"
+
+        # -> Newest lists the latest post first
+        await page.get_by_role("link", name="Newest").click()
+        await page.wait_for_url("**/community?sort=newest")
+        await expect(titles.first).to_have_text(fresh["title"])
+
+        # -> Scrolling appends the next keyset page without repeating posts
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await expect(titles).to_have_count(PAGE_SIZE * 2, timeout=10000)
+        shown = await titles.all_inner_texts()
+
+        # --> Assertions to verify final state
+        assert len(set(shown)) == len(shown), "the second page repeats posts from the first"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,66 @@
+import asyncio
+import re
+import time
+from datetime import datetime, timezone
+
+from playwright.async_api import expect
+
+from harness import open_context, seed, steps
+from harness.config import BASE_URL
+
+PAGE_SIZE = 24  # TICKET_PAGE_SIZE in lib/tickets.ts
+EXTRA_TICKETS = 6
+
+
+def create_tickets():
+    seeder = seed.Seeder(seed=time.time_ns())
+    # A word no other test's tickets use, so searching for it isolates these
+    marker = f"Board{seeder.rng.getrandbits(32)}"
+    tickets = seed.ticket_rows(PAGE_SIZE + EXTRA_TICKETS, [seed.LOGIN_USER_ID], seeder.rng)
+    for number, ticket in enumerate(tickets):
+        ticket.update(title=f"{marker} {number:02d}", status="open")
+    seeder.insert("tickets", tickets)
+    return seeder, marker
+
+
+def post_ticket(seeder, marker):
+    ticket = seed.ticket_rows(1, [seed.LOGIN_USER_ID], seeder.rng)[0]
+    ticket.update(title=f"{marker} new", status="open", created_at=datetime.now(timezone.utc).isoformat())
+    seeder.insert("tickets", [ticket])
+    return ticket
+
+
+async def run_test():
+    seeder, marker = await asyncio.to_thread(create_tickets)
+
+    async with open_context() as context:
+        page = await context.new_page()
+        titles = page.get_by_text(re.compile(f"^{marker} "))
+
+        # -> Search the board for the seeded tickets; only the first page loads
+        await page.goto(f"{BASE_URL}/tickets", timeout=10000)
+        await steps.settle(page)
+        await steps.fill(page.get_by_placeholder("Search tickets..."), marker)
+        await expect(titles).to_have_count(PAGE_SIZE, timeout=10000)
+
+        # -> Load the next keyset page
+        await steps.click(page.get_by_role("button", name="Load more tickets"))
+        await expect(titles).to_have_count(PAGE_SIZE + EXTRA_TICKETS, timeout=10000)
+        await expect(page.get_by_role("button", name="Load more tickets")).to_have_count(0)
+        loaded = await titles.all_inner_texts()
+        assert len(set(loaded)) == len(loaded), "the second page repeats tickets from the first"
+
+        # -> A ticket posted elsewhere reloads the board over every loaded page
+        await page.wait_for_function("() => window.__realtimeMetrics().joined >= 1", timeout=10000)
+        ticket = await asyncio.to_thread(post_ticket, seeder, marker)
+        await expect(page.get_by_text(ticket["title"], exact=True)).to_be_visible(timeout=10000)
+
+        # --> Assertions to verify final state
+        await expect(titles).to_have_count(PAGE_SIZE + EXTRA_TICKETS)
+        shown = await titles.all_inner_texts()
+        assert shown[0] == ticket["title"], f"the new ticket is not first: {shown[0]}"
+        assert len(set(shown)) == len(shown), "the reloaded board repeats tickets"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,11 @@
+"""Shared execution harness for the TestSprite generated TC scripts.
+
+Each ``TC*.py`` script exposes an ``async def run_test()`` coroutine. Run on
+its own, a script starts a private browser; under ``python -m harness.runner``
+the same coroutine is scheduled on a pool of worker browsers instead.
+"""
+
+from harness import steps
+from harness.browser import BROWSER_ARGS, open_context
+
+__all__ = ["BROWSER_ARGS", "open_context", "steps"]
@@ -0,0 +1,259 @@
+"""Failure artifacts: Playwright trace, HAR and optional video, kept only for failing tests.
+
+While a test runs, its context records a Playwright trace (held by the driver
+until ``tracing.stop``) and the last ``HAR_RING_SIZE`` finished or failed
+requests in an in-memory ring buffer. Nothing touches the disk on the way: a
+passing test stops tracing without a path and drops the buffer. A failing test
+writes ``trace.zip``, ``network.har`` and, with video enabled, the page videos
+to ``tmp/artifacts/<test>-<attempt>-<timestamp>/``.
+
+Saved runs are an LRU cache bounded by ``MAX_ARTIFACT_BYTES`` in total: the
+least recently written or opened directories are evicted first. Usage (from the
+``testsprite_tests`` directory)::
+
+    python -m harness.artifacts list
+    python -m harness.artifacts open TC019   # prints the show-trace command
+"""
+
+import argparse
+import contextvars
+import json
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+from harness.config import TMP_DIR
+
+ARTIFACTS_DIR = TMP_DIR / "artifacts"
+MAX_ARTIFACT_BYTES = 500 * 1024 * 1024
+HAR_RING_SIZE = 1000
+# Scratch space for videos, which Playwright can only record to disk; they are
+# moved into the artifact directory on failure and deleted otherwise.
+VIDEO_SCRATCH_DIR = ARTIFACTS_DIR / ".video"
+
+
+@dataclass
+class CaptureOptions:
+    trace: bool = True
+    har: bool = True
+    video: bool = False
+
+
+@dataclass
+class Sink:
+    """Where the current test's artifacts go; bound per attempt by harness.runner."""
+    test: str
+    attempt: int = 1
+    options: CaptureOptions = field(default_factory=CaptureOptions)
+    paths: list = field(default_factory=list)
+
+
+current_sink: contextvars.ContextVar = contextvars.ContextVar("current_sink", default=None)
+
+
+def sink_for_current_test():
+    """The runner's sink for this attempt, or one named after the script run directly."""
+    return current_sink.get() or Sink(test=Path(sys.argv[0]).stem or "adhoc")
+
+
+class NetworkRing:
+    """The last ``size`` completed requests of a context, turned into HAR on demand."""
+
+    def __init__(self, context, size=HAR_RING_SIZE):
+        self.entries = deque(maxlen=size)
+        context.on("requestfinished", self.entries.append)
+        context.on("requestfailed", self.entries.append)
+
+    async def _entry(self, request):
+        timing = request.timing
+        response = None
+        try:
+            response = await request.response()
+        except async_api.Error:
+            pass
+        started = timing["startTime"] / 1000 if timing["startTime"] > 0 else time.time()
+        wait = max(timing["responseStart"] - timing["requestStart"], 0) if timing["responseStart"] > 0 else -1
+        receive = max(timing["responseEnd"] - timing["responseStart"], 0) if timing["responseEnd"] > 0 else -1
+        entry = {
+            "startedDateTime": datetime.fromtimestamp(started, timezone.utc).isoformat(),
+            "time": max(timing["responseEnd"], 0),
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": k, "value": v} for k, v in request.headers.items()],
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(request.post_data_buffer or b""),
+            },
+            "response": {
+                "status": response.status if response else 0,
+                "statusText": response.status_text if response else "",
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": k, "value": v} for k, v in response.headers.items()] if response else [],
+                "cookies": [],
+                "content": {"size": -1, "mimeType": response.headers.get("content-type", "") if response else ""},
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": wait, "receive": receive},
+        }
+        if request.failure:
+            entry["_failure"] = request.failure
+        return entry
+
+    async def save(self, path):
+        har = {"log": {
+            "version": "1.2",
+            "creator": {"name": "harness.artifacts", "version": "1"},
+            "pages": [],
+            "entries": [await self._entry(request) for request in self.entries],
+        }}
+        path.write_text(json.dumps(har, indent=1))
+
+
+class ArtifactCache:
+    """Artifact directories under ``root``, evicted least recently used first."""
+
+    def __init__(self, root=ARTIFACTS_DIR, max_bytes=MAX_ARTIFACT_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def new_dir(self, test, attempt):
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = self.root / f"{test}-{attempt}-{stamp}"
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def entries(self):
+        """``(path, bytes, last_used)`` for every saved directory, oldest first."""
+        if not self.root.exists():
+            return []
+        found = []
+        for path in self.root.iterdir():
+            if path.is_dir() and not path.name.startswith("."):
+                size = sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+                found.append((path, size, path.stat().st_mtime))
+        return sorted(found, key=lambda e: e[2])
+
+    def touch(self, path):
+        os.utime(path)
+
+    def evict(self, keep=None):
+        """Delete the least recently used directories until the cache fits ``max_bytes``."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        evicted = []
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+            evicted.append(path)
+        return evicted
+
+    def find(self, test):
+        """Most recent directory whose name starts with ``test``."""
+        matches = [path for path, _, _ in self.entries() if path.name.startswith(test)]
+        return matches[-1] if matches else None
+
+
+cache = ArtifactCache()
+
+
+def context_options(sink):
+    """Extra ``new_context`` options the sink's capture settings need."""
+    if sink.options.video:
+        VIDEO_SCRATCH_DIR.mkdir(parents=True, exist_ok=True)
+        return {"record_video_dir": str(VIDEO_SCRATCH_DIR)}
+    return {}
+
+
+class Capture:
+    """Recording for one browser context, kept or dropped when the test ends.
+
+    Call ``finish`` while the context is still open and ``after_close`` once
+    it has closed, since Playwright only completes video files on close.
+    """
+
+    def __init__(self, context, sink):
+        self.context = context
+        self.sink = sink
+        self.network = NetworkRing(context) if sink.options.har else None
+        self.target = None
+        self.videos = []
+
+    async def start(self):
+        if self.sink.options.trace:
+            await self.context.tracing.start(screenshots=True, snapshots=True)
+        return self
+
+    async def finish(self, failed):
+        self.videos = [page.video for page in self.context.pages if page.video]
+        if not failed:
+            if self.sink.options.trace:
+                await self.context.tracing.stop()
+            return
+        self.target = cache.new_dir(self.sink.test, self.sink.attempt)
+        try:
+            if self.sink.options.trace:
+                await self.context.tracing.stop(path=self.target / "trace.zip")
+            if self.network:
+                await self.network.save(self.target / "network.har")
+        except async_api.Error as e:
+            print(f"Could not save artifacts for {self.sink.test}: {e}", file=sys.stderr, flush=True)
+        self.sink.paths.append(self.target)
+
+    async def after_close(self):
+        for video in self.videos:
+            path = Path(await video.path())
+            if self.target is not None and path.exists():
+                shutil.move(path, self.target / path.name)
+            else:
+                path.unlink(missing_ok=True)
+        if self.target is not None:
+            for evicted in cache.evict(keep=self.target):
+                print(f"Evicted artifacts {evicted.name}", flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.artifacts", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="saved artifact directories, least recently used first")
+    open_cmd = sub.add_parser("open", help="mark a test's latest artifacts as used and show how to view them")
+    open_cmd.add_argument("test")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "list":
+        entries = cache.entries()
+        for path, size, _ in entries:
+            print(f"{size / 1024 / 1024:>8.1f} MB  {path.name}")
+        total = sum(size for _, size, _ in entries)
+        print(f"{total / 1024 / 1024:.1f} MB of {cache.max_bytes / 1024 / 1024:.0f} MB")
+    elif args.command == "open":
+        path = cache.find(args.test)
+        if path is None:
+            print(f"No artifacts saved for {args.test}.", file=sys.stderr)
+            return 1
+        cache.touch(path)
+        print(f"playwright show-trace {path / 'trace.zip'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
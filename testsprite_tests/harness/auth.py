@@ -0,0 +1,80 @@
+"""Log in once per run and share the session through Playwright storage state.
+
+The Supabase SSR client keeps the session in ``sb-<ref>-auth-token`` cookies,
+so a saved ``storage_state`` is enough to start any context already signed in.
+The file is reused across runs until the access token is close to expiry.
+"""
+
+import asyncio
+import base64
+import json
+import time
+
+from harness.config import LOGIN_PASSWORD, LOGIN_USER, TMP_DIR
+from harness.pages import LoginPage
+
+STORAGE_STATE_PATH = TMP_DIR / "auth" / "storage_state.json"
+# Treat the session as stale this long before the token actually expires.
+EXPIRY_MARGIN_S = 120
+LOGIN_TIMEOUT_MS = 15000
+
+_login_lock = asyncio.Lock()
+
+
+def _auth_cookie_value(cookies):
+    """Reassemble the Supabase auth cookie, which may be split into ``.0``, ``.1``... chunks."""
+    chunks = {}
+    for cookie in cookies:
+        name = cookie["name"]
+        if not name.startswith("sb-") or "-auth-token" not in name:
+            continue
+        _, _, index = name.partition("-auth-token")
+        chunks[int(index.lstrip(".") or 0)] = cookie["value"]
+    return "".join(chunks[i] for i in sorted(chunks))
+
+
+def session_expiry(state):
+    """Return the session's ``expires_at`` epoch seconds, or None if no session is stored."""
+    value = _auth_cookie_value(state.get("cookies", []))
+    if not value:
+        return None
+    if value.startswith("base64-"):
+        value = value[len("base64-"):]
+        value = base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+    try:
+        return float(json.loads(value)["expires_at"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def is_fresh(path=STORAGE_STATE_PATH, margin=EXPIRY_MARGIN_S):
+    """True if ``path`` holds a session that stays valid for at least ``margin`` seconds."""
+    try:
+        state = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return False
+    expires_at = session_expiry(state)
+    return expires_at is not None and expires_at - margin > time.time()
+
+
+async def log_in(browser, path=STORAGE_STATE_PATH):
+    """Sign in through the login page and save the resulting storage state to ``path``."""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        login = await LoginPage(page).open()
+        await login.log_in(LOGIN_USER, LOGIN_PASSWORD)
+        await page.wait_for_url(lambda url: "/login" not in url, timeout=LOGIN_TIMEOUT_MS)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=path)
+    finally:
+        await context.close()
+    return path
+
+
+async def ensure_storage_state(browser, path=STORAGE_STATE_PATH):
+    """Return a fresh storage state file, logging in with ``browser`` only if needed."""
+    async with _login_lock:
+        if not is_fresh(path):
+            await log_in(browser, path)
+    return path
@@ -0,0 +1,79 @@
+"""Browser lifecycle shared by the TC scripts and the parallel runner."""
+
+import contextlib
+import contextvars
+
+from playwright import async_api
+
+from harness import artifacts
+from harness.auth import ensure_storage_state
+
+# Launch arguments for every Chromium instance the harness starts.
+# ``--single-process`` is deliberately absent: it is unstable once a browser
+# hosts more than one context, which is exactly what the runner pool does.
+BROWSER_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+
+DEFAULT_TIMEOUT_MS = 5000
+
+# Browser owned by the current runner worker, if any. Set by harness.runner
+# before a test's ``run_test()`` is awaited; unset when a script runs directly.
+pooled_browser: contextvars.ContextVar = contextvars.ContextVar("pooled_browser", default=None)
+
+
+async def launch_browser(pw):
+    """Launch a headless Chromium with the harness arguments."""
+    return await pw.chromium.launch(headless=True, args=BROWSER_ARGS)
+
+
+@contextlib.asynccontextmanager
+async def open_context(authenticated=False, **context_options):
+    """Yield a fresh browser context for one test.
+
+    Inside the runner the context is opened on the worker's pooled browser and
+    only the context is torn down afterwards. Outside the runner a private
+    Playwright session and browser are started and stopped around the test.
+    With ``authenticated=True`` the context starts from the cached login
+    session instead of the test filling in the login form itself.
+
+    The context is traced while the test runs; if the test raises, the trace
+    and network log are saved (see ``harness.artifacts``), otherwise dropped.
+    """
+    browser = pooled_browser.get()
+    pw = None
+    owns_browser = browser is None
+    context = None
+    capture = None
+    failed = False
+    sink = artifacts.sink_for_current_test()
+
+    try:
+        if owns_browser:
+            pw = await async_api.async_playwright().start()
+            browser = await launch_browser(pw)
+
+        if authenticated:
+            context_options["storage_state"] = str(await ensure_storage_state(browser))
+        context = await browser.new_context(**artifacts.context_options(sink), **context_options)
+        context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+        capture = await artifacts.Capture(context, sink).start()
+        yield context
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        if capture:
+            await capture.finish(failed)
+        if context:
+            await context.close()
+        if capture:
+            await capture.after_close()
+            if capture.target and owns_browser:
+                print(f"Failure artifacts saved to {capture.target}", flush=True)
+        if owns_browser and browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
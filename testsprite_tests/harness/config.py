@@ -0,0 +1,13 @@
+"""Suite settings shared by the harness, read from ``tmp/config.json``."""
+
+import json
+from pathlib import Path
+
+SUITE_DIR = Path(__file__).resolve().parent.parent
+TMP_DIR = SUITE_DIR / "tmp"
+
+_config = json.loads((TMP_DIR / "config.json").read_text())
+
+BASE_URL = _config.get("localEndpoint", "http://localhost:3000").rstrip("/")
+LOGIN_USER = _config["loginUser"]
+LOGIN_PASSWORD = _config["loginPassword"]
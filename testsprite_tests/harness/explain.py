@@ -0,0 +1,241 @@
+"""Check that the pages' queries are served by indexes, not sequential scans.
+
+Seeds enough rows that Postgres prefers an index wherever one applies, then
+asks PostgREST for the plan of each query the pages send (the same table,
+filters, ordering and embeds) and reports every ``Seq Scan`` on a large
+table, and every index scan that only filters rows instead of starting from
+an index condition (a keyset page with no bound walks the index from the
+top). A missing index in ``supabase/schema.sql``, or a missing bound in a
+page query, shows up here before it shows up as a slow page.
+
+PostgREST's plan of an RPC stops at the function call, so the ``rpc/``
+requests are instead run through ``psql`` with ``auto_explain`` (which the
+Supabase image preloads) logging the plan of every statement the function
+runs.
+
+Plans are requested as one of the fixture's users, so they include the row
+level security policies a signed-in visitor's queries run with; the
+service role would bypass them. The fixture is owned by its own users and
+deleted with them afterwards, so it does not linger for the tests that run
+next.
+
+PostgREST only returns plans with ``db-plan-enabled``, which this module
+switches on for the ``authenticator`` role while it runs and resets after;
+that needs ``psql`` (see ``harness.local_supabase.sql``).
+
+Usage (from the ``testsprite_tests`` directory, against the local stack)::
+
+    python -m harness.explain
+"""
+
+import json
+import sys
+import time
+import urllib.parse
+
+from harness import local_supabase, seed
+
+USERS = 20
+GIGS = 5000
+TICKETS = 4000
+OPEN_SHARE = 0.1
+BIDDED_TICKETS = 500
+BIDS_PER_TICKET = 4
+COMMUNITIES = 20
+POSTS = 5000
+TICKET_COMMENTS = 2000
+# Scanning a table this small is cheaper than an index lookup, so Postgres is right to.
+MIN_ROWS = 1000
+
+PLANS_ON = "alter role authenticator set pgrst.db_plan_enabled to 'true'; notify pgrst, 'reload config'"
+PLANS_OFF = "alter role authenticator reset pgrst.db_plan_enabled; notify pgrst, 'reload config'"
+
+# The select lists the pages send (lib/tickets.ts, lib/community.ts, lib/marketplace.ts).
+TICKET_CARD = "id,created_at,title,description,budget,deadline,category,status"
+BID = "id,created_at,ticket_id,bidder_id,amount,delivery_days,message,status,portfolio_links,profiles(full_name,avatar_url,username,role)"
+POST_CARD = "id,created_at,title,content,upvotes,comment_count,profiles(full_name,avatar_url,username),communities(name,slug)"
+GIG_CARD = "id,created_at,title,category,price,delivery_time,images,rating,review_count,profiles(full_name,avatar_url)"
+
+# (page, PostgREST path, query) for the reads each page makes. {user_id} (who
+# the plans are requested as, and owns {ticket_id}), {ticket_id}, {bid_id},
+# {community_id}, {comment_id} and the {gig_*} and {post_*} cursors come from the
+# seeded fixture. The query of an rpc/ path is the function's arguments.
+PAGE_QUERIES = [
+    ("/tickets", "tickets", f"select={TICKET_CARD}&status=eq.open&order=created_at.desc,id.desc&limit=25"),
+    ("/tickets/[id]", "rpc/get_ticket_view", "target_ticket_id={ticket_id}"),
+    ("/tickets/[id] (discussion)", "rpc/ticket_comment_page",
+     "target_ticket_id={ticket_id}&page_size=20&reply_limit=3&max_depth=2"),
+    ("/tickets/[id] (more replies)", "rpc/ticket_comment_page",
+     "target_ticket_id={ticket_id}&parent={comment_id}&page_size=10&reply_limit=3&max_depth=1"),
+    # The fallback when get_ticket_view is not deployed (fetchTicketViewParallel).
+    ("/tickets/[id]", "bids", "select=id&ticket_id=eq.{ticket_id}"),
+    ("/tickets/[id]", "bids", f"select={BID}&ticket_id=eq.{{ticket_id}}&order=created_at.desc"),
+    ("/marketplace", "gigs", f"select={GIG_CARD}&order=created_at.desc,id.desc&limit=25"),
+    # Without a search the facets count every gig, which has to read them all.
+    ("/marketplace?q=logo", "rpc/gig_category_facets", "query=logo"),
+    ("/marketplace", "gigs",
+     f"select={GIG_CARD}&category=eq.Web%20Development&order=created_at.desc,id.desc&limit=25"),
+    ("/marketplace (next page)", "gigs",
+     f"select={GIG_CARD}&order=created_at.desc,id.desc&limit=25&created_at=lte.{{gig_created_at}}"
+     "&or=(created_at.lt.%22{gig_created_at}%22,and(created_at.eq.%22{gig_created_at}%22,id.lt.{gig_id}))"),
+    ("/community", "posts", f"select={POST_CARD}&order=trending_score.desc,id.desc&limit=11"),
+    ("/community?sort=newest", "posts", f"select={POST_CARD}&order=created_at.desc,id.desc&limit=11"),
+    ("/community (next page)", "posts",
+     f"select={POST_CARD}&order=trending_score.desc,id.desc&limit=11&trending_score=lte.{{post_score}}"
+     "&or=(trending_score.lt.%22{post_score}%22,and(trending_score.eq.%22{post_score}%22,id.lt.{post_id}))"),
+    ("/community?sort=newest (next page)", "posts",
+     f"select={POST_CARD}&order=created_at.desc,id.desc&limit=11&created_at=lte.{{post_created_at}}"
+     "&or=(created_at.lt.%22{post_created_at}%22,and(created_at.eq.%22{post_created_at}%22,id.lt.{post_id}))"),
+    ("/community/[slug]", "posts", f"select={POST_CARD}&community_id=eq.{{community_id}}&order=created_at.desc"),
+    ("/profile", "gigs", f"select={GIG_CARD}&freelancer_id=eq.{{user_id}}"),
+    ("/profile", "tickets", f"select={TICKET_CARD}&created_by=eq.{{user_id}}"),
+    ("/profile", "posts", f"select={POST_CARD}&author_id=eq.{{user_id}}"),
+    ("command menu", "rpc/search_all", "query=logo&max_results=3"),
+]
+# (page, method, PostgREST path, query, body) for the writes whose row level
+# security policies look up other tables.
+PAGE_WRITES = [
+    ("/tickets/[id]", "PATCH", "bids", "id=eq.{bid_id}", {"status": "accepted"}),
+]
+CHECKED_TABLES = ("tickets", "bids", "ticket_comments", "gigs", "posts", "communities", "profiles")
+
+
+def seed_fixture(seeder):
+    """Seed the volumes above, spread over USERS new owners, and return the ids the queries need."""
+    users = seeder.users(USERS)
+    gigs = seeder.gigs(GIGS, users)
+
+    tickets = seed.ticket_rows(TICKETS, users, seeder.rng)
+    for ticket in tickets:
+        ticket["status"] = "open" if seeder.rng.random() < OPEN_SHARE else "completed"
+    tickets[0]["created_by"] = users[0]
+    seeder.insert("tickets", tickets)
+    bids = seeder.bids(BIDS_PER_TICKET, [t["id"] for t in tickets[:BIDDED_TICKETS]], users)
+    comments = seeder.ticket_comments(TICKET_COMMENTS, tickets[0]["id"], users)
+
+    communities = seeder.communities(COMMUNITIES)
+    posts = seeder.posts(POSTS, [c["id"] for c in communities], users)
+    # Cursors halfway down the marketplace and the community feed: the last row of
+    # some page deep in each. trending_score is computed by the database.
+    cursor = gigs[GIGS // 2]
+    post = seeder.select("posts", f"select=id,created_at,trending_score&id=eq.{posts[POSTS // 2]['id']}")[0]
+    return {
+        "user_id": users[0],
+        "ticket_id": tickets[0]["id"],
+        "bid_id": next(bid["id"] for bid in bids if bid["ticket_id"] == tickets[0]["id"]),
+        "comment_id": comments[0]["id"],
+        "community_id": communities[0]["id"],
+        "gig_created_at": urllib.parse.quote(cursor["created_at"], safe=""),
+        "gig_id": cursor["id"],
+        "post_id": post["id"],
+        "post_created_at": urllib.parse.quote(post["created_at"], safe=""),
+        "post_score": post["trending_score"],
+        "user_ids": users,
+        "community_ids": [c["id"] for c in communities],
+    }
+
+
+def remove_fixture(seeder, fixture):
+    """Delete everything seed_fixture created; its users' gigs, tickets, bids, comments and posts go with them."""
+    seeder.delete_users(fixture["user_ids"])
+    seeder.delete("communities", f"id=in.({','.join(fixture['community_ids'])})")
+
+
+def slow_scans(node, tables):
+    """How a plan (or plan node) reads any of ``tables`` without an index bound.
+
+    A ``Seq Scan``, or an index scan with a ``Filter`` but no ``Index Cond``,
+    which reads the index from the start and discards rows until it has enough.
+    """
+    node = node.get("Plan", node)
+    found = []
+    table = node.get("Relation Name")
+    if table in tables:
+        if node.get("Node Type") == "Seq Scan":
+            found.append(f"seq scan on {table}")
+        elif node.get("Node Type") in ("Index Scan", "Index Only Scan") and "Filter" in node and "Index Cond" not in node:
+            found.append(f"unbounded scan of {node['Index Name']} on {table}")
+    for child in node.get("Plans", []):
+        found.extend(slow_scans(child, tables))
+    return found
+
+
+def _literal(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def function_plans(path, query, user_id, settings):
+    """The plans of the statements the function behind ``rpc/<name>?query`` runs when ``user_id`` calls it."""
+    args = ", ".join(f"{name} => {_literal(value)}" for name, value in urllib.parse.parse_qsl(query))
+    claims = json.dumps({"sub": user_id, "role": "authenticated"})
+    notices = local_supabase.sql("; ".join([
+        "set auto_explain.log_min_duration = 0",
+        "set auto_explain.log_nested_statements = on",
+        "set auto_explain.log_format = json",
+        "set auto_explain.log_level = notice",
+        "set client_min_messages = notice",
+        f"select set_config('request.jwt.claims', {_literal(claims)}, false)",
+        "set role authenticated",
+        f"select * from public.{path.removeprefix('rpc/')}({args})",
+    ]), settings, notices=True)
+    # Each notice reads "duration: ... plan:" followed by the plan as JSON.
+    decoder = json.JSONDecoder()
+    plans = []
+    for notice in notices.split("NOTICE:")[1:]:
+        start = notice.find("{")
+        if start >= 0:
+            plans.append(decoder.raw_decode(notice[start:])[0])
+    return plans
+
+
+def check(seeder, fixture, tables, token, settings):
+    """(page, path, query, slow scans) for every page request that reads one of ``tables`` without an index bound.
+
+    Plans are requested with ``token``, the access token of the fixture's
+    ``user_id``; the ``rpc/`` calls are made as that user through ``psql``.
+    """
+    requests = [(page, "GET", path, query, None) for page, path, query in PAGE_QUERIES] + PAGE_WRITES
+    violations = []
+    for page, method, path, query, body in requests:
+        query = query.format(**fixture)
+        if path.startswith("rpc/"):
+            plans = function_plans(path, query, fixture["user_id"], settings)
+        else:
+            plans = [seeder.plan(path, query, token, method, body)]
+        scanned = [scan for plan in plans for scan in slow_scans(plan, tables)]
+        if scanned:
+            violations.append((page, path if method == "GET" else f"{method} {path}", query, scanned))
+    return violations
+
+
+def run(settings=None):
+    """Seed, analyze and check every page query; return the violations."""
+    settings = settings or local_supabase.status()
+    seeder = seed.Seeder(settings["API_URL"], settings["SERVICE_ROLE_KEY"], seed=time.time_ns())
+    fixture = seed_fixture(seeder)
+    try:
+        local_supabase.sql("analyze", settings)
+        large = {table for table in CHECKED_TABLES if seeder.count(table) >= MIN_ROWS}
+        token = seeder.sign_in(fixture["user_id"])
+
+        local_supabase.sql(PLANS_ON, settings)
+        try:
+            time.sleep(1)  # PostgREST reloads its config asynchronously
+            return check(seeder, fixture, large, token, settings)
+        finally:
+            local_supabase.sql(PLANS_OFF, settings)
+    finally:
+        remove_fixture(seeder, fixture)
+
+
+def main(argv=None):
+    violations = run()
+    for page, path, query, scanned in violations:
+        print(f"{page}: {', '.join(scanned)} for /rest/v1/{path}?{query}")
+    if not violations:
+        print(f"All {len(PAGE_QUERIES) + len(PAGE_WRITES)} page requests use indexes.")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,276 @@
+"""Load generation: replay the TC flows as concurrent virtual users.
+
+Each virtual user walks the marketplace and ticket flows covered by TC011 and
+TC014 (browse /marketplace, open /tickets/[id], post a ticket comment) over
+plain HTTP, using Playwright's API request client instead of a browser, so
+hundreds of users fit in one asyncio loop. Users start evenly across the
+ramp-up window and loop until the run ends. With ``--realtime`` each user also
+holds a realtime websocket subscribed to its ticket's comments, as
+TicketDiscussion does; that needs the optional ``websockets`` package.
+
+Usage (from the ``testsprite_tests`` directory, against the local stack)::
+
+    python -m harness.load --users 200 --ramp-up 30 --duration 120
+    python -m harness.load --users 50 --realtime
+
+Reports p50/p95/p99 latency, request count and error rate per step.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from harness import local_supabase
+from harness.config import BASE_URL, LOGIN_PASSWORD, LOGIN_USER
+
+try:
+    import websockets
+except ImportError:  # Only needed for --realtime.
+    websockets = None
+
+HEARTBEAT_S = 25
+
+
+class StepError(Exception):
+    pass
+
+
+@dataclass
+class StepStats:
+    latencies: list = field(default_factory=list)
+    errors: int = 0
+
+    @property
+    def count(self):
+        return len(self.latencies) + self.errors
+
+    def percentile(self, p):
+        if not self.latencies:
+            return float("nan")
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+@dataclass
+class Shared:
+    """State every virtual user reads: API settings, session and fixture ids."""
+    api_url: str
+    anon_key: str
+    access_token: str
+    user_id: str
+    ticket_ids: list
+
+
+class VirtualUser:
+    def __init__(self, index, shared, app, api, stats, events, think_time):
+        self.index = index
+        self.shared = shared
+        self.app = app
+        self.api = api
+        self.stats = stats
+        self.events = events
+        self.think_time = think_time
+        self.rng = random.Random(index)
+        self.ticket_id = self.rng.choice(shared.ticket_ids)
+
+    async def step(self, name, action):
+        started = time.perf_counter()
+        try:
+            await action()
+        except (StepError, async_api.Error, OSError, asyncio.TimeoutError):
+            self.stats[name].errors += 1
+        else:
+            self.stats[name].latencies.append(time.perf_counter() - started)
+
+    def _auth_headers(self):
+        return {
+            "apikey": self.shared.anon_key,
+            "Authorization": f"Bearer {self.shared.access_token}",
+        }
+
+    async def browse_marketplace(self):
+        _check(await self.app.get("/marketplace"))
+
+    async def open_ticket(self):
+        self.ticket_id = self.rng.choice(self.shared.ticket_ids)
+        _check(await self.app.get(f"/tickets/{self.ticket_id}"))
+
+    async def post_comment(self):
+        _check(await self.api.post(
+            "/rest/v1/ticket_comments",
+            headers={**self._auth_headers(), "Prefer": "return=minimal"},
+            data={
+                "ticket_id": self.ticket_id,
+                "author_id": self.shared.user_id,
+                "content": f"Load test comment from virtual user {self.index}",
+            },
+        ))
+
+    async def run(self, deadline):
+        flow = [
+            ("browse_marketplace", self.browse_marketplace),
+            ("open_ticket", self.open_ticket),
+            ("post_comment", self.post_comment),
+        ]
+        while time.monotonic() < deadline:
+            for name, action in flow:
+                await self.step(name, action)
+                await asyncio.sleep(self.rng.uniform(0.5, 1.5) * self.think_time)
+                if time.monotonic() >= deadline:
+                    return
+
+
+def _check(response):
+    if not response.ok:
+        raise StepError(f"{response.status} {response.url}")
+
+
+async def realtime_listener(user, deadline):
+    """Hold a realtime subscription to the user's ticket comments until ``deadline``."""
+    shared = user.shared
+    url = shared.api_url.replace("http", "ws", 1) + f"/realtime/v1/websocket?apikey={shared.anon_key}&vsn=1.0.0"
+    join = {
+        "topic": f"realtime:ticket-{user.ticket_id}",
+        "event": "phx_join",
+        "payload": {
+            "config": {"postgres_changes": [{
+                "event": "INSERT",
+                "schema": "public",
+                "table": "ticket_comments",
+                "filter": f"ticket_id=eq.{user.ticket_id}",
+            }]},
+            "access_token": shared.access_token,
+        },
+        "ref": "1",
+    }
+
+    async def connect_and_join():
+        socket = await websockets.connect(url)
+        await socket.send(json.dumps(join))
+        while True:
+            message = json.loads(await socket.recv())
+            if message.get("event") == "phx_reply" and message.get("ref") == "1":
+                if message["payload"].get("status") != "ok":
+                    raise StepError(f"join rejected: {message['payload']}")
+                return socket
+
+    started = time.perf_counter()
+    try:
+        socket = await asyncio.wait_for(connect_and_join(), timeout=10)
+    except (StepError, OSError, asyncio.TimeoutError, websockets.WebSocketException):
+        user.stats["realtime_join"].errors += 1
+        return
+    user.stats["realtime_join"].latencies.append(time.perf_counter() - started)
+
+    ref = 1
+    try:
+        while time.monotonic() < deadline:
+            try:
+                message = json.loads(await asyncio.wait_for(socket.recv(), timeout=HEARTBEAT_S))
+            except asyncio.TimeoutError:
+                ref += 1
+                await socket.send(json.dumps({"topic": "phoenix", "event": "heartbeat", "payload": {}, "ref": str(ref)}))
+                continue
+            if message.get("event") == "postgres_changes":
+                user.events["received"] += 1
+    except websockets.WebSocketException:
+        user.events["dropped"] += 1
+    finally:
+        await socket.close()
+
+
+async def prepare(pw, api_url, anon_key):
+    """Log in once and collect the ticket ids the virtual users will open."""
+    api = await pw.request.new_context(base_url=api_url, extra_http_headers={"apikey": anon_key})
+    try:
+        response = await api.post("/auth/v1/token?grant_type=password", data={
+            "email": LOGIN_USER,
+            "password": LOGIN_PASSWORD,
+        })
+        _check(response)
+        session = await response.json()
+        response = await api.get("/rest/v1/tickets?select=id&limit=500")
+        _check(response)
+        ticket_ids = [row["id"] for row in await response.json()]
+    finally:
+        await api.dispose()
+    if not ticket_ids:
+        raise SystemExit("No tickets to open; seed some first: python -m harness.seed --tickets 100")
+    return Shared(api_url, anon_key, session["access_token"], session["user"]["id"], ticket_ids)
+
+
+async def run_load(users, ramp_up, duration, think_time, realtime=False, api_url=None, anon_key=None):
+    if realtime and websockets is None:
+        raise SystemExit("--realtime needs the websockets package: pip install websockets")
+    if api_url is None or anon_key is None:
+        settings = local_supabase.status()
+        api_url = api_url or settings["API_URL"]
+        anon_key = anon_key or settings["ANON_KEY"]
+
+    stats = defaultdict(StepStats)
+    events = Counter()
+    async with async_api.async_playwright() as pw:
+        shared = await prepare(pw, api_url.rstrip("/"), anon_key)
+        app = await pw.request.new_context(base_url=BASE_URL)
+        api = await pw.request.new_context(base_url=shared.api_url)
+        deadline = time.monotonic() + ramp_up + duration
+
+        async def start_user(index):
+            await asyncio.sleep(ramp_up * index / users)
+            user = VirtualUser(index, shared, app, api, stats, events, think_time)
+            tasks = [user.run(deadline)]
+            if realtime:
+                tasks.append(realtime_listener(user, deadline))
+            await asyncio.gather(*tasks)
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(start_user(i) for i in range(users)))
+        finally:
+            await app.dispose()
+            await api.dispose()
+    return stats, events, time.perf_counter() - started
+
+
+def print_report(stats, events, elapsed):
+    print(f"{'step':<20} {'count':>7} {'errors':>7} {'err %':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    print("-" * 70)
+    for name, s in stats.items():
+        error_rate = 100 * s.errors / s.count if s.count else 0.0
+        print(
+            f"{name:<20} {s.count:>7} {s.errors:>7} {error_rate:>5.1f}% "
+            f"{s.percentile(50) * 1000:>8.1f} {s.percentile(95) * 1000:>8.1f} {s.percentile(99) * 1000:>8.1f}"
+        )
+    total = sum(s.count for s in stats.values())
+    print("-" * 70)
+    print(f"{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s)")
+    if events:
+        print(f"realtime: {events['received']} events received, {events['dropped']} connections dropped")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.load", description=__doc__.splitlines()[0])
+    parser.add_argument("-u", "--users", type=int, default=200, help="concurrent virtual users")
+    parser.add_argument("-r", "--ramp-up", type=float, default=30.0, help="seconds to start all users")
+    parser.add_argument("-d", "--duration", type=float, default=60.0, help="seconds at full load after ramp-up")
+    parser.add_argument("--think", type=float, default=1.0, help="mean think time between steps in seconds")
+    parser.add_argument("--realtime", action="store_true", help="also hold a realtime subscription per user")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    stats, events, elapsed = asyncio.run(run_load(args.users, args.ramp_up, args.duration, args.think, args.realtime))
+    print_report(stats, events, elapsed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""Local Supabase stack for offline, deterministic E2E runs.
+
+Wraps the Supabase CLI, which runs auth (GoTrue), PostgREST, realtime and a
+mail catcher on the loopback interface with the configuration in
+``supabase/config.toml``. Every reset applies ``supabase/schema.sql``,
+``enable_realtime.sql`` and ``seed.sql``, which includes an already-confirmed
+login user, so no test depends on the hosted project or a real inbox.
+
+Usage (from the ``testsprite_tests`` directory)::
+
+    python -m harness.local_supabase up      # start the stack, print app env
+    python -m harness.local_supabase reset   # re-apply schema and fixtures
+    python -m harness.local_supabase otp EMAIL
+    python -m harness.local_supabase sql "select pg_current_wal_lsn()"
+    python -m harness.local_supabase down
+
+Point the app at the stack by exporting the printed variables before
+``npm run dev``.
+"""
+
+import json
+import re
+import subprocess
+import sys
+import time
+import urllib.parse
+import urllib.request
+
+from harness.config import SUITE_DIR
+
+PROJECT_DIR = SUITE_DIR.parent
+SUPABASE_CLI = ["npx", "--yes", "supabase"]
+MAIL_URL = "http://127.0.0.1:54324"
+OTP_PATTERN = re.compile(r"\b(\d{6})\b")
+
+
+def _cli(*args, capture=False):
+    return subprocess.run(
+        [*SUPABASE_CLI, *args],
+        cwd=PROJECT_DIR,
+        check=True,
+        capture_output=capture,
+        text=True,
+    )
+
+
+def status():
+    """Return the running stack's settings (``API_URL``, ``ANON_KEY``, ``SERVICE_ROLE_KEY``, ``DB_URL``...)."""
+    out = _cli("status", "-o", "env", capture=True).stdout
+    settings = {}
+    for line in out.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            settings[key.strip()] = value.strip().strip('"')
+    return settings
+
+
+def sql(query, settings=None, notices=False):
+    """Run ``query`` against the stack's database with ``psql`` and return its unaligned output.
+
+    With ``notices``, return the notices it raised instead (``psql`` prints them to stderr).
+    """
+    settings = settings or status()
+    result = subprocess.run(
+        ["psql", settings["DB_URL"], "-v", "ON_ERROR_STOP=1", "-Atc", query],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return (result.stderr if notices else result.stdout).strip()
+
+
+def app_env(settings=None):
+    """Environment variables that point the Next.js app at the local stack."""
+    settings = settings or status()
+    return {
+        "NEXT_PUBLIC_SUPABASE_URL": settings["API_URL"],
+        "NEXT_PUBLIC_SUPABASE_ANON_KEY": settings["ANON_KEY"],
+    }
+
+
+def up():
+    _cli("start")
+    return status()
+
+
+def reset():
+    _cli("db", "reset")
+
+
+def down():
+    _cli("stop")
+
+
+def _get_json(path):
+    with urllib.request.urlopen(f"{MAIL_URL}{path}") as response:
+        return json.load(response)
+
+
+def latest_otp(email, timeout=10.0, poll=0.25):
+    """Return the newest 6-digit code mailed to ``email`` by the local auth server."""
+    query = urllib.parse.quote(f'to:"{email}"')
+    deadline = time.monotonic() + timeout
+    while True:
+        messages = _get_json(f"/api/v1/search?query={query}&limit=1").get("messages") or []
+        if messages:
+            message = _get_json(f"/api/v1/message/{messages[0]['ID']}")
+            match = OTP_PATTERN.search(message.get("Text", ""))
+            if match:
+                return match.group(1)
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"no OTP email for {email} within {timeout:g}s")
+        time.sleep(poll)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    command = argv[0] if argv else "up"
+    if command == "up":
+        for key, value in app_env(up()).items():
+            print(f"export {key}={value}")
+    elif command == "env":
+        for key, value in app_env().items():
+            print(f"export {key}={value}")
+    elif command == "reset":
+        reset()
+    elif command == "down":
+        down()
+    elif command == "otp" and len(argv) == 2:
+        print(latest_otp(argv[1]))
+    elif command == "sql" and len(argv) == 2:
+        print(sql(argv[1]))
+    else:
+        print(__doc__, file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
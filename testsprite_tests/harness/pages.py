@@ -0,0 +1,139 @@
+"""Page objects for the app's forms, built on role and label selectors.
+
+Locators are created once per page object and resolve against accessible
+names (``<Label htmlFor>``, button text) rather than absolute XPaths, so a
+layout change above a form does not break every test that touches it. Actions
+go through ``harness.steps`` for readiness waits and slow-locator reporting.
+"""
+
+from harness import steps
+from harness.config import BASE_URL
+
+
+class PageObject:
+    path = "/"
+
+    def __init__(self, page):
+        self.page = page
+
+    async def open(self):
+        await self.page.goto(f"{BASE_URL}{self.path}", timeout=10000)
+        await steps.settle(self.page)
+        return self
+
+
+class LoginPage(PageObject):
+    """app/(auth)/login/page.tsx"""
+    path = "/login"
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.email = page.get_by_label("Email")
+        self.password = page.get_by_label("Password", exact=True)
+        self.submit = page.get_by_role("button", name="Sign in")
+        self.signup_link = page.get_by_role("link", name="Sign up")
+
+    async def log_in(self, email, password):
+        await steps.fill(self.email, email)
+        await steps.fill(self.password, password)
+        await steps.click(self.submit)
+
+
+class SignupPage(PageObject):
+    """app/(auth)/signup/page.tsx"""
+    path = "/signup"
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.email = page.get_by_label("Email")
+        self.password = page.get_by_label("Password", exact=True)
+        self.submit = page.get_by_role("button", name="Sign up")
+
+    async def sign_up(self, email, password):
+        await steps.fill(self.email, email)
+        await steps.fill(self.password, password)
+        await steps.click(self.submit)
+
+
+class VerifyPage(PageObject):
+    """app/(auth)/verify/page.tsx"""
+    path = "/verify"
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.token = page.get_by_label("Verification Code")
+        self.submit = page.get_by_role("button", name="Verify")
+
+    async def verify(self, token):
+        await steps.fill(self.token, token)
+        await steps.click(self.submit)
+
+
+class ProfileForm(PageObject):
+    """components/profile/profile-form.tsx on /profile/edit"""
+    path = "/profile/edit"
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.username = page.get_by_label("Username")
+        self.full_name = page.get_by_label("Full Name")
+        self.bio = page.get_by_label("Bio")
+        self.website = page.get_by_label("Website")
+        self.submit = page.get_by_role("button", name="Update profile")
+
+    async def update(self, **fields):
+        for name, value in fields.items():
+            await steps.fill(getattr(self, name), value)
+        await steps.click(self.submit)
+
+
+async def _choose(page, trigger, option):
+    await steps.click(trigger)
+    await steps.click(page.get_by_role("option", name=option, exact=True))
+
+
+class TicketForm(PageObject):
+    """components/tickets/ticket-form.tsx on /tickets/new"""
+    path = "/tickets/new"
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.title = page.get_by_label("Title")
+        self.category = page.get_by_label("Category")
+        self.budget = page.get_by_label("Budget ($)")
+        self.deadline = page.get_by_label("Deadline")
+        self.description = page.get_by_label("Description")
+        self.submit = page.get_by_role("button", name="Post Ticket")
+
+    async def create(self, title, category, budget, deadline, description):
+        await steps.fill(self.title, title)
+        await _choose(self.page, self.category, category)
+        await steps.fill(self.budget, str(budget))
+        await steps.fill(self.deadline, deadline)
+        await steps.fill(self.description, description)
+        await steps.click(self.submit)
+
+
+class GigForm(PageObject):
+    """components/marketplace/gig-form.tsx on /marketplace/new"""
+    path = "/marketplace/new"
+
+    def __init__(self, page):
+        super().__init__(page)
+        self.title = page.get_by_label("Gig Title")
+        self.category = page.get_by_label("Category")
+        self.description = page.get_by_label("Description")
+        self.price = page.get_by_label("Price ($)")
+        self.delivery_time = page.get_by_label("Delivery Time (Days)")
+        self.image_url = page.get_by_label("Cover Image URL")
+        self.submit = page.get_by_role("button", name="Publish Gig")
+
+    async def create(self, title, category, description, price, delivery_time, image_url=""):
+        await steps.fill(self.title, title)
+        await _choose(self.page, self.category, category)
+        await steps.fill(self.description, description)
+        await steps.fill(self.price, str(price))
+        await steps.fill(self.delivery_time, str(delivery_time))
+        if image_url:
+            await steps.fill(self.image_url, image_url)
+        await steps.click(self.submit)
@@ -0,0 +1,173 @@
+"""Page-level performance capture and budget checks.
+
+``attach(page)`` records one sample per main-frame navigation: full page loads
+from ``page.goto`` and client-side route changes alike. A sample holds
+Navigation Timing (TTFB, DOMContentLoaded, load), the largest contentful
+paint, the JS heap size, the number of requests the navigation issued and
+the size of the HTML document, which carries the server components'
+serialized props.
+
+Budgets live in ``perf_budgets.json`` next to the TC scripts, keyed by route
+pattern in Next.js notation (``/tickets/[id]``); ``assert_within_budget``
+fails the test with every metric that went over.
+"""
+
+import asyncio
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from playwright import async_api
+
+from harness.config import SUITE_DIR
+
+BUDGETS_PATH = SUITE_DIR / "perf_budgets.json"
+SETTLE_TIMEOUT_MS = 5000
+
+# Keeps the latest LCP candidate on window so it can be read after load.
+_LCP_OBSERVER = """
+window.__perfLcp = 0;
+try {
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) window.__perfLcp = entry.startTime;
+    }).observe({ type: "largest-contentful-paint", buffered: true });
+} catch (e) {}
+"""
+
+_READ_METRICS = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    return {
+        timeOrigin: performance.timeOrigin,
+        ttfb_ms: nav ? nav.responseStart - nav.requestStart : null,
+        dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd : null,
+        load_ms: nav ? nav.loadEventEnd : null,
+        document_bytes: nav ? nav.decodedBodySize : null,
+        lcp_ms: window.__perfLcp || null,
+        js_heap_bytes: performance.memory ? performance.memory.usedJSHeapSize : null,
+    };
+}
+"""
+
+
+@dataclass
+class Sample:
+    url: str
+    kind: str  # "load" for a document navigation, "route" for a client-side route change
+    metrics: dict = field(default_factory=dict)
+
+    @property
+    def path(self):
+        return urlparse(self.url).path or "/"
+
+
+class Recorder:
+    def __init__(self, page):
+        self.page = page
+        self.samples = []
+        self._requests = 0
+        # Request counts at the last document request and at the end of the
+        # previous sample; a sample's request count is measured from one of them.
+        self._nav_mark = 0
+        self._sample_mark = 0
+        self._time_origin = None
+        self._pending = []
+
+    async def _install(self):
+        await self.page.add_init_script(_LCP_OBSERVER)
+        self.page.on("request", self._on_request)
+        self.page.on("framenavigated", self._on_navigated)
+
+    def _on_request(self, request):
+        if request.is_navigation_request() and request.frame == self.page.main_frame:
+            self._nav_mark = self._requests
+        self._requests += 1
+
+    def _on_navigated(self, frame):
+        if frame != self.page.main_frame:
+            return
+        capture = self._capture(frame.url, time.perf_counter(), self._nav_mark)
+        self._pending.append(asyncio.ensure_future(capture))
+
+    async def _capture(self, url, started, nav_mark):
+        try:
+            await self.page.wait_for_load_state("load", timeout=SETTLE_TIMEOUT_MS)
+            await self.page.wait_for_load_state("networkidle", timeout=SETTLE_TIMEOUT_MS)
+        except async_api.Error:
+            pass
+        try:
+            metrics = await self.page.evaluate(_READ_METRICS)
+        except async_api.Error:
+            return  # The page navigated again or closed before it settled.
+
+        time_origin = metrics.pop("timeOrigin")
+        kind = "route" if time_origin == self._time_origin else "load"
+        self._time_origin = time_origin
+        if kind == "route":
+            # Navigation Timing and LCP still describe the original document
+            # load, and the route's data fetch precedes the URL change.
+            metrics = {"js_heap_bytes": metrics["js_heap_bytes"]}
+            mark = self._sample_mark
+        else:
+            mark = nav_mark
+        metrics["duration_ms"] = (time.perf_counter() - started) * 1000
+        metrics["requests"] = self._requests - mark
+        self._sample_mark = self._requests
+        self.samples.append(Sample(url=url, kind=kind, metrics=metrics))
+
+    async def finish(self):
+        """Wait for outstanding captures and return every sample recorded so far."""
+        pending, self._pending = self._pending, []
+        await asyncio.gather(*pending)
+        return self.samples
+
+
+async def attach(page):
+    """Start recording performance samples for every navigation of ``page``."""
+    recorder = Recorder(page)
+    await recorder._install()
+    return recorder
+
+
+def _route_regex(pattern):
+    parts = (r"[^/]+" if re.fullmatch(r"\[[^\]]+\]", part) else re.escape(part) for part in pattern.split("/"))
+    return re.compile("/".join(parts) + "/?")
+
+
+def load_budgets(path=BUDGETS_PATH):
+    return json.loads(path.read_text())
+
+
+def budget_for(path, budgets):
+    """Return the budget for a URL path: its route entry merged over the defaults."""
+    budget = dict(budgets.get("default", {}))
+    for pattern, route_budget in budgets.get("routes", {}).items():
+        if _route_regex(pattern).fullmatch(path):
+            budget.update(route_budget)
+            break
+    return budget
+
+
+def violations(samples, budgets):
+    """Return ``(sample, metric, value, limit)`` for every metric over budget."""
+    found = []
+    for sample in samples:
+        for metric, limit in budget_for(sample.path, budgets).items():
+            value = sample.metrics.get(metric)
+            if value is not None and value > limit:
+                found.append((sample, metric, value, limit))
+    return found
+
+
+async def assert_within_budget(recorder, budgets=None):
+    samples = await recorder.finish()
+    over = violations(samples, budgets or load_budgets())
+    if over:
+        lines = [
+            f"{sample.path} ({sample.kind}): {metric} {value:,.0f} > {limit:,.0f}"
+            for sample, metric, value, limit in over
+        ]
+        raise AssertionError("Performance budget exceeded:\n" + "\n".join(lines))
+    return samples
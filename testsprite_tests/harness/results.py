@@ -0,0 +1,234 @@
+"""Append-only store of test attempts, kept in SQLite.
+
+Every attempt the runner makes is written as one row the moment it finishes:
+status, timings, error and artifact paths, but not the test source. Reports
+are rendered by streaming rows from a cursor, and the history across runs
+can be queried for flaky tests and duration trends.
+
+Usage (from the ``testsprite_tests`` directory)::
+
+    python -m harness.results report [--run RUN_ID] [-o report.md]
+    python -m harness.results flaky [--runs 20]
+    python -m harness.results history TC003_User_Login_with_Correct_Credentials
+    python -m harness.results import-legacy tmp/test_results.json
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import uuid
+from contextlib import closing
+from datetime import datetime, timezone
+from pathlib import Path
+
+from harness.config import TMP_DIR
+
+STORE_PATH = TMP_DIR / "results.sqlite3"
+
+SCHEMA = """
+create table if not exists runs (
+    id text primary key,
+    started_at text not null,
+    finished_at text,
+    source text not null default 'runner'
+);
+
+create table if not exists attempts (
+    id integer primary key,
+    run_id text not null references runs(id),
+    test text not null,
+    attempt integer not null default 1,
+    status text not null,
+    started_at text not null,
+    duration real,
+    error text,
+    steps integer,
+    waited real,
+    artifacts text not null default '[]'
+);
+
+create index if not exists attempts_run_idx on attempts (run_id, test);
+create index if not exists attempts_test_idx on attempts (test, run_id);
+"""
+
+STATUS_ICONS = {"passed": "✅ Passed", "failed": "❌ Failed", "timeout": "⏱️ Timed out", "error": "❌ Error"}
+
+
+def _now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class ResultStore:
+    def __init__(self, path=STORE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def start_run(self, source="runner", started_at=None):
+        run_id = uuid.uuid4().hex[:12]
+        with self.db:
+            self.db.execute(
+                "insert into runs (id, started_at, source) values (?, ?, ?)",
+                (run_id, started_at or _now(), source),
+            )
+        return run_id
+
+    def finish_run(self, run_id):
+        with self.db:
+            self.db.execute("update runs set finished_at = ? where id = ?", (_now(), run_id))
+
+    def record(self, run_id, test, status, started_at, duration=None, error="",
+               attempt=1, steps=None, waited=None, artifacts=()):
+        """Append one attempt; committed immediately so a crashed run keeps its results."""
+        with self.db:
+            self.db.execute(
+                """insert into attempts
+                   (run_id, test, attempt, status, started_at, duration, error, steps, waited, artifacts)
+                   values (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (run_id, test, attempt, status, started_at, duration, error or None,
+                 steps, waited, json.dumps([str(a) for a in artifacts])),
+            )
+
+    def latest_run_id(self):
+        row = self.db.execute("select id from runs order by started_at desc limit 1").fetchone()
+        return row["id"] if row else None
+
+    def iter_attempts(self, run_id):
+        """Yield the final attempt of every test in ``run_id``, in test order."""
+        yield from self.db.execute(
+            """select a.*, (select count(*) from attempts b
+                            where b.run_id = a.run_id and b.test = a.test) as attempts
+               from attempts a
+               where a.run_id = ? and a.attempt = (
+                   select max(attempt) from attempts b where b.run_id = a.run_id and b.test = a.test)
+               order by a.test""",
+            (run_id,),
+        )
+
+    def flaky(self, last_runs=20):
+        """Tests that both passed and failed within the last ``last_runs`` runs."""
+        return self.db.execute(
+            """with recent as (select id from runs order by started_at desc limit ?)
+               select test,
+                      sum(status = 'passed') as passed,
+                      sum(status != 'passed') as failed,
+                      count(distinct run_id) as runs
+               from attempts
+               where run_id in (select id from recent)
+               group by test
+               having passed > 0 and failed > 0
+               order by failed * 1.0 / (passed + failed) desc, test""",
+            (last_runs,),
+        ).fetchall()
+
+    def history(self, test, last_runs=20):
+        """Per-run status and duration of ``test``, newest first."""
+        return self.db.execute(
+            """select r.id as run_id, r.started_at, a.status, a.duration, a.attempt
+               from attempts a join runs r on r.id = a.run_id
+               where a.test = ?
+               order by r.started_at desc, a.attempt desc
+               limit ?""",
+            (test, last_runs),
+        ).fetchall()
+
+    def import_legacy(self, path):
+        """Load a TestSprite ``test_results.json`` export as one run, dropping the embedded code."""
+        records = json.loads(path.read_text())
+        started = min((r.get("created") for r in records if r.get("created")), default=None)
+        run_id = self.start_run(source="testsprite", started_at=started)
+        for r in records:
+            self.record(
+                run_id,
+                test=re.sub(r"[^A-Za-z0-9]", "_", r["title"]),
+                status="passed" if r.get("testStatus") == "PASSED" else "failed",
+                started_at=r.get("created") or _now(),
+                error=r.get("testError", ""),
+                artifacts=[r["testVisualization"]] if r.get("testVisualization") else [],
+            )
+        self.finish_run(run_id)
+        return run_id
+
+
+def render_report(store, run_id, out):
+    """Write a markdown report for ``run_id`` to ``out`` one test at a time."""
+    run = store.db.execute("select * from runs where id = ?", (run_id,)).fetchone()
+    out.write("# Test Report\n\n---\n\n## Run Metadata\n")
+    out.write(f"- **Run:** {run['id']} ({run['source']})\n")
+    out.write(f"- **Started:** {run['started_at']}\n\n---\n\n## Results\n\n")
+
+    counts = {}
+    for row in store.iter_attempts(run_id):
+        counts[row["status"]] = counts.get(row["status"], 0) + 1
+        code = row["test"] + ".py"
+        out.write(f"#### {row['test'][:5]}\n")
+        out.write(f"- **Test Name:** {row['test'][6:].replace('_', ' ')}\n")
+        out.write(f"- **Test Code:** [{code}](./{code})\n")
+        if row["error"]:
+            out.write(f"- **Test Error:** {row['error']}\n")
+        if row["duration"] is not None:
+            out.write(f"- **Duration:** {row['duration']:.2f}s")
+            if row["attempts"] > 1:
+                out.write(f" (attempt {row['attempt']} of {row['attempts']})")
+            out.write("\n")
+        for artifact in json.loads(row["artifacts"]):
+            out.write(f"- **Artifact:** {artifact}\n")
+        out.write(f"- **Status:** {STATUS_ICONS.get(row['status'], row['status'])}\n---\n\n")
+
+    total = sum(counts.values())
+    out.write("## Summary\n\n")
+    out.write(f"- **Passed:** {counts.get('passed', 0)} / {total}\n")
+    for status in ("failed", "timeout", "error"):
+        if counts.get(status):
+            out.write(f"- **{status.capitalize()}:** {counts[status]}\n")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.results", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    report = sub.add_parser("report", help="render a markdown report for one run")
+    report.add_argument("--run", help="run id (default: latest)")
+    report.add_argument("-o", "--output", help="write to a file instead of stdout")
+    flaky = sub.add_parser("flaky", help="tests with mixed results in recent runs")
+    flaky.add_argument("--runs", type=int, default=20)
+    history = sub.add_parser("history", help="status and duration of one test across runs")
+    history.add_argument("test")
+    history.add_argument("--runs", type=int, default=20)
+    legacy = sub.add_parser("import-legacy", help="import a TestSprite test_results.json")
+    legacy.add_argument("path", nargs="?", default=str(TMP_DIR / "test_results.json"))
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with closing(ResultStore()) as store:
+        if args.command == "report":
+            run_id = args.run or store.latest_run_id()
+            if run_id is None:
+                print("No runs recorded yet.", file=sys.stderr)
+                return 1
+            if args.output:
+                with open(args.output, "w", encoding="utf-8") as out:
+                    render_report(store, run_id, out)
+            else:
+                render_report(store, run_id, sys.stdout)
+        elif args.command == "flaky":
+            for row in store.flaky(args.runs):
+                print(f"{row['test']}: {row['failed']} failed / {row['passed']} passed over {row['runs']} runs")
+        elif args.command == "history":
+            for row in store.history(args.test, args.runs):
+                duration = f"{row['duration']:.2f}s" if row["duration"] is not None else "-"
+                print(f"{row['started_at']}  {row['run_id']}  #{row['attempt']}  {row['status']:<8} {duration}")
+        elif args.command == "import-legacy":
+            print(store.import_legacy(Path(args.path)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
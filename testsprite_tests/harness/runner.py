@@ -0,0 +1,247 @@
+"""Run the TC suite in parallel on a pool of worker browsers.
+
+Usage (from the ``testsprite_tests`` directory)::
+
+    python -m harness.runner                  # every TC*.py, one worker per core
+    python -m harness.runner -w 4 -t 60       # 4 browsers, 60s per test
+    python -m harness.runner TC003 TC006      # only the matching cases
+    python -m harness.runner --retries 2      # re-run failures, recording each attempt
+    python -m harness.runner --video          # also keep videos of failing tests
+
+Every worker owns one Chromium process and pulls tests off a shared queue.
+Each test gets a fresh context on its worker's browser, so cases stay isolated
+while the browser cold start is paid once per worker instead of once per test.
+Every attempt is appended to the results store (see ``harness.results``), with
+the trace and HAR of failing attempts (see ``harness.artifacts``).
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+import time
+import traceback
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+from harness import artifacts
+from harness.auth import is_fresh, log_in
+from harness.browser import launch_browser, pooled_browser
+from harness.results import ResultStore
+from harness.steps import FIXED_STEP_DELAY_S, StepTimings, step_timings
+
+SUITE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_TIMEOUT_S = 120.0
+
+
+@dataclass
+class TestCase:
+    name: str
+    path: Path
+    run_test: object = None
+
+
+@dataclass
+class TestResult:
+    name: str
+    status: str  # "passed", "failed", "timeout" or "error"
+    duration: float
+    worker: int
+    started_at: str
+    attempt: int = 1
+    error: str = ""
+    timings: StepTimings = None
+    artifacts: list = field(default_factory=list)
+
+
+def discover(patterns=None, suite_dir=SUITE_DIR):
+    """Return the TC scripts in ``suite_dir``, optionally filtered by substring."""
+    cases = []
+    for path in sorted(suite_dir.glob("TC*.py")):
+        name = path.stem
+        if patterns and not any(p in name for p in patterns):
+            continue
+        cases.append(TestCase(name=name, path=path))
+    return cases
+
+
+def load(case):
+    """Import a TC script and attach its ``run_test`` coroutine function."""
+    spec = importlib.util.spec_from_file_location(case.name, case.path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    case.run_test = module.run_test
+    return case
+
+
+async def run_case(case, worker, timeout, attempt=1, capture=None):
+    timings = StepTimings()
+    step_timings.set(timings)
+    sink = artifacts.Sink(case.name, attempt, capture or artifacts.CaptureOptions())
+    artifacts.current_sink.set(sink)
+    started_at = datetime.now(timezone.utc).isoformat()
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(case.run_test(), timeout=timeout)
+        status, error = "passed", ""
+    except asyncio.TimeoutError:
+        status, error = "timeout", f"exceeded {timeout:g}s"
+    except AssertionError as e:
+        status, error = "failed", str(e) or "assertion failed"
+    except Exception as e:
+        status, error = "error", "".join(traceback.format_exception_only(type(e), e)).strip()
+    return TestResult(
+        name=case.name,
+        status=status,
+        duration=time.perf_counter() - started,
+        worker=worker,
+        started_at=started_at,
+        attempt=attempt,
+        error=error,
+        timings=timings,
+        artifacts=sink.paths,
+    )
+
+
+async def worker_loop(worker, pw, queue, results, timeout, retries, capture, on_result):
+    browser = await launch_browser(pw)
+    pooled_browser.set(browser)
+    try:
+        while True:
+            try:
+                case = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            for attempt in range(1, retries + 2):
+                result = await run_case(case, worker, timeout, attempt, capture)
+                on_result(result)
+                if result.status == "passed":
+                    break
+            results.append(result)
+    finally:
+        await browser.close()
+
+
+async def warm_login(pw):
+    """Setup phase: refresh the shared login session before any test starts.
+
+    A failed login is reported but not fatal; tests that need the session will
+    retry it themselves and fail individually.
+    """
+    if is_fresh():
+        return
+    browser = await launch_browser(pw)
+    try:
+        await log_in(browser)
+        print("Logged in and cached storage state", flush=True)
+    except Exception as e:
+        print(f"Login setup failed: {e}", file=sys.stderr, flush=True)
+    finally:
+        await browser.close()
+
+
+async def run_suite(cases, workers, timeout, retries=0, capture=None, on_result=lambda result: None):
+    """Schedule ``cases`` across ``workers`` browsers and return their results."""
+    queue = asyncio.Queue()
+    for case in cases:
+        queue.put_nowait(case)
+
+    results = []
+    workers = max(1, min(workers, len(cases)))
+    async with async_api.async_playwright() as pw:
+        await warm_login(pw)
+        await asyncio.gather(*(
+            worker_loop(i, pw, queue, results, timeout, retries, capture, on_result)
+            for i in range(workers)
+        ))
+
+    order = {case.name: i for i, case in enumerate(cases)}
+    return sorted(results, key=lambda r: order[r.name])
+
+
+def print_result(result):
+    attempt = f" attempt {result.attempt}" if result.attempt > 1 else ""
+    print(f"[w{result.worker}] {result.status.upper():8} {result.name} ({result.duration:.2f}s{attempt})", flush=True)
+
+
+def store_result(store, run_id, result):
+    store.record(
+        run_id,
+        test=result.name,
+        status=result.status,
+        started_at=result.started_at,
+        duration=result.duration,
+        error=result.error,
+        attempt=result.attempt,
+        steps=result.timings.steps,
+        waited=result.timings.waited,
+        artifacts=result.artifacts,
+    )
+
+
+def print_summary(results, wall_time):
+    width = max((len(r.name) for r in results), default=10)
+    print()
+    print(f"{'test':<{width}}  {'status':<8}  {'time':>8}  {'steps':>5}  {'waited':>8}  {'saved':>8}")
+    print("-" * (width + 47))
+    for r in results:
+        t = r.timings
+        print(f"{r.name:<{width}}  {r.status:<8}  {r.duration:>7.2f}s  {t.steps:>5}  {t.waited:>7.2f}s  {t.saved:>7.2f}s")
+        if r.error:
+            print(f"{'':<{width}}    {r.error.splitlines()[0]}")
+        for path in r.artifacts:
+            print(f"{'':<{width}}    artifacts: {path}")
+    print("-" * (width + 47))
+
+    passed = sum(r.status == "passed" for r in results)
+    serial = sum(r.duration for r in results)
+    saved = sum(r.timings.saved for r in results)
+    print(f"{passed}/{len(results)} passed in {wall_time:.2f}s wall ({serial:.2f}s summed test time)")
+    print(f"Readiness waits saved {saved:.2f}s against a fixed {FIXED_STEP_DELAY_S:g}s delay per step")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.runner", description=__doc__.splitlines()[0])
+    parser.add_argument("patterns", nargs="*", help="only run TC scripts whose name contains one of these")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="number of worker browsers (default: CPU count)")
+    parser.add_argument("-t", "--timeout", type=float, default=DEFAULT_TIMEOUT_S,
+                        help=f"per-test timeout in seconds (default: {DEFAULT_TIMEOUT_S:g})")
+    parser.add_argument("-r", "--retries", type=int, default=0,
+                        help="re-run a failing test up to this many times")
+    parser.add_argument("--video", action="store_true", help="record video and keep it for failing tests")
+    parser.add_argument("--no-trace", dest="trace", action="store_false", help="do not record Playwright traces")
+    parser.add_argument("--no-har", dest="har", action="store_false", help="do not keep a network log")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cases = [load(case) for case in discover(args.patterns)]
+    if not cases:
+        print("No TC scripts matched.", file=sys.stderr)
+        return 2
+
+    capture = artifacts.CaptureOptions(trace=args.trace, har=args.har, video=args.video)
+    with closing(ResultStore()) as store:
+        run_id = store.start_run()
+
+        def on_result(result):
+            print_result(result)
+            store_result(store, run_id, result)
+
+        started = time.perf_counter()
+        results = asyncio.run(run_suite(cases, args.workers, args.timeout, args.retries, capture, on_result))
+        store.finish_run(run_id)
+    print_summary(results, time.perf_counter() - started)
+    print(f"Results stored as run {run_id}; render with: python -m harness.results report --run {run_id}")
+    return 0 if all(r.status == "passed" for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
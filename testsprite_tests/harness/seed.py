@@ -0,0 +1,329 @@
+"""Bulk fixtures for the tables in ``supabase/schema.sql``.
+
+Rows are generated in Python and written with one PostgREST request per table
+using the service role key, so tests can build state in milliseconds instead of
+clicking through the gig, ticket and post forms. Volume is a parameter: the
+same calls seed ten rows for a feature test or 100k for a scale run.
+
+Usage (from the ``testsprite_tests`` directory, against the local stack)::
+
+    python -m harness.seed --gigs 50 --tickets 20 --bids 5 --posts 30
+    python -m harness.seed --gigs 100000 --freelancers 200
+
+Generated ids and emails are deterministic per ``--seed``, so run
+``python -m harness.local_supabase reset`` (or pick another seed) before
+seeding the same volume twice.
+"""
+
+import argparse
+import json
+import random
+import sys
+import uuid
+import urllib.request
+from datetime import datetime, timedelta, timezone
+
+from harness import local_supabase
+
+# Confirmed login user created by supabase/seed.sql.
+LOGIN_USER_ID = "11111111-1111-1111-1111-111111111111"
+# Password of every user Seeder.users creates.
+SEED_PASSWORD = "seed-password"
+
+GIG_CATEGORIES = [
+    "Web Development",
+    "Mobile Development",
+    "Design & Creative",
+    "Writing & Translation",
+    "Digital Marketing",
+    "Video & Animation",
+    "Music & Audio",
+    "Programming & Tech",
+    "Business",
+    "AI Services",
+]
+TICKET_CATEGORIES = ["Development", "Design", "Writing", "Marketing", "Other"]
+WORDS = (
+    "build design landing page api dashboard mobile app logo brand copy "
+    "audit migrate scale optimize launch integrate redesign automate"
+).split()
+
+
+def _uuid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _words(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def _timestamps(rng, count, span_days=365):
+    """``count`` ISO timestamps spread over the last ``span_days``, newest first."""
+    now = datetime.now(timezone.utc)
+    offsets = sorted(rng.uniform(0, span_days * 86400) for _ in range(count))
+    return [(now - timedelta(seconds=s)).isoformat() for s in offsets]
+
+
+def gig_rows(count, freelancer_ids, rng):
+    return [
+        {
+            "id": _uuid(rng),
+            "created_at": created_at,
+            "title": f"I will {_words(rng, 5).lower()}",
+            "description": _words(rng, 40),
+            "price": rng.randrange(5, 2000, 5),
+            "delivery_time": rng.randint(1, 30),
+            "category": rng.choice(GIG_CATEGORIES),
+            "freelancer_id": rng.choice(freelancer_ids),
+            "rating": round(rng.uniform(3.5, 5.0), 1),
+            "review_count": rng.randint(0, 500),
+        }
+        for created_at in _timestamps(rng, count)
+    ]
+
+
+def ticket_rows(count, owner_ids, rng):
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": _uuid(rng),
+            "created_at": created_at,
+            "title": _words(rng, 6),
+            "description": _words(rng, 60),
+            "budget": rng.randrange(50, 10000, 50),
+            "deadline": (now + timedelta(days=rng.randint(3, 90))).isoformat(),
+            "category": rng.choice(TICKET_CATEGORIES),
+            "created_by": rng.choice(owner_ids),
+        }
+        for created_at in _timestamps(rng, count)
+    ]
+
+
+def bid_rows(per_ticket, ticket_ids, bidder_ids, rng):
+    rows = []
+    for ticket_id in ticket_ids:
+        # A user bids at most once per ticket.
+        for bidder_id in rng.sample(bidder_ids, min(per_ticket, len(bidder_ids))):
+            rows.append({
+                "id": _uuid(rng),
+                "ticket_id": ticket_id,
+                "bidder_id": bidder_id,
+                "amount": rng.randrange(50, 10000, 50),
+                "delivery_days": rng.randint(1, 60),
+                "message": _words(rng, 30),
+            })
+    return rows
+
+
+def community_rows(count, rng):
+    rows = []
+    for i in range(count):
+        name = f"{_words(rng, 2)} {i}"
+        rows.append({
+            "id": _uuid(rng),
+            "name": name,
+            "slug": name.lower().replace(" ", "-"),
+            "description": _words(rng, 12),
+            "member_count": rng.randint(0, 5000),
+        })
+    return rows
+
+
+def post_rows(count, community_ids, author_ids, rng):
+    return [
+        {
+            "id": _uuid(rng),
+            "created_at": created_at,
+            "title": _words(rng, 8),
+            "content": _words(rng, 50),
+            "author_id": rng.choice(author_ids),
+            "community_id": rng.choice(community_ids),
+            "upvotes": rng.randint(0, 1000),
+        }
+        for created_at in _timestamps(rng, count, span_days=60)
+    ]
+
+
+def ticket_comment_rows(count, ticket_id, author_ids, rng, reply_share=0.5):
+    """A discussion of ``count`` comments, oldest first; about ``reply_share`` are replies to earlier ones."""
+    rows = []
+    for created_at in reversed(_timestamps(rng, count, span_days=30)):
+        parent = rng.choice(rows)["id"] if rows and rng.random() < reply_share else None
+        rows.append({
+            "id": _uuid(rng),
+            "created_at": created_at,
+            "content": _words(rng, 20),
+            "ticket_id": ticket_id,
+            "author_id": rng.choice(author_ids),
+            "parent_id": parent,
+        })
+    return rows
+
+
+class Seeder:
+    """Writes generated rows to a Supabase project through PostgREST."""
+
+    def __init__(self, api_url=None, service_key=None, seed=0):
+        if api_url is None or service_key is None:
+            settings = local_supabase.status()
+            api_url = api_url or settings["API_URL"]
+            service_key = service_key or settings["SERVICE_ROLE_KEY"]
+        self.api_url = api_url.rstrip("/")
+        self.service_key = service_key
+        self.rng = random.Random(seed)
+        self.emails = {}  # user id -> email, for the users this seeder created
+
+    def _request(self, method, path, body=None, prefer=None, accept=None, token=None):
+        """Call the API with the service role, or as the user whose access ``token`` is given."""
+        headers = {
+            "apikey": self.service_key,
+            "Authorization": f"Bearer {token or self.service_key}",
+            "Content-Type": "application/json",
+        }
+        if prefer:
+            headers["Prefer"] = prefer
+        if accept:
+            headers["Accept"] = accept
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(f"{self.api_url}{path}", data=data, headers=headers, method=method)
+        with urllib.request.urlopen(request) as response:
+            payload = response.read()
+        return json.loads(payload) if payload else None
+
+    def insert(self, table, rows, upsert=False):
+        """Insert ``rows`` into ``table`` in a single request and return them."""
+        if rows:
+            prefer = "return=minimal"
+            if upsert:
+                prefer += ",resolution=merge-duplicates"
+            self._request("POST", f"/rest/v1/{table}", rows, prefer=prefer)
+        return rows
+
+    def select(self, table, query="select=*"):
+        """Rows of ``table`` matching a PostgREST query string, bypassing RLS."""
+        return self._request("GET", f"/rest/v1/{table}?{query}")
+
+    def update(self, table, query, values):
+        """Apply ``values`` to the rows of ``table`` matching a PostgREST query string."""
+        self._request("PATCH", f"/rest/v1/{table}?{query}", values, prefer="return=minimal")
+
+    def delete(self, table, query):
+        """Delete the rows of ``table`` matching a PostgREST query string."""
+        self._request("DELETE", f"/rest/v1/{table}?{query}", prefer="return=minimal")
+
+    def plan(self, path, query, token=None, method="GET", body=None):
+        """The plan Postgres picks for the PostgREST request ``method path?query`` (see ``harness.explain``).
+
+        With a user's access ``token`` the plan includes the row level security
+        policies that apply to them; the service role bypasses them. Writes are
+        planned, not run.
+        """
+        plan = self._request(
+            method, f"/rest/v1/{path}?{query}", body, accept="application/vnd.pgrst.plan+json", token=token
+        )
+        return plan[0] if isinstance(plan, list) else plan
+
+    def sign_in(self, user_id):
+        """An access token for a user this seeder created."""
+        session = self._request("POST", "/auth/v1/token?grant_type=password", {
+            "email": self.emails[user_id],
+            "password": SEED_PASSWORD,
+        })
+        return session["access_token"]
+
+    def count(self, table):
+        """Exact row count of ``table``, read from PostgREST's Content-Range header."""
+        request = urllib.request.Request(f"{self.api_url}/rest/v1/{table}?select=id", method="HEAD", headers={
+            "apikey": self.service_key,
+            "Authorization": f"Bearer {self.service_key}",
+            "Prefer": "count=exact",
+        })
+        with urllib.request.urlopen(request) as response:
+            return int(response.headers["Content-Range"].rsplit("/", 1)[1])
+
+    def delete_all(self, table):
+        """Remove every row from ``table``; child rows go with it through ``on delete cascade``."""
+        self._request("DELETE", f"/rest/v1/{table}?id=not.is.null")
+
+    def users(self, count, role="freelancer"):
+        """Create ``count`` confirmed users and return their ids.
+
+        Auth users can only be created one at a time through the admin API; the
+        profiles the signup trigger creates are then completed in one request.
+        """
+        ids = []
+        for _ in range(count):
+            tag = _uuid(self.rng)[:8]
+            email = f"seed-{tag}@example.com"
+            user = self._request("POST", "/auth/v1/admin/users", {
+                "email": email,
+                "password": SEED_PASSWORD,
+                "email_confirm": True,
+                "user_metadata": {"full_name": _words(self.rng, 2).title()},
+            })
+            ids.append(user["id"])
+            self.emails[user["id"]] = email
+        self.insert("profiles", [
+            {"id": user_id, "username": f"seed_{user_id[:8]}", "role": role}
+            for user_id in ids
+        ], upsert=True)
+        return ids
+
+    def delete_users(self, ids):
+        """Delete auth users; their profiles, and every row those own, go with them."""
+        for user_id in ids:
+            self._request("DELETE", f"/auth/v1/admin/users/{user_id}")
+
+    def gigs(self, count, freelancer_ids=None):
+        return self.insert("gigs", gig_rows(count, freelancer_ids or [LOGIN_USER_ID], self.rng))
+
+    def tickets(self, count, owner_ids=None):
+        return self.insert("tickets", ticket_rows(count, owner_ids or [LOGIN_USER_ID], self.rng))
+
+    def bids(self, per_ticket, ticket_ids, bidder_ids=None):
+        return self.insert("bids", bid_rows(per_ticket, ticket_ids, bidder_ids or [LOGIN_USER_ID], self.rng))
+
+    def ticket_comments(self, count, ticket_id, author_ids=None):
+        return self.insert("ticket_comments", ticket_comment_rows(count, ticket_id, author_ids or [LOGIN_USER_ID], self.rng))
+
+    def communities(self, count):
+        return self.insert("communities", community_rows(count, self.rng))
+
+    def posts(self, count, community_ids, author_ids=None):
+        return self.insert("posts", post_rows(count, community_ids, author_ids or [LOGIN_USER_ID], self.rng))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.seed", description=__doc__.splitlines()[0])
+    parser.add_argument("--freelancers", type=int, default=0, help="extra freelancer users to create")
+    parser.add_argument("--buyers", type=int, default=0, help="extra buyer users to create")
+    parser.add_argument("--gigs", type=int, default=0)
+    parser.add_argument("--tickets", type=int, default=0)
+    parser.add_argument("--bids", type=int, default=0, help="bids per seeded ticket")
+    parser.add_argument("--communities", type=int, default=0)
+    parser.add_argument("--posts", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0, help="random seed for generated rows")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    seeder = Seeder(seed=args.seed)
+
+    freelancers = [LOGIN_USER_ID] + seeder.users(args.freelancers, role="freelancer")
+    buyers = [LOGIN_USER_ID] + seeder.users(args.buyers, role="buyer")
+    gigs = seeder.gigs(args.gigs, freelancers)
+    tickets = seeder.tickets(args.tickets, buyers)
+    bids = seeder.bids(args.bids, [t["id"] for t in tickets], freelancers) if args.bids else []
+    communities = seeder.communities(max(args.communities, 1 if args.posts else 0))
+    posts = seeder.posts(args.posts, [c["id"] for c in communities]) if args.posts else []
+
+    print(
+        f"Seeded {len(freelancers) + len(buyers) - 2} users, {len(gigs)} gigs, {len(tickets)} tickets, "
+        f"{len(bids)} bids, {len(communities)} communities, {len(posts)} posts"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
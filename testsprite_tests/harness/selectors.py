@@ -0,0 +1,177 @@
+"""Locator instrumentation and the one-time XPath migration for TC scripts.
+
+Every click and fill in ``harness.steps`` reports how long its locator took to
+resolve. Resolutions slower than ``SLOW_LOCATOR_MS`` are passed to each
+callable in ``slow_locator_hooks`` (by default, a warning on stderr).
+
+With ``HARNESS_RECORD_SELECTORS=1`` set, each absolute ``xpath=`` locator the
+scripts resolve is also described by its test id, label, role and name, and a
+semantic replacement is appended to ``tmp/selector_migration.jsonl``. Then::
+
+    python -m harness.selectors migrate          # show proposed rewrites
+    python -m harness.selectors migrate --write  # apply them to the TC files
+
+Locators with no stable semantic handle are left as XPaths.
+"""
+
+import argparse
+import inspect
+import json
+import os
+import re
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from harness.config import SUITE_DIR, TMP_DIR
+
+SLOW_LOCATOR_MS = 1000
+MIGRATION_PATH = TMP_DIR / "selector_migration.jsonl"
+RECORDING = os.environ.get("HARNESS_RECORD_SELECTORS") == "1"
+
+XPATH_LOCATOR = re.compile(r"frame\.locator\('xpath=([^']*)'\)")
+
+_DESCRIBE = """
+(el) => {
+    const tag = el.tagName.toLowerCase();
+    const labels = el.labels ? Array.from(el.labels).map((l) => l.innerText.trim()).filter(Boolean) : [];
+    const implicitRole = { a: el.hasAttribute("href") ? "link" : null, button: "button" }[tag] || null;
+    return {
+        testid: el.getAttribute("data-testid"),
+        label: labels[0] || el.getAttribute("aria-label"),
+        placeholder: el.getAttribute("placeholder"),
+        role: el.getAttribute("role") || implicitRole,
+        text: (el.innerText || "").trim(),
+    };
+}
+"""
+
+
+def _warn_slow(locator, elapsed_ms, source):
+    where = f" at {source[0].name}:{source[1]}" if source else ""
+    print(f"slow locator ({elapsed_ms:.0f} ms){where}: {locator}", file=sys.stderr, flush=True)
+
+
+slow_locator_hooks = [_warn_slow]
+
+
+def _test_source():
+    """``(path, line)`` of the TC script statement that triggered the current step."""
+    frame = inspect.currentframe()
+    while frame is not None:
+        path = Path(frame.f_code.co_filename)
+        if path.parent == SUITE_DIR and path.name.startswith("TC"):
+            return path, frame.f_lineno
+        frame = frame.f_back
+    return None
+
+
+def suggest(description):
+    """Return a semantic locator expression for a described element, or None."""
+    if description["testid"]:
+        return f"frame.get_by_test_id({description['testid']!r})"
+    if description["label"]:
+        return f"frame.get_by_label({description['label']!r}, exact=True)"
+    text = description["text"]
+    if description["role"] and text and "\n" not in text and len(text) <= 40:
+        return f"frame.get_by_role({description['role']!r}, name={text!r}, exact=True)"
+    if description["placeholder"]:
+        return f"frame.get_by_placeholder({description['placeholder']!r}, exact=True)"
+    return None
+
+
+def _locator_line(path, step_line):
+    """Find the ``elem = frame.locator('xpath=...')`` line feeding the step at ``step_line``."""
+    lines = path.read_text().splitlines()
+    for lineno in range(step_line - 1, max(step_line - 6, 0), -1):
+        match = XPATH_LOCATOR.search(lines[lineno - 1])
+        if match:
+            return lineno, match.group(1)
+    return None, None
+
+
+async def _record(locator, source):
+    path, step_line = source
+    lineno, xpath = _locator_line(path, step_line)
+    if lineno is None:
+        return
+    replacement = suggest(await locator.evaluate(_DESCRIBE))
+    if replacement is None:
+        return
+    MIGRATION_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with MIGRATION_PATH.open("a", encoding="utf-8") as out:
+        out.write(json.dumps({
+            "file": path.name,
+            "line": lineno,
+            "xpath": xpath,
+            "replacement": replacement,
+        }) + "\n")
+
+
+async def observe(locator, elapsed):
+    """Called by ``harness.steps`` once ``locator`` has resolved, ``elapsed`` seconds after the step began."""
+    elapsed_ms = elapsed * 1000
+    slow = elapsed_ms > SLOW_LOCATOR_MS
+    if not (slow or RECORDING):
+        return
+    source = _test_source()
+    if slow:
+        for hook in slow_locator_hooks:
+            hook(locator, elapsed_ms, source)
+    if RECORDING and source:
+        await _record(locator, source)
+
+
+def load_migrations(path=MIGRATION_PATH):
+    """Recorded rewrites grouped by file; lines with conflicting suggestions are dropped."""
+    proposals = defaultdict(lambda: defaultdict(set))
+    xpaths = {}
+    for line in path.read_text().splitlines():
+        record = json.loads(line)
+        proposals[record["file"]][record["line"]].add(record["replacement"])
+        xpaths[record["file"], record["line"]] = record["xpath"]
+    return {
+        name: {
+            lineno: (xpaths[name, lineno], replacements.pop())
+            for lineno, replacements in lines.items()
+            if len(replacements) == 1
+        }
+        for name, lines in proposals.items()
+    }
+
+
+def migrate(write=False, path=MIGRATION_PATH):
+    for name, rewrites in sorted(load_migrations(path).items()):
+        script = SUITE_DIR / name
+        lines = script.read_text().splitlines(keepends=True)
+        changed = 0
+        for lineno, (xpath, replacement) in sorted(rewrites.items()):
+            old = f"frame.locator('xpath={xpath}')"
+            if old not in lines[lineno - 1]:
+                continue  # The script changed since the run was recorded.
+            lines[lineno - 1] = lines[lineno - 1].replace(old, replacement)
+            changed += 1
+            print(f"{name}:{lineno}: {xpath} -> {replacement}")
+        if write and changed:
+            script.write_text("".join(lines))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m harness.selectors", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate_cmd = sub.add_parser("migrate", help="rewrite recorded XPath locators to semantic selectors")
+    migrate_cmd.add_argument("--write", action="store_true", help="apply the rewrites instead of listing them")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not MIGRATION_PATH.exists():
+        print("Nothing recorded; run the suite with HARNESS_RECORD_SELECTORS=1 first.", file=sys.stderr)
+        return 1
+    migrate(write=args.write)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
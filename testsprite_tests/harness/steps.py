@@ -0,0 +1,81 @@
+"""Event-driven step helpers for the TC scripts.
+
+The generated scripts used to sleep a fixed ``FIXED_STEP_DELAY_S`` before
+every click and fill. These helpers wait on actual readiness signals instead:
+locator visibility and actionability before the action, and navigation plus
+network idle after a click. How long each wait really took is recorded so the
+runner can report the time saved against the old fixed delay, and each
+locator's resolution time goes to ``harness.selectors`` for slow-locator
+reporting.
+"""
+
+import contextvars
+import time
+from dataclasses import dataclass
+
+from playwright import async_api
+
+from harness import selectors
+
+# The per-step sleep the generated scripts used before every action.
+FIXED_STEP_DELAY_S = 3.0
+
+ACTION_TIMEOUT_MS = 5000
+# Upper bound on waiting for the network to go quiet after a click. Pages that
+# keep polling never reach idle; the step then proceeds once this expires.
+SETTLE_TIMEOUT_MS = 2000
+
+
+@dataclass
+class StepTimings:
+    steps: int = 0
+    waited: float = 0.0
+
+    @property
+    def fixed_delay(self):
+        return self.steps * FIXED_STEP_DELAY_S
+
+    @property
+    def saved(self):
+        return self.fixed_delay - self.waited
+
+
+# Timings for the test currently running; bound per test by harness.runner.
+step_timings: contextvars.ContextVar = contextvars.ContextVar("step_timings", default=None)
+
+
+def _record(started, step=True):
+    timings = step_timings.get()
+    if timings is not None:
+        timings.steps += step
+        timings.waited += time.perf_counter() - started
+
+
+async def settle(page, timeout=SETTLE_TIMEOUT_MS):
+    """Wait for any pending navigation to load and the network to go idle."""
+    started = time.perf_counter()
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except async_api.Error:
+        pass
+    _record(started, step=False)
+
+
+async def click(locator, timeout=ACTION_TIMEOUT_MS):
+    """Click once the element is visible and actionable, then let the page settle."""
+    started = time.perf_counter()
+    await locator.wait_for(state="visible", timeout=timeout)
+    _record(started)
+    await selectors.observe(locator, time.perf_counter() - started)
+    await locator.click(timeout=timeout)
+    await settle(locator.page)
+
+
+async def fill(locator, value, timeout=ACTION_TIMEOUT_MS):
+    """Fill once the element is visible and editable."""
+    started = time.perf_counter()
+    await locator.wait_for(state="visible", timeout=timeout)
+    _record(started)
+    await selectors.observe(locator, time.perf_counter() - started)
+    await locator.fill(value, timeout=timeout)